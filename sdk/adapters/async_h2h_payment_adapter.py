@@ -0,0 +1,82 @@
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.request_context import RequestContext
+from sdk.models.request_route import RequestRoute
+from sdk.models.requests.h2h.h2h_payment_recurrent_initial import H2HPaymentRecurrentInitial
+from sdk.models.requests.h2h.h2h_payment_recurrent_successive import H2HPaymentRecurrentSuccessive
+from sdk.models.requests.h2h.h2h_pre_authorization import H2HPreAuthorization
+from sdk.models.requests.h2h.h2h_pre_authorization_capture import H2HPreAuthorizationCapture
+from sdk.models.requests.h2h.h2h_redirection import H2HRedirection
+from sdk.models.requests.h2h.h2h_refund import H2HRefund
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.responses.payment_response import PaymentResponse
+from sdk.models.retry_policy import RetryPolicy
+from sdk.utils.request_routes import RequestRoutes
+
+
+class AsyncH2HPaymentAdapter:
+
+    def __init__(self, credentials: Credentials = None, network_adapter: AsyncNetworkAdapter = None,
+                 retry_policy: RetryPolicy = None, pipeline: RequestPipeline = None):
+        self.__credentials = credentials
+        self.__pipeline = pipeline if pipeline is not None else RequestPipeline()
+        if network_adapter is not None or self.__pipeline.get_network_adapter() is None:
+            self.__pipeline.set_network_adapter(
+                network_adapter if network_adapter is not None else AsyncNetworkAdapter.get_shared_instance()
+            )
+        if retry_policy is not None:
+            self.__pipeline.set_retry_policy(retry_policy)
+
+    def set_credentials(self, credentials: Credentials):
+        self.__credentials = credentials
+
+    def set_network_adapter(self, network_adapter: AsyncNetworkAdapter):
+        self.__pipeline.set_network_adapter(network_adapter)
+
+    def get_network_adapter(self) -> AsyncNetworkAdapter:
+        return self.__pipeline.get_network_adapter()
+
+    def set_retry_policy(self, retry_policy: RetryPolicy):
+        self.__pipeline.set_retry_policy(retry_policy)
+
+    def get_retry_policy(self) -> RetryPolicy:
+        return self.__pipeline.get_retry_policy()
+
+    def get_pipeline(self) -> RequestPipeline:
+        return self.__pipeline
+
+    async def send_h2h_payment_request(
+            self, h2h_redirection: H2HRedirection, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(h2h_redirection, RequestRoutes.H2H_PAYMENT, deadline)
+
+    async def send_h2h_pre_authorization_request(
+            self, h2h_pre_authorization: H2HPreAuthorization, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(h2h_pre_authorization, RequestRoutes.H2H_PAYMENT, deadline)
+
+    async def send_h2h_pre_authorization_capture(
+        self, h2h_pre_authorization_capture: H2HPreAuthorizationCapture, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(h2h_pre_authorization_capture, RequestRoutes.CAPTURE, deadline)
+
+    async def send_h2h_payment_recurrent_initial(
+        self, h2h_payment_recurrent_initial: H2HPaymentRecurrentInitial, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(h2h_payment_recurrent_initial, RequestRoutes.H2H_PAYMENT, deadline)
+
+    async def send_h2h_payment_recurrent_successive(
+        self, h2h_payment_recurrent_successive: H2HPaymentRecurrentSuccessive, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(h2h_payment_recurrent_successive, RequestRoutes.H2H_PAYMENT, deadline)
+
+    async def send_h2h_void_request(self, h2h_void: H2HVoid, deadline: Deadline = None) -> PaymentResponse:
+        return await self.__send(h2h_void, RequestRoutes.VOID, deadline)
+
+    async def send_h2h_refund_request(self, h2h_refund: H2HRefund, deadline: Deadline = None) -> PaymentResponse:
+        return await self.__send(h2h_refund, RequestRoutes.REFUND, deadline)
+
+    async def __send(self, request, route: RequestRoute, deadline: Deadline = None) -> PaymentResponse:
+        return await self.__pipeline.execute_async(RequestContext(request, self.__credentials, route, deadline))
@@ -0,0 +1,68 @@
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.request_context import RequestContext
+from sdk.models.request_route import RequestRoute
+from sdk.models.requests.quix_hosted.hosted_quix_accommodation import HostedQuixAccommodation
+from sdk.models.requests.quix_hosted.hosted_quix_flight import HostedQuixFlight
+from sdk.models.requests.quix_hosted.hosted_quix_item import HostedQuixItem
+from sdk.models.requests.quix_hosted.hosted_quix_service import HostedQuixService
+from sdk.models.responses.payment_response import PaymentResponse
+from sdk.models.retry_policy import RetryPolicy
+from sdk.utils.request_routes import RequestRoutes
+
+
+class AsyncHostedQuixPaymentAdapter:
+
+    def __init__(self, credentials: Credentials = None, network_adapter: AsyncNetworkAdapter = None,
+                 retry_policy: RetryPolicy = None, pipeline: RequestPipeline = None):
+        self.__credentials = credentials
+        self.__pipeline = pipeline if pipeline is not None else RequestPipeline()
+        if network_adapter is not None or self.__pipeline.get_network_adapter() is None:
+            self.__pipeline.set_network_adapter(
+                network_adapter if network_adapter is not None else AsyncNetworkAdapter.get_shared_instance()
+            )
+        if retry_policy is not None:
+            self.__pipeline.set_retry_policy(retry_policy)
+
+    def set_credentials(self, credentials: Credentials):
+        self.__credentials = credentials
+
+    def set_network_adapter(self, network_adapter: AsyncNetworkAdapter):
+        self.__pipeline.set_network_adapter(network_adapter)
+
+    def get_network_adapter(self) -> AsyncNetworkAdapter:
+        return self.__pipeline.get_network_adapter()
+
+    def set_retry_policy(self, retry_policy: RetryPolicy):
+        self.__pipeline.set_retry_policy(retry_policy)
+
+    def get_retry_policy(self) -> RetryPolicy:
+        return self.__pipeline.get_retry_policy()
+
+    def get_pipeline(self) -> RequestPipeline:
+        return self.__pipeline
+
+    async def send_hosted_quix_service_request(
+            self, hosted_quix_service: HostedQuixService, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(hosted_quix_service, RequestRoutes.HOSTED_QUIX, deadline)
+
+    async def send_hosted_quix_flight_request(
+            self, hosted_quix_flight: HostedQuixFlight, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(hosted_quix_flight, RequestRoutes.HOSTED_QUIX, deadline)
+
+    async def send_hosted_quix_accommodation_request(
+            self, hosted_quix_accommodation: HostedQuixAccommodation, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(hosted_quix_accommodation, RequestRoutes.HOSTED_QUIX, deadline)
+
+    async def send_hosted_quix_item_request(
+            self, hosted_quix_item: HostedQuixItem, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(hosted_quix_item, RequestRoutes.HOSTED_QUIX, deadline)
+
+    async def __send(self, request, route: RequestRoute, deadline: Deadline = None) -> PaymentResponse:
+        return await self.__pipeline.execute_async(RequestContext(request, self.__credentials, route, deadline))
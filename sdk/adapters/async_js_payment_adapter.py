@@ -0,0 +1,63 @@
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.request_context import RequestContext
+from sdk.models.request_route import RequestRoute
+from sdk.models.requests.js.js_authorization_request import JSAuthorizationRequest
+from sdk.models.requests.js.js_charge import JSCharge
+from sdk.models.requests.js.js_payment_recurrent_initial import JSPaymentRecurrentInitial
+from sdk.models.responses.js_authorization_response import JSAuthorizationResponse
+from sdk.models.responses.payment_response import PaymentResponse
+from sdk.models.retry_policy import RetryPolicy
+from sdk.utils.request_routes import RequestRoutes
+
+
+class AsyncJSPaymentAdapter:
+
+    def __init__(self, credentials: Credentials = None, network_adapter: AsyncNetworkAdapter = None,
+                 retry_policy: RetryPolicy = None, pipeline: RequestPipeline = None):
+        self.__credentials = credentials
+        self.__pipeline = pipeline if pipeline is not None else RequestPipeline()
+        if network_adapter is not None or self.__pipeline.get_network_adapter() is None:
+            self.__pipeline.set_network_adapter(
+                network_adapter if network_adapter is not None else AsyncNetworkAdapter.get_shared_instance()
+            )
+        if retry_policy is not None:
+            self.__pipeline.set_retry_policy(retry_policy)
+
+    def set_credentials(self, credentials: Credentials):
+        self.__credentials = credentials
+
+    def set_network_adapter(self, network_adapter: AsyncNetworkAdapter):
+        self.__pipeline.set_network_adapter(network_adapter)
+
+    def get_network_adapter(self) -> AsyncNetworkAdapter:
+        return self.__pipeline.get_network_adapter()
+
+    def set_retry_policy(self, retry_policy: RetryPolicy):
+        self.__pipeline.set_retry_policy(retry_policy)
+
+    def get_retry_policy(self) -> RetryPolicy:
+        return self.__pipeline.get_retry_policy()
+
+    def get_pipeline(self) -> RequestPipeline:
+        return self.__pipeline
+
+    async def send_js_authorization_request(
+            self, js_authorization_request: JSAuthorizationRequest, deadline: Deadline = None
+    ) -> JSAuthorizationResponse:
+        return await self.__pipeline.execute_async(
+            RequestContext(js_authorization_request, self.__credentials, RequestRoutes.JS_AUTHORIZATION, deadline)
+        )
+
+    async def send_js_charge_request(self, js_charge: JSCharge, deadline: Deadline = None) -> PaymentResponse:
+        return await self.__send(js_charge, RequestRoutes.JS_CHARGE, deadline)
+
+    async def send_js_payment_recurrent_initial(
+            self, js_payment_recurrent_initial: JSPaymentRecurrentInitial, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(js_payment_recurrent_initial, RequestRoutes.JS_CHARGE, deadline)
+
+    async def __send(self, request, route: RequestRoute, deadline: Deadline = None) -> PaymentResponse:
+        return await self.__pipeline.execute_async(RequestContext(request, self.__credentials, route, deadline))
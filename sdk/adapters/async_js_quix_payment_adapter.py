@@ -0,0 +1,66 @@
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.request_context import RequestContext
+from sdk.models.request_route import RequestRoute
+from sdk.models.requests.quix_js.js_quix_accommodation import JSQuixAccommodation
+from sdk.models.requests.quix_js.js_quix_flight import JSQuixFlight
+from sdk.models.requests.quix_js.js_quix_item import JSQuixItem
+from sdk.models.requests.quix_js.js_quix_service import JSQuixService
+from sdk.models.responses.payment_response import PaymentResponse
+from sdk.models.retry_policy import RetryPolicy
+from sdk.utils.request_routes import RequestRoutes
+
+
+class AsyncJSQuixPaymentAdapter:
+
+    def __init__(self, credentials: Credentials = None, network_adapter: AsyncNetworkAdapter = None,
+                 retry_policy: RetryPolicy = None, pipeline: RequestPipeline = None):
+        self.__credentials = credentials
+        self.__pipeline = pipeline if pipeline is not None else RequestPipeline()
+        if network_adapter is not None or self.__pipeline.get_network_adapter() is None:
+            self.__pipeline.set_network_adapter(
+                network_adapter if network_adapter is not None else AsyncNetworkAdapter.get_shared_instance()
+            )
+        if retry_policy is not None:
+            self.__pipeline.set_retry_policy(retry_policy)
+
+    def set_credentials(self, credentials: Credentials):
+        self.__credentials = credentials
+
+    def set_network_adapter(self, network_adapter: AsyncNetworkAdapter):
+        self.__pipeline.set_network_adapter(network_adapter)
+
+    def get_network_adapter(self) -> AsyncNetworkAdapter:
+        return self.__pipeline.get_network_adapter()
+
+    def set_retry_policy(self, retry_policy: RetryPolicy):
+        self.__pipeline.set_retry_policy(retry_policy)
+
+    def get_retry_policy(self) -> RetryPolicy:
+        return self.__pipeline.get_retry_policy()
+
+    def get_pipeline(self) -> RequestPipeline:
+        return self.__pipeline
+
+    async def send_js_quix_service_request(
+            self, js_quix_service: JSQuixService, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(js_quix_service, RequestRoutes.JS_QUIX, deadline)
+
+    async def send_js_quix_flight_request(
+            self, js_quix_flight: JSQuixFlight, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(js_quix_flight, RequestRoutes.JS_QUIX, deadline)
+
+    async def send_js_quix_accommodation_request(
+            self, js_quix_accommodation: JSQuixAccommodation, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return await self.__send(js_quix_accommodation, RequestRoutes.JS_QUIX_ACCOMMODATION, deadline)
+
+    async def send_js_quix_item_request(self, js_quix_item: JSQuixItem, deadline: Deadline = None) -> PaymentResponse:
+        return await self.__send(js_quix_item, RequestRoutes.JS_QUIX, deadline)
+
+    async def __send(self, request, route: RequestRoute, deadline: Deadline = None) -> PaymentResponse:
+        return await self.__pipeline.execute_async(RequestContext(request, self.__credentials, route, deadline))
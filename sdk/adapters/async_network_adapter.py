@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+from typing import Tuple, Optional
+
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.error import Error
+from sdk.models.circuit_breaker import CircuitBreaker
+from sdk.models.deadline import Deadline
+from sdk.models.timeout_config import TimeoutConfig
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncNetworkAdapter:
+    DEFAULT_LIMIT: int = 1000
+    DEFAULT_LIMIT_PER_HOST: int = 0
+    DEFAULT_KEEPALIVE_TIMEOUT: float = 30.0
+
+    __shared_instance = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, limit: int = DEFAULT_LIMIT, limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+                 keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT, timeout_config: TimeoutConfig = None,
+                 circuit_breaker: CircuitBreaker = None):
+        # limit caps the connections open at once, limit_per_host caps them per host (0 means no per-host cap).
+        self.__limit = limit
+        self.__limit_per_host = limit_per_host
+        self.__keepalive_timeout = keepalive_timeout
+        self.__timeout_config = timeout_config if timeout_config is not None else TimeoutConfig()
+        self.__circuit_breaker = circuit_breaker
+        self.__session = None
+        self.__session_loop = None
+
+    @staticmethod
+    def get_shared_instance() -> 'AsyncNetworkAdapter':
+        if AsyncNetworkAdapter.__shared_instance is None:
+            with AsyncNetworkAdapter.__shared_lock:
+                if AsyncNetworkAdapter.__shared_instance is None:
+                    AsyncNetworkAdapter.__shared_instance = AsyncNetworkAdapter()
+        return AsyncNetworkAdapter.__shared_instance
+
+    @staticmethod
+    def set_shared_instance(network_adapter: 'AsyncNetworkAdapter'):
+        with AsyncNetworkAdapter.__shared_lock:
+            AsyncNetworkAdapter.__shared_instance = network_adapter
+
+    def get_limit(self) -> int:
+        return self.__limit
+
+    def get_limit_per_host(self) -> int:
+        return self.__limit_per_host
+
+    def get_timeout_config(self) -> TimeoutConfig:
+        return self.__timeout_config
+
+    def set_timeout_config(self, timeout_config: TimeoutConfig):
+        self.__timeout_config = timeout_config
+
+    def get_circuit_breaker(self) -> CircuitBreaker:
+        return self.__circuit_breaker
+
+    def set_circuit_breaker(self, circuit_breaker: CircuitBreaker):
+        self.__circuit_breaker = circuit_breaker
+
+    def __get_session(self):
+        if aiohttp is None:
+            raise ImportError("aiohttp is required by AsyncNetworkAdapter, install it with "
+                              "'pip install cgp-payment-sdk[async]'")
+        loop = asyncio.get_running_loop()
+        if self.__session is None or self.__session.closed or self.__session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.__limit,
+                limit_per_host=self.__limit_per_host,
+                keepalive_timeout=self.__keepalive_timeout
+            )
+            self.__session = aiohttp.ClientSession(connector=connector)
+            self.__session_loop = loop
+        return self.__session
+
+    async def send_request(self, headers, query_parameters, json, url,
+                           deadline: Deadline = None, body: bytes = None) -> Tuple[any, Optional[str]]:
+        # body is an already encoded request body, sent as is instead of json.
+        connect_timeout, read_timeout = self.__timeout_config.get_timeout_by_url(url)
+        total_timeout = None
+        if deadline is not None:
+            if deadline.is_expired():
+                return Error.DEADLINE_EXCEEDED, "Deadline exceeded before sending the request"
+            total_timeout = deadline.remaining()
+
+        session = self.__get_session()
+        timeout = aiohttp.ClientTimeout(total=total_timeout, sock_connect=connect_timeout, sock_read=read_timeout)
+        endpoint = Endpoints.get_by_url(url)
+        if self.__circuit_breaker is None or endpoint is None:
+            return await self.__post(session, headers, query_parameters, json, body, url, timeout, deadline)
+        if not self.__circuit_breaker.allow_request(endpoint):
+            return Error.CIRCUIT_OPEN, f"Circuit open for {endpoint.name}"
+
+        start = time.monotonic()
+        response = (Error.NETWORK_ERROR, None)
+        try:
+            response = await self.__post(session, headers, query_parameters, json, body, url, timeout, deadline)
+            return response
+        finally:
+            self.__circuit_breaker.record_response(endpoint, response, time.monotonic() - start)
+
+    @staticmethod
+    async def __post(session, headers, query_parameters, json, body: bytes, url, timeout,
+                     deadline: Deadline = None) -> Tuple[any, Optional[str]]:
+        try:
+            async with session.post(url, headers=headers, params=query_parameters, json=json, data=body,
+                                    timeout=timeout) as response:
+                return response.status, await response.text()
+        except asyncio.TimeoutError as e:
+            if deadline is not None and deadline.is_expired():
+                return Error.DEADLINE_EXCEEDED, str(e)
+            print("A Network timeout occurred while sending the request")
+            return AsyncNetworkAdapter.__get_error(e), str(e)
+        except aiohttp.ClientError as e:
+            print("A Network error occurred while sending the request")
+            return AsyncNetworkAdapter.__get_error(e), str(e)
+
+    @staticmethod
+    def __get_error(error: Exception) -> Error:
+        # Error.CONNECTION_ERROR when the request never left: the connection was refused, the host not resolved or
+        # the connect timeout passed (ConnectionTimeoutError, aiohttp 3.10+). Otherwise the gateway may have
+        # received it.
+        if isinstance(error, (aiohttp.ClientConnectorError, getattr(aiohttp, "ConnectionTimeoutError", ()))):
+            return Error.CONNECTION_ERROR
+        return Error.NETWORK_ERROR
+
+    async def close(self):
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+        self.__session_loop = None
@@ -0,0 +1,30 @@
+import time
+from typing import Optional, Tuple
+
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.models.cassette import Cassette
+from sdk.models.deadline import Deadline
+
+
+class AsyncRecordingNetworkAdapter(AsyncNetworkAdapter):
+    # Sends the requests through network_adapter and records each request/response pair in the cassette.
+
+    def __init__(self, cassette: Cassette, network_adapter: AsyncNetworkAdapter = None):
+        super().__init__()
+        self.__cassette = cassette
+        self.__network_adapter = network_adapter if network_adapter is not None else AsyncNetworkAdapter()
+
+    def get_cassette(self) -> Cassette:
+        return self.__cassette
+
+    async def send_request(self, headers, query_parameters, json, url,
+                           deadline: Deadline = None, body: bytes = None) -> Tuple[any, Optional[str]]:
+        kwargs = {"body": body} if body is not None else {}
+        start = time.perf_counter()
+        response = await self.__network_adapter.send_request(headers=headers, query_parameters=query_parameters,
+                                                             json=json, url=url, deadline=deadline, **kwargs)
+        self.__cassette.record(url, headers, query_parameters, json, body, response, time.perf_counter() - start)
+        return response
+
+    async def close(self):
+        await self.__network_adapter.close()
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Optional, Tuple
+
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.enums.error import Error
+from sdk.models.cassette import Cassette
+from sdk.models.deadline import Deadline
+
+
+class AsyncReplayNetworkAdapter(AsyncNetworkAdapter):
+    # Answers with the responses recorded in the cassette for the URL, in the recorded order, without network access.
+    # Each response waits its recorded latency times latency_scale: 1.0 replays the original timing, 0 none.
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0):
+        super().__init__()
+        self.__cassette = cassette
+        self.__latency_scale = latency_scale
+
+    def get_cassette(self) -> Cassette:
+        return self.__cassette
+
+    def get_latency_scale(self) -> float:
+        return self.__latency_scale
+
+    def set_latency_scale(self, latency_scale: float):
+        self.__latency_scale = latency_scale
+
+    async def send_request(self, headers, query_parameters, json, url,
+                           deadline: Deadline = None, body: bytes = None) -> Tuple[any, Optional[str]]:
+        # pylint: disable=unused-argument
+        interaction = self.__cassette.next_interaction(url)
+        if interaction is None:
+            return Error.NETWORK_ERROR, f"No recorded response for {url}"
+        delay = interaction["elapsed"] * self.__latency_scale
+        if deadline is not None:
+            if deadline.is_expired():
+                return Error.DEADLINE_EXCEEDED, "Deadline exceeded before sending the request"
+            if delay > deadline.remaining():
+                await asyncio.sleep(max(0.0, deadline.remaining()))
+                return Error.DEADLINE_EXCEEDED, "Deadline exceeded while waiting for the response"
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return Cassette.get_response(interaction)
@@ -0,0 +1,125 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Iterable, Iterator, Tuple
+
+import requests
+
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.enums.error import Error
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.exceptions.field_exception import FieldException, InvalidFieldException
+from sdk.models.deadline import Deadline
+from sdk.models.requests.h2h.h2h_payment_recurrent_initial import H2HPaymentRecurrentInitial
+from sdk.models.requests.h2h.h2h_payment_recurrent_successive import H2HPaymentRecurrentSuccessive
+from sdk.models.requests.h2h.h2h_pre_authorization import H2HPreAuthorization
+from sdk.models.requests.h2h.h2h_pre_authorization_capture import H2HPreAuthorizationCapture
+from sdk.models.requests.h2h.h2h_redirection import H2HRedirection
+from sdk.models.requests.h2h.h2h_refund import H2HRefund
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.responses.batch_result import BatchResult
+from sdk.models.responses.batch_summary import BatchSummary
+from sdk.models.responses.payment_response import PaymentResponse
+
+
+class H2HBatchAdapter:
+    DEFAULT_MAX_WORKERS: int = 16
+
+    __SEND_METHODS = {
+        H2HRedirection: H2HPaymentAdapter.send_h2h_payment_request,
+        H2HPreAuthorization: H2HPaymentAdapter.send_h2h_pre_authorization_request,
+        H2HPreAuthorizationCapture: H2HPaymentAdapter.send_h2h_pre_authorization_capture,
+        H2HPaymentRecurrentInitial: H2HPaymentAdapter.send_h2h_payment_recurrent_initial,
+        H2HPaymentRecurrentSuccessive: H2HPaymentAdapter.send_h2h_payment_recurrent_successive,
+        H2HVoid: H2HPaymentAdapter.send_h2h_void_request,
+        H2HRefund: H2HPaymentAdapter.send_h2h_refund_request,
+    }
+    # A worker thread sends one request at a time: __mark_sent records when the SEND stage of its request starts.
+    __sending = threading.local()
+
+    def __init__(self, h2h_payment_adapter: H2HPaymentAdapter, max_workers: int = DEFAULT_MAX_WORKERS,
+                 max_pending: int = None):
+        # max_workers caps the requests in flight, max_pending caps the requests read ahead from the
+        # iterable, so neither the input nor the results are ever fully held in memory.
+        if max_workers is None or max_workers < 1:
+            raise InvalidFieldException("maxWorkers: Should be (maxWorkers >= 1)")
+        if max_pending is not None and max_pending < max_workers:
+            raise InvalidFieldException("maxPending: Should be (maxPending >= maxWorkers)")
+        self.__h2h_payment_adapter = h2h_payment_adapter
+        self.__max_workers = max_workers
+        self.__max_pending = max_pending if max_pending is not None else 2 * max_workers
+        h2h_payment_adapter.get_pipeline().remove_middleware(H2HBatchAdapter.__mark_sent)
+        h2h_payment_adapter.get_pipeline().add_middleware(H2HBatchAdapter.__mark_sent, [PipelineStage.SEND])
+
+    def get_max_workers(self) -> int:
+        return self.__max_workers
+
+    def get_max_pending(self) -> int:
+        return self.__max_pending
+
+    def send_batch(self, requests: Iterable, deadline: Deadline = None) -> BatchResult:
+        summary = BatchSummary()
+        return BatchResult(self.__run(iter(requests), summary, deadline), summary)
+
+    def __run(self, requests: Iterator, summary: BatchSummary,
+              deadline: Deadline = None) -> Iterator[Tuple[any, PaymentResponse]]:
+        summary.start()
+        pending = {}
+        executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="h2h-batch")
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < self.__max_pending:
+                    try:
+                        request = next(requests)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[executor.submit(self.__send, request, deadline)] = request
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    request = pending.pop(future)
+                    response = future.result()
+                    summary.record(response)
+                    yield request, response
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            summary.finish()
+
+    def __send(self, request, deadline: Deadline = None) -> PaymentResponse:
+        send_method = H2HBatchAdapter.__SEND_METHODS.get(type(request))
+        H2HBatchAdapter.__sending.sent = False
+        try:
+            if send_method is None:
+                raise InvalidFieldException(f"request: {type(request).__name__} is not supported in a batch")
+            return send_method(self.__h2h_payment_adapter, request, deadline)
+        except FieldException as e:
+            return H2HBatchAdapter.__error_response(Error.MISSING_PARAMETER, e.message)
+        except Exception as e:
+            # Any other failure is returned with its exception, so the batch goes on. Only a transport failure is
+            # a network error: once the request was sent, the payment may have been made, and resending it could
+            # charge the customer twice.
+            if isinstance(e, (requests.exceptions.RequestException, OSError)):
+                error = Error.NETWORK_ERROR
+            else:
+                error = Error.INVALID_RESPONSE_RECEIVED if H2HBatchAdapter.__sending.sent else Error.CLIENT_ERROR
+            return H2HBatchAdapter.__error_response(error, f"{type(e).__name__}: {e}", e)
+
+    @staticmethod
+    def __mark_sent(_stage, _context, proceed):
+        H2HBatchAdapter.__sending.sent = True
+        return proceed()
+
+    @staticmethod
+    def __error_response(error: Error, message: str, exception: Exception = None) -> PaymentResponse:
+        result = PaymentResponse()
+        result.set_is_error(True)
+        result.set_error(error)
+        result.set_error_message(message)
+        result.set_exception(exception)
+        return result
@@ -1,180 +1,63 @@
-import json
-
 from sdk.adapters.network_adapter import NetworkAdapter
-from sdk.adapters.notification_adapter import parse_notification
-from sdk.enums.endpoints import Endpoints
-from sdk.enums.environment import Environment
-from sdk.enums.error import Error
-from sdk.enums.response_codes import ResponseCodes
-from sdk.exceptions.field_exception import MissingFieldException
+from sdk.adapters.request_pipeline import RequestPipeline
 from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.request_context import RequestContext
+from sdk.models.request_route import RequestRoute
 from sdk.models.requests.js.js_authorization_request import JSAuthorizationRequest
 from sdk.models.requests.js.js_charge import JSCharge
 from sdk.models.requests.js.js_payment_recurrent_initial import JSPaymentRecurrentInitial
 from sdk.models.responses.js_authorization_response import JSAuthorizationResponse
 from sdk.models.responses.payment_response import PaymentResponse
-from sdk.utils.custom_encoder import CustomEncoder
-from sdk.utils.general_utils import GeneralUtils
+from sdk.models.retry_policy import RetryPolicy
+from sdk.utils.request_routes import RequestRoutes
 
 
 class JSPaymentAdapter:
 
-    def __init__(self, credentials: Credentials = None):
+    def __init__(self, credentials: Credentials = None, network_adapter: NetworkAdapter = None,
+                 retry_policy: RetryPolicy = None, pipeline: RequestPipeline = None):
         self.__credentials = credentials
-        self.__network_adapter = NetworkAdapter()
+        self.__pipeline = pipeline if pipeline is not None else RequestPipeline()
+        if network_adapter is not None or self.__pipeline.get_network_adapter() is None:
+            self.__pipeline.set_network_adapter(
+                network_adapter if network_adapter is not None else NetworkAdapter.get_shared_instance()
+            )
+        if retry_policy is not None:
+            self.__pipeline.set_retry_policy(retry_policy)
 
     def set_credentials(self, credentials: Credentials):
         self.__credentials = credentials
 
-    def send_js_authorization_request(self,
-                                      js_authorization_request: JSAuthorizationRequest) -> JSAuthorizationResponse:
-        is_missing_cred = js_authorization_request.check_credentials(self.__credentials)
-        if is_missing_cred[0]:
-            raise MissingFieldException(is_missing_cred[1], True)
-
-        endpoint = Endpoints.AUTH_ENDPOINT_PROD.value \
-            if self.__credentials.get_environment() == Environment.PRODUCTION else \
-            Endpoints.AUTH_ENDPOINT_STG.value
-
-        js_authorization_request.set_credentials(self.__credentials)
-
-        is_missing_field = js_authorization_request.is_missing_field()
-        if is_missing_field[0]:
-            raise MissingFieldException(is_missing_field[1], False)
-
-        body = json.dumps(js_authorization_request, cls=CustomEncoder)
-
-        response = self.__network_adapter.send_request(
-            headers=None,
-            query_parameters=None,
-            json=json.loads(body),
-            url=endpoint
-        )
-
-        print(f"response = {response}")
-        result = JSAuthorizationResponse()
-        if isinstance(response[0], Error):
-            result.set_is_error(True)
-            result.set_error(response[0])
-            result.set_error_message(response[1])
-        else:
-            if ResponseCodes.is_success(response[0]):
-                result.set_is_error(False)
-                json_response = json.loads(response[1])
-                result.set_auth_token(json_response['authToken'])
-            else:
-                error_message = f"status code is {response[0]}" if response[1] is None or len(response[1]) else \
-                    response[1]
-                result.set_is_error(True)
-                result.set_error(
-                    Error.CLIENT_ERROR if ResponseCodes.is_client_error(response[0]) else Error.SERVER_ERROR)
-                result.set_error_message(error_message)
-
-        return result
-
-    def send_js_charge_request(self, js_charge: JSCharge) -> PaymentResponse:
-        is_missing_cred = js_charge.check_credentials(self.__credentials)
-        if is_missing_cred[0]:
-            raise MissingFieldException(is_missing_cred[1], True)
+    def set_network_adapter(self, network_adapter: NetworkAdapter):
+        self.__pipeline.set_network_adapter(network_adapter)
 
-        endpoint = Endpoints.CAPTURE_ENDPOINT_PROD.value \
-            if self.__credentials.get_environment() == Environment.PRODUCTION else \
-            Endpoints.CHARGE_ENDPOINT_STG.value
+    def get_network_adapter(self) -> NetworkAdapter:
+        return self.__pipeline.get_network_adapter()
 
-        js_charge.set_credentials(self.__credentials)
+    def set_retry_policy(self, retry_policy: RetryPolicy):
+        self.__pipeline.set_retry_policy(retry_policy)
 
-        is_missing_field = js_charge.is_missing_field()
-        if is_missing_field[0]:
-            raise MissingFieldException(is_missing_field[1], False)
+    def get_retry_policy(self) -> RetryPolicy:
+        return self.__pipeline.get_retry_policy()
 
-        body = json.dumps(js_charge, cls=CustomEncoder)
-        body_json = json.loads(body)
-        if "merchantParams" in body_json:
-            body_json["merchantParams"] = GeneralUtils.merchant_params_query(js_charge.get_merchant_params())
+    def get_pipeline(self) -> RequestPipeline:
+        return self.__pipeline
 
-        headers = {
-            "prepayToken": js_charge.get_prepay_token(),
-            "apiVersion": str(js_charge.get_api_version())
-        }
-
-        response = self.__network_adapter.send_request(
-            headers=headers,
-            query_parameters=None,
-            json=body_json,
-            url=endpoint
+    def send_js_authorization_request(
+            self, js_authorization_request: JSAuthorizationRequest, deadline: Deadline = None
+    ) -> JSAuthorizationResponse:
+        return self.__pipeline.execute(
+            RequestContext(js_authorization_request, self.__credentials, RequestRoutes.JS_AUTHORIZATION, deadline)
         )
 
-        result = PaymentResponse()
-        if isinstance(response[0], Error):
-            result.set_is_error(True)
-            result.set_error(response[0])
-            result.set_error_message(response[1])
-        else:
-            if ResponseCodes.is_success(response[0]):
-                result.set_is_error(False)
-                result.set_raw_response(response[1])
-                result.set_notification(parse_notification(response[1]))
-            else:
-                error_message = f"status code is {response[0]}" if response[1] is None or len(response[1]) else \
-                    response[1]
-                result.set_is_error(True)
-                result.set_error(
-                    Error.CLIENT_ERROR if ResponseCodes.is_client_error(response[0]) else Error.SERVER_ERROR)
-                result.set_error_message(error_message)
-
-        return result
-
-    def send_js_payment_recurrent_initial(self,
-                                          js_payment_recurrent_initial: JSPaymentRecurrentInitial) -> PaymentResponse:
-        is_missing_cred = js_payment_recurrent_initial.check_credentials(self.__credentials)
-        if is_missing_cred[0]:
-            raise MissingFieldException(is_missing_cred[1], True)
-
-        endpoint = Endpoints.CAPTURE_ENDPOINT_PROD.value \
-            if self.__credentials.get_environment() == Environment.PRODUCTION else \
-            Endpoints.CHARGE_ENDPOINT_STG.value
-
-        js_payment_recurrent_initial.set_credentials(self.__credentials)
-
-        is_missing_field = js_payment_recurrent_initial.is_missing_field()
-        if is_missing_field[0]:
-            raise MissingFieldException(is_missing_field[1], False)
-
-        body = json.dumps(js_payment_recurrent_initial, cls=CustomEncoder)
-        body_json = json.loads(body)
-        if "merchantParams" in body_json:
-            body_json["merchantParams"] = GeneralUtils.merchant_params_query(
-                js_payment_recurrent_initial.get_merchant_params()
-            )
-
-        headers = {
-            "prepayToken": js_payment_recurrent_initial.get_prepay_token(),
-            "apiVersion": str(js_payment_recurrent_initial.get_api_version())
-        }
-
-        response = self.__network_adapter.send_request(
-            headers=headers,
-            query_parameters=None,
-            json=body_json,
-            url=endpoint
-        )
+    def send_js_charge_request(self, js_charge: JSCharge, deadline: Deadline = None) -> PaymentResponse:
+        return self.__send(js_charge, RequestRoutes.JS_CHARGE, deadline)
 
-        result = PaymentResponse()
-        if isinstance(response[0], Error):
-            result.set_is_error(True)
-            result.set_error(response[0])
-            result.set_error_message(response[1])
-        else:
-            if ResponseCodes.is_success(response[0]):
-                result.set_is_error(False)
-                result.set_raw_response(response[1])
-                result.set_notification(parse_notification(response[1]))
-            else:
-                error_message = f"status code is {response[0]}" if response[1] is None or len(response[1]) else \
-                    response[1]
-                result.set_is_error(True)
-                result.set_error(
-                    Error.CLIENT_ERROR if ResponseCodes.is_client_error(response[0]) else Error.SERVER_ERROR)
-                result.set_error_message(error_message)
+    def send_js_payment_recurrent_initial(
+            self, js_payment_recurrent_initial: JSPaymentRecurrentInitial, deadline: Deadline = None
+    ) -> PaymentResponse:
+        return self.__send(js_payment_recurrent_initial, RequestRoutes.JS_CHARGE, deadline)
 
-        return result
+    def __send(self, request, route: RequestRoute, deadline: Deadline = None) -> PaymentResponse:
+        return self.__pipeline.execute(RequestContext(request, self.__credentials, route, deadline))
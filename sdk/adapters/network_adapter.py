@@ -1,16 +1,135 @@
+import threading
+import time
 from typing import Tuple, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
+from sdk.enums.endpoints import Endpoints
 from sdk.enums.error import Error
+from sdk.models.circuit_breaker import CircuitBreaker
+from sdk.models.deadline import Deadline
+from sdk.models.timeout_config import TimeoutConfig
 
 
 class NetworkAdapter:
+    DEFAULT_POOL_CONNECTIONS: int = 10
+    DEFAULT_POOL_MAXSIZE: int = 20
 
-    def send_request(self, headers, query_parameters, json, url) -> Tuple[any, Optional[str]]:
+    __shared_instance = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False, timeout_config: TimeoutConfig = None,
+                 circuit_breaker: CircuitBreaker = None):
+        # pool_connections is the number of per-host pools kept alive, pool_maxsize the number of
+        # keep-alive connections per host and pool_block caps the concurrent connections per host.
+        self.__pool_connections = pool_connections
+        self.__pool_maxsize = pool_maxsize
+        self.__pool_block = pool_block
+        self.__timeout_config = timeout_config if timeout_config is not None else TimeoutConfig()
+        self.__circuit_breaker = circuit_breaker
+        # The session is opened on the first request, so the adapters wrapping another one never open theirs.
+        self.__session = None
+        self.__session_lock = threading.Lock()
+
+    @staticmethod
+    def get_shared_instance() -> 'NetworkAdapter':
+        if NetworkAdapter.__shared_instance is None:
+            with NetworkAdapter.__shared_lock:
+                if NetworkAdapter.__shared_instance is None:
+                    NetworkAdapter.__shared_instance = NetworkAdapter()
+        return NetworkAdapter.__shared_instance
+
+    @staticmethod
+    def set_shared_instance(network_adapter: 'NetworkAdapter'):
+        with NetworkAdapter.__shared_lock:
+            NetworkAdapter.__shared_instance = network_adapter
+
+    def get_pool_connections(self) -> int:
+        return self.__pool_connections
+
+    def get_pool_maxsize(self) -> int:
+        return self.__pool_maxsize
+
+    def get_pool_block(self) -> bool:
+        return self.__pool_block
+
+    def get_timeout_config(self) -> TimeoutConfig:
+        return self.__timeout_config
+
+    def set_timeout_config(self, timeout_config: TimeoutConfig):
+        self.__timeout_config = timeout_config
+
+    def get_circuit_breaker(self) -> CircuitBreaker:
+        return self.__circuit_breaker
+
+    def set_circuit_breaker(self, circuit_breaker: CircuitBreaker):
+        self.__circuit_breaker = circuit_breaker
+
+    def get_session(self) -> requests.Session:
+        if self.__session is None:
+            with self.__session_lock:
+                if self.__session is None:
+                    session = requests.Session()
+                    http_adapter = HTTPAdapter(pool_connections=self.__pool_connections,
+                                               pool_maxsize=self.__pool_maxsize, pool_block=self.__pool_block)
+                    session.mount("https://", http_adapter)
+                    session.mount("http://", http_adapter)
+                    self.__session = session
+        return self.__session
+
+    def send_request(self, headers, query_parameters, json, url,
+                     deadline: Deadline = None, body: bytes = None) -> Tuple[any, Optional[str]]:
+        # body is an already encoded request body, sent as is instead of json.
+        connect_timeout, read_timeout = self.__timeout_config.get_timeout_by_url(url)
+        if deadline is not None:
+            if deadline.is_expired():
+                return Error.DEADLINE_EXCEEDED, "Deadline exceeded before sending the request"
+            remaining = deadline.remaining()
+            connect_timeout = min(connect_timeout, remaining)
+            read_timeout = min(read_timeout, remaining)
+
+        endpoint = Endpoints.get_by_url(url)
+        if self.__circuit_breaker is None or endpoint is None:
+            return self.__post(headers, query_parameters, json, body, url, (connect_timeout, read_timeout), deadline)
+        if not self.__circuit_breaker.allow_request(endpoint):
+            return Error.CIRCUIT_OPEN, f"Circuit open for {endpoint.name}"
+
+        start = time.monotonic()
+        response = (Error.NETWORK_ERROR, None)
         try:
-            response = requests.post(url, headers=headers, params=query_parameters, json=json)
+            response = self.__post(headers, query_parameters, json, body, url, (connect_timeout, read_timeout),
+                                   deadline)
+            return response
+        finally:
+            self.__circuit_breaker.record_response(endpoint, response, time.monotonic() - start)
+
+    def __post(self, headers, query_parameters, json, body: bytes, url, timeout: Tuple[float, float],
+               deadline: Deadline = None) -> Tuple[any, Optional[str]]:
+        try:
+            response = self.get_session().post(url, headers=headers, params=query_parameters, json=json,
+                                               data=body, timeout=timeout)
             return response.status_code, response.text
+        except requests.exceptions.Timeout as e:
+            if deadline is not None and deadline.is_expired():
+                return Error.DEADLINE_EXCEEDED, str(e)
+            print("A Network timeout occurred while sending the request")
+            return NetworkAdapter.__get_error(e), str(e)
         except requests.exceptions.RequestException as e:
             print("A Network error occurred while sending the request")
-            return Error.NETWORK_ERROR, str(e)
+            return NetworkAdapter.__get_error(e), str(e)
+
+    @staticmethod
+    def __get_error(error: requests.exceptions.RequestException) -> Error:
+        # Error.CONNECTION_ERROR when the request never left: the connection was refused, the host not resolved or
+        # the connect timeout passed. Otherwise the gateway may have received it.
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        if isinstance(error, requests.exceptions.ConnectTimeout) or isinstance(reason, NewConnectionError):
+            return Error.CONNECTION_ERROR
+        return Error.NETWORK_ERROR
+
+    def close(self):
+        if self.__session is not None:
+            self.__session.close()
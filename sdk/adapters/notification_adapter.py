@@ -1,125 +1,379 @@
+import dataclasses
 import json
+import time
 import xml.etree.ElementTree as ElementTree
+from typing import Callable
 from sdk.models.responses.notification import *
+from sdk.models.responses.lazy_notification import LazyNotification
 
 
-def parse_notification(notification_string: str) -> Optional[Notification]:
+def parse_notification(notification_string: str, lazy: bool = False,
+                       observer: Callable[[str, float, bool], None] = None) -> Optional[Notification]:
+    # With lazy=True the nested objects are only built when read, so errors in them are raised on access.
+    # observer(format, seconds, parsed) is called after parsing, format being "xml" or "json".
+    if observer is None:
+        return __parse(notification_string, lazy)
+    start = time.perf_counter()
+    notification = __parse(notification_string, lazy)
+    observer("xml" if notification_string[:1] == '<' else "json", time.perf_counter() - start,
+             notification is not None)
+    return notification
+
+
+def __parse(notification_string: str, lazy: bool) -> Optional[Notification]:
     try:
         if notification_string[0] == '<':
             root = ElementTree.fromstring(notification_string)
-            return __xml_to_dataclass(root)
+            return __xml_to_lazy_notification(root) if lazy else __xml_to_dataclass(root)
         else:
-            data = json.loads(notification_string)
-            print(data)
-            if str(data["response"])[0] == '<':
-                root = ElementTree.fromstring(data["response"])
-                return __xml_to_dataclass(root)
-            return Response.from_json(notification_string).response
+            response = json.loads(notification_string)["response"]
+            if isinstance(response, str) and response[:1] == '<':
+                root = ElementTree.fromstring(response)
+                return __xml_to_lazy_notification(root) if lazy else __xml_to_dataclass(root)
+            if lazy:
+                return __json_to_lazy_notification(response) if response is not None else None
+            return __json_to_dataclass(response)
     except Exception as e:
         print(f"An error occurred: {e}")
         return None
 
 
-def __get_text(element, tag):
-    found = element.find(tag)
-    return found.text if found is not None else None
+def __xml_to_dataclass(element):
+    # Each element's children are walked once and dispatched on their tag, keeping the first child of each
+    # tag like element.find did.
+    if element is None:
+        return None
+    builder = __BUILDERS.get(element.tag)
+    return builder(element) if builder is not None else None
 
 
-def __get_enum_value(cls, str_value: str):
-    try:
-        return cls[str_value] if str_value is not None else None
-    except KeyError:
-        return None
+def __xml_to_lazy_notification(element):
+    if element.tag != "response" and element.tag != "payfrex-response":
+        return __xml_to_dataclass(element)
+    values = __collect(element, __LAZY_NOTIFICATION_FIELDS)
+    if "operations" not in values:
+        raise ValueError(f"{element.tag}: operations element is missing")
+    return LazyNotification(
+        message=values.get("message"),
+        status=values.get("status"),
+        raw_operations=values["operations"],
+        raw_work_flow_response=values.get("workFlowResponse"),
+        raw_optional_transaction_params=values.get("optionalTransactionParams"),
+        build_operation=__xml_to_dataclass,
+        build_work_flow_response=__work_flow_response,
+        build_optional_transaction_params=__optional_transaction_params,
+        build_entry_index=__xml_entry_index,
+    )
 
 
-def __xml_to_dataclass(element):
-    if element is None:
-        return None
-    if element.tag == "response" or element.tag == "payfrex-response":
-        return Notification(
-            message=__get_text(element, "message"),
-            status=__get_text(element, "status"),
-            operations=[__xml_to_dataclass(op) for op in element.find("operations")],
-            workFlowResponse=__xml_to_dataclass(element.find("workFlowResponse")),
-            optionalTransactionParams=__xml_to_dataclass(element.find("optionalTransactionParams")),
-        )
-    elif element.tag == "operation":
-        return Operation(
-            amount=float(__get_text(element, "amount")) if __get_text(element, "amount") else None,
-            currency=__get_enum_value(Currency, __get_text(element, "currency")),
-            details=__get_text(element, "details"),
-            merchantTransactionId=__get_text(element, "merchantTransactionId"),
-            paySolTransactionId=__get_text(element, "paySolTransactionId"),
-            service=__get_text(element, "service"),
-            status=__get_text(element, "status"),
-            transactionId=__get_text(element, "transactionId"),
-            respCode=__xml_to_dataclass(element.find("respCode")),
-            operationType=__get_enum_value(OperationTypes, __get_text(element, "operationType")),
-            paymentDetails=__xml_to_dataclass(element.find("paymentDetails")),
-            mpi=__xml_to_dataclass(element.find("mpi")),
-            paymentCode=__get_text(element, "paymentCode"),
-            paymentMessage=__get_text(element, "paymentMessage"),
-            message=__get_text(element, "message"),
-            paymentMethod=__get_text(element, "paymentMethod"),
-            paymentSolution=__get_enum_value(PaymentSolutions, __get_text(element, "paymentSolution")),
-            authCode=__get_text(element, "authCode"),
-            rad=__get_text(element, "rad"),
-            radMessage=__get_text(element, "radMessage"),
-            redirectionResponse=__get_text(element, "redirectionResponse"),
-            subscriptionPlan=__get_text(element, "subscriptionPlan"),
-            optionalTransactionParams=__xml_to_dataclass(element.find("optionalTransactionParams")),
-        )
-    elif element.tag == "respCode":
-        return ResponseCode(
-            code=__get_text(element, "code"),
-            message=__get_text(element, "message"),
-            uuid=__get_text(element, "uuid"),
-        )
-    elif element.tag == "paymentDetails":
-        return PaymentDetails(
-            cardNumberToken=__get_text(element, "cardNumberToken"),
-            account=__get_text(element, "account"),
-            cardHolderName=__get_text(element, "cardHolderName"),
-            cardNumber=__get_text(element, "cardNumber"),
-            cardType=__get_text(element, "cardType"),
-            expDate=__get_text(element, "expDate"),
-            issuerBank=__get_text(element, "issuerBank"),
-            issuerCountry=__get_text(element, "issuerCountry"),
-            extraDetails=__xml_to_dataclass(element.find("extraDetails")),
-        )
-    elif element.tag == "extraDetails":
-        xml_dict = xml_to_dict(element)
-        return ExtraDetails(
-            entry=[__xml_to_dataclass(entry) for entry in element],
-        ) if xml_dict is not None else ExtraDetails()
-    elif element.tag == "optionalTransactionParams":
-        xml_dict = xml_to_dict(element)
-        return OptionalTransactionParams(
-            entry=[__xml_to_dataclass(entry) for entry in element],
-        ) if xml_dict is not None else OptionalTransactionParams()
-    elif element.tag == "entry":
-        xml_dict = xml_to_dict(element)
-        return Entry(
-            key=xml_dict["key"], value=xml_dict["value"]
-        )
-    elif element.tag == "mpi":
-        return Mpi(
-            acsTransID=__get_text(element, "acsTransID"),
-            authMethod=__get_text(element, "authMethod"),
-            authTimestamp=__get_text(element, "authTimestamp"),
-            authenticationStatus=__get_text(element, "authenticationStatus"),
-            cavv=__get_text(element, "cavv"),
-            eci=__get_text(element, "eci"),
-            messageVersion=__get_text(element, "messageVersion"),
-            threeDSSessionData=__get_text(element, "threeDSSessionData"),
-            threeDSv2Token=__get_text(element, "threeDSv2Token"),
-        )
-    elif element.tag == "workFlowResponse":
-        return WorkFlowResponse(
-            id=__get_text(element, "id"),
-            name=__get_text(element, "name"),
-            version=__get_text(element, "version"),
-        )
+def __xml_entry_index(operations):
+    index = {}
+    for operation in operations:
+        if operation.tag != "operation":
+            continue
+        payment_details = operation.find("paymentDetails")
+        extra_details = payment_details.find("extraDetails") if payment_details is not None else None
+        if extra_details is not None:
+            entries = (__xml_to_dataclass(entry) for entry in extra_details)
+            IndexedEntries.index_items(index, ((entry.key, entry.value) for entry in entries if entry is not None))
+    return index
+
+
+def __collect(element, fields):
+    values = {}
+    for child in element:
+        tag = child.tag
+        if tag not in values:
+            converter = fields.get(tag)
+            if converter is not None:
+                values[tag] = converter(child)
+    return values
+
+
+def __text(element):
+    return element.text
+
+
+def __amount(element):
+    return float(element.text) if element.text else None
+
+
+def __enum_converter(cls):
+    members = dict(cls.__members__)
+    return lambda element: members.get(element.text)
+
+
+def __constructor(cls):
+    # Builds the response dataclasses without calling their __init__: dataclass_json(undefined=EXCLUDE) wraps it to
+    # drop unknown arguments through inspect.signature, which costs more than the parsing itself. Only declared
+    # fields are passed here, and the other fields get their default like __init__ gives them. The response
+    # dataclasses have no __post_init__ and no default_factory, which this relies on.
+    defaults = {}
+    for dataclass_field in dataclasses.fields(cls):
+        if dataclass_field.default is dataclasses.MISSING:
+            raise TypeError(f"{cls.__name__}.{dataclass_field.name} has no default value")
+        defaults[dataclass_field.name] = dataclass_field.default
+
+    def construct(**values):
+        instance = object.__new__(cls)
+        instance.__dict__.update(defaults)
+        instance.__dict__.update(values)
+        return instance
+
+    return construct
+
+
+def __text_fields(*tags):
+    return {tag: __text for tag in tags}
+
+
+def __notification(element):
+    values = __collect(element, __NOTIFICATION_FIELDS)
+    if "operations" not in values:
+        raise ValueError(f"{element.tag}: operations element is missing")
+    return __new_notification(**values)
+
+
+def __operations(element):
+    return [__xml_to_dataclass(op) for op in element]
+
+
+def __entries(element):
+    # An empty <extraDetails/> has no entry list, one holding only whitespace has an empty list.
+    if len(element) == 0 and element.text is None:
+        return {}
+    return {"entry": [__xml_to_dataclass(entry) for entry in element]}
+
+
+def __entry(element):
+    values = {}
+    for child in element:
+        if child.tag in values or len(child) > 0:
+            # Repeated or nested elements keep the list and dict values xml_to_dict gives them.
+            values = xml_to_dict(element)
+            break
+        values[child.tag] = child.text
+    return __new_entry(key=values["key"], value=values["value"])
+
+
+def __work_flow_response(element):
+    return __new_work_flow_response(**__collect(element, __WORK_FLOW_RESPONSE_FIELDS))
+
+
+def __optional_transaction_params(element):
+    return __new_optional_transaction_params(**__entries(element))
+
+
+def __extra_details(element):
+    return __new_extra_details(**__entries(element))
+
+
+def __response_code(element):
+    return __new_response_code(**__collect(element, __RESPONSE_CODE_FIELDS))
+
+
+def __payment_details(element):
+    return __new_payment_details(**__collect(element, __PAYMENT_DETAILS_FIELDS))
+
+
+def __mpi(element):
+    return __new_mpi(**__collect(element, __MPI_FIELDS))
+
+
+def __operation(element):
+    return __new_operation(**__collect(element, __OPERATION_FIELDS))
+
+
+__new_notification = __constructor(Notification)
+__new_operation = __constructor(Operation)
+__new_response_code = __constructor(ResponseCode)
+__new_payment_details = __constructor(PaymentDetails)
+__new_extra_details = __constructor(ExtraDetails)
+__new_optional_transaction_params = __constructor(OptionalTransactionParams)
+__new_entry = __constructor(Entry)
+__new_mpi = __constructor(Mpi)
+__new_work_flow_response = __constructor(WorkFlowResponse)
+
+__NOTIFICATION_FIELDS = {
+    **__text_fields("message", "status"),
+    "operations": __operations,
+    "workFlowResponse": __work_flow_response,
+    "optionalTransactionParams": __optional_transaction_params,
+}
+
+__OPERATION_FIELDS = {
+    **__text_fields("details", "merchantTransactionId", "paySolTransactionId", "service", "status", "transactionId",
+                    "paymentCode", "paymentMessage", "message", "paymentMethod", "authCode", "rad", "radMessage",
+                    "redirectionResponse", "subscriptionPlan"),
+    "amount": __amount,
+    "currency": __enum_converter(Currency),
+    "operationType": __enum_converter(OperationTypes),
+    "paymentSolution": __enum_converter(PaymentSolutions),
+    "respCode": __response_code,
+    "paymentDetails": __payment_details,
+    "mpi": __mpi,
+    "optionalTransactionParams": __optional_transaction_params,
+}
+
+__LAZY_NOTIFICATION_FIELDS = {
+    **__text_fields("message", "status"),
+    "operations": list,
+    "workFlowResponse": lambda element: element,
+    "optionalTransactionParams": lambda element: element,
+}
+
+__RESPONSE_CODE_FIELDS = __text_fields("code", "message", "uuid")
+
+__PAYMENT_DETAILS_FIELDS = {
+    **__text_fields("cardNumberToken", "account", "cardHolderName", "cardNumber", "cardType", "expDate",
+                    "issuerBank", "issuerCountry"),
+    "extraDetails": __extra_details,
+}
+
+__MPI_FIELDS = __text_fields("acsTransID", "authMethod", "authTimestamp", "authenticationStatus", "cavv", "eci",
+                             "messageVersion", "threeDSSessionData", "threeDSv2Token")
+
+__WORK_FLOW_RESPONSE_FIELDS = __text_fields("id", "name", "version")
+
+__BUILDERS = {
+    "response": __notification,
+    "payfrex-response": __notification,
+    "operation": __operation,
+    "respCode": __response_code,
+    "paymentDetails": __payment_details,
+    "extraDetails": __extra_details,
+    "optionalTransactionParams": __optional_transaction_params,
+    "entry": __entry,
+    "mpi": __mpi,
+    "workFlowResponse": __work_flow_response,
+}
+
+
+def __json_to_dataclass(data):
+    # Builds the same objects as Response.from_json(...).response from the already decoded dict, applying the
+    # dataclasses_json conversions for the field types directly: str() and float() on mismatched values, enums
+    # by value, and the ParsingUtils entry lists.
+    return __json_notification(data) if data is not None else None
+
+
+def __json_to_lazy_notification(data):
+    values = __json_lazy_notification(data)
+    return LazyNotification(
+        message=values.get("message"),
+        status=values.get("status"),
+        raw_operations=values.get("operations"),
+        raw_work_flow_response=values.get("workFlowResponse"),
+        raw_optional_transaction_params=values.get("optionalTransactionParams"),
+        build_operation=__json_operation,
+        build_work_flow_response=__json_work_flow_response,
+        build_optional_transaction_params=__json_optional_transaction_params,
+        build_entry_index=__json_entry_index,
+    )
+
+
+def __json_entry_index(operations):
+    index = {}
+    for operation in operations:
+        payment_details = operation.get("paymentDetails")
+        extra_details = payment_details.get("extraDetails") if payment_details is not None else None
+        if extra_details:
+            IndexedEntries.index_items(index, extra_details.items())
+    return index
+
+
+def __json_object(constructor, fields):
+    def decode(data):
+        values = {}
+        for key, value in data.items():
+            field = fields.get(key)
+            if field is not None:
+                values[field[0]] = field[1](value) if value is not None else None
+        return constructor(**values)
+
+    return decode
+
+
+def __json_str(value):
+    return value if isinstance(value, str) else str(value)
+
+
+def __json_float(value):
+    return value if isinstance(value, float) else float(value)
+
+
+def __json_enum(cls):
+    members = dict(cls._value2member_map_)
+
+    def decode(value):
+        member = members.get(value)
+        return member if member is not None else cls(value)
+
+    return decode
+
+
+def __json_entries(data):
+    return [__new_entry(key=key, value=value) for key, value in data.items()] if data else []
+
+
+def __json_extra_details(data):
+    return __new_extra_details(entry=__json_entries(data))
+
+
+def __json_optional_transaction_params(data):
+    return __new_optional_transaction_params(entry=__json_entries(data))
+
+
+def __json_operations(data):
+    return [__json_operation(operation) for operation in data]
+
+
+def __json_str_fields(*keys):
+    return {key: (key, __json_str) for key in keys}
+
+
+__json_work_flow_response = __json_object(__new_work_flow_response, __json_str_fields("id", "name", "version"))
+
+__json_response_code = __json_object(__new_response_code, __json_str_fields("code", "message", "uuid"))
+
+__json_mpi = __json_object(__new_mpi, __json_str_fields(
+    "acsTransID", "authMethod", "authTimestamp", "authenticationStatus", "cavv", "eci", "messageVersion",
+    "threeDSSessionData", "threeDSv2Token"))
+
+__json_payment_details = __json_object(__new_payment_details, {
+    **__json_str_fields("cardNumberToken", "account", "cardHolderName", "cardNumber", "cardType", "expDate",
+                        "issuerBank", "issuerCountry"),
+    "extraDetails": ("extraDetails", __json_extra_details),
+})
+
+__json_operation = __json_object(__new_operation, {
+    **__json_str_fields("details", "merchantTransactionId", "paySolTransactionId", "service", "status",
+                        "transactionId", "paymentCode", "paymentMessage", "message", "paymentMethod", "authCode",
+                        "rad", "radMessage", "redirectionResponse", "subscriptionPlan"),
+    "amount": ("amount", __json_float),
+    "currency": ("currency", __json_enum(Currency)),
+    "operationType": ("operationType", __json_enum(OperationTypes)),
+    "paymentSolution": ("paymentSolution", __json_enum(PaymentSolutions)),
+    "respCode": ("respCode", __json_response_code),
+    "paymentDetails": ("paymentDetails", __json_payment_details),
+    "mpi": ("mpi", __json_mpi),
+    "optionalTransactionParams": ("optionalTransactionParams", __json_optional_transaction_params),
+})
+
+__json_notification = __json_object(__new_notification, {
+    **__json_str_fields("message", "status"),
+    "operations": ("operations", __json_operations),
+    "operationsArray": ("operations", __json_operations),
+    "workFlowResponse": ("workFlowResponse", __json_work_flow_response),
+    "optionalTransactionParams": ("optionalTransactionParams", __json_optional_transaction_params),
+})
+
+__json_lazy_notification = __json_object(dict, {
+    **__json_str_fields("message", "status"),
+    "operations": ("operations", list),
+    "operationsArray": ("operations", list),
+    "workFlowResponse": ("workFlowResponse", lambda data: data),
+    "optionalTransactionParams": ("optionalTransactionParams", lambda data: data),
+})
 
 
 def xml_to_dict(element):
@@ -0,0 +1,217 @@
+import asyncio
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+
+from sdk.adapters.notification_adapter import parse_notification
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.responses.notification import Notification
+
+
+class NotificationReceiver:
+    # WSGI/ASGI endpoint for the statusURL callbacks. A notification is only queued before answering the gateway,
+    # parsing and the handlers run on the worker threads. When the queue is full the gateway gets a 503 and
+    # retries the notification later. Once stopped, the receiver answers 503 until it is started again.
+    DEFAULT_WORKERS: int = 4
+    DEFAULT_QUEUE_SIZE: int = 1000
+    DEFAULT_RETRY_AFTER: int = 1
+    DEFAULT_STOP_TIMEOUT: float = 10.0
+
+    __STOP = object()
+
+    def __init__(self, handler: Callable[[Notification], None] = None, workers: int = DEFAULT_WORKERS,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, lazy: bool = False, retry_after: int = DEFAULT_RETRY_AFTER,
+                 stop_timeout: float = DEFAULT_STOP_TIMEOUT, parse_observer: Callable[[str, float, bool], None] = None):
+        # stop_timeout bounds the wait for the queued notifications when an ASGI server shuts down.
+        # parse_observer is given to parse_notification for every notification processed.
+        if workers is None or workers < 1:
+            raise InvalidFieldException("workers: Should be (workers >= 1)")
+        if queue_size is None or queue_size < 1:
+            raise InvalidFieldException("queueSize: Should be (queueSize >= 1)")
+        self.__handlers: List[Callable[[Notification], None]] = [handler] if handler is not None else []
+        self.__workers = workers
+        self.__lazy = lazy
+        self.__parse_observer = parse_observer
+        self.__retry_after = retry_after
+        self.__stop_timeout = stop_timeout
+        self.__queue = queue.Queue(maxsize=queue_size)
+        self.__threads: List[threading.Thread] = []
+        self.__stopped = False
+        self.__lock = threading.Lock()
+        self.__received = 0
+        self.__rejected = 0
+        self.__processed = 0
+        self.__failed = 0
+
+    def add_handler(self, handler: Callable[[Notification], None]):
+        self.__handlers.append(handler)
+
+    def set_parse_observer(self, parse_observer: Optional[Callable[[str, float, bool], None]]):
+        self.__parse_observer = parse_observer
+
+    def get_received(self) -> int:
+        return self.__received
+
+    def get_rejected(self) -> int:
+        return self.__rejected
+
+    def get_processed(self) -> int:
+        return self.__processed
+
+    def get_failed(self) -> int:
+        return self.__failed
+
+    def get_queue_size(self) -> int:
+        return self.__queue.qsize()
+
+    def is_running(self) -> bool:
+        return len(self.__threads) > 0
+
+    def is_stopped(self) -> bool:
+        return self.__stopped
+
+    def start(self):
+        with self.__lock:
+            self.__stopped = False
+            if self.__threads:
+                return
+            for index in range(self.__workers):
+                thread = threading.Thread(target=self.__work, name=f"notification-receiver-{index}", daemon=True)
+                thread.start()
+                self.__threads.append(thread)
+
+    def stop(self, timeout: float = None):
+        # Notifications already queued are processed before the workers exit. With a timeout, stop returns after
+        # timeout seconds at most and the daemon workers are left to finish.
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self.__lock:
+            self.__stopped = True
+            threads, self.__threads = self.__threads, []
+        for _ in threads:
+            try:
+                self.__queue.put(NotificationReceiver.__STOP, timeout=NotificationReceiver.__remaining(deadline))
+            except queue.Full:
+                break
+        for thread in threads:
+            thread.join(NotificationReceiver.__remaining(deadline))
+
+    def join(self):
+        self.__queue.join()
+
+    def submit(self, content: str) -> bool:
+        # False when the queue is full or the receiver has been stopped. The first submit starts the workers.
+        if not self.__threads and not self.__stopped:
+            self.start()
+        with self.__lock:
+            if self.__stopped:
+                self.__rejected += 1
+                return False
+            try:
+                self.__queue.put_nowait(content)
+            except queue.Full:
+                self.__rejected += 1
+                return False
+            self.__received += 1
+        return True
+
+    def wsgi_app(self, environ, start_response):
+        status, body = self.__receive(environ.get("REQUEST_METHOD"), NotificationReceiver.__read_wsgi_body(environ))
+        start_response(status, self.__get_headers(status))
+        return [body]
+
+    async def asgi_app(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.__lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        content = bytearray()
+        while True:
+            message = await receive()
+            content += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        status, body = self.__receive(scope.get("method"), bytes(content))
+        await send({
+            "type": "http.response.start",
+            "status": int(status.split(" ", 1)[0]),
+            "headers": [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                        for name, value in self.__get_headers(status)],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def __receive(self, method: Optional[str], content: bytes):
+        if method != "POST":
+            return "405 Method Not Allowed", b"Method Not Allowed"
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            return "400 Bad Request", b"Bad Request"
+        if not text.strip():
+            return "400 Bad Request", b"Bad Request"
+        if not self.submit(text):
+            return "503 Service Unavailable", b"Service Unavailable"
+        return "200 OK", b"OK"
+
+    def __get_headers(self, status: str):
+        headers = [("Content-Type", "text/plain")]
+        if status.startswith("503"):
+            headers.append(("Retry-After", str(self.__retry_after)))
+        return headers
+
+    async def __lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                # stop joins the workers, which would block the event loop of the server.
+                await asyncio.get_running_loop().run_in_executor(None, self.stop, self.__stop_timeout)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def __work(self):
+        while True:
+            content = self.__queue.get()
+            try:
+                if content is NotificationReceiver.__STOP:
+                    return
+                self.__process(content)
+            finally:
+                self.__queue.task_done()
+
+    def __process(self, content: str):
+        failed = False
+        notification = parse_notification(content, self.__lazy, self.__parse_observer)
+        if notification is None:
+            failed = True
+        else:
+            for handler in self.__handlers:
+                try:
+                    handler(notification)
+                except Exception as e:
+                    print(f"An error occurred: {e}")
+                    failed = True
+        with self.__lock:
+            if failed:
+                self.__failed += 1
+            else:
+                self.__processed += 1
+
+    @staticmethod
+    def __remaining(deadline: Optional[float]) -> Optional[float]:
+        return max(0.0, deadline - time.monotonic()) if deadline is not None else None
+
+    @staticmethod
+    def __read_wsgi_body(environ) -> bytes:
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        stream = environ.get("wsgi.input")
+        # Reading past CONTENT_LENGTH can block on the WSGI input, so a body without it is treated as empty.
+        return stream.read(length) if stream is not None and length > 0 else b""
@@ -0,0 +1,272 @@
+import asyncio
+import concurrent.futures
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional, Tuple
+
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.enums.environment import Environment
+from sdk.enums.error import Error
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.request_context import RequestContext
+from sdk.utils.request_utils import RequestUtils
+
+
+class ProcessPoolPreparer:
+    # Runs the SERIALIZE and ENCRYPT stages (query or JSON serialization, AES-CBC and SHA-256) in a pool of worker
+    # processes, so the CPU-bound part of the requests is not serialized by the GIL. The request is pickled when the
+    # stage starts and the worker serializes that snapshot, so later changes to the request do not race with it.
+    # The callers' threads (or event loop) keep the network part and send on their pooled network adapter.
+    # A request not prepared before its Deadline, or within timeout seconds, gets Error.DEADLINE_EXCEEDED, and one
+    # whose worker died gets Error.NETWORK_ERROR, like the errors of the network adapters. Nothing is sent then.
+    DEFAULT_START_METHOD: str = "spawn"
+    DEFAULT_TIMEOUT: float = 30.0
+    ERROR_ATTRIBUTE: str = "process_pool_preparer.error"
+
+    # Per worker process: credentials by their fields, so the CryptoContext of each merchant pass is built once.
+    __worker_credentials: Dict[tuple, Credentials] = {}
+
+    def __init__(self, workers: int = None, start_method: str = DEFAULT_START_METHOD,
+                 timeout: float = DEFAULT_TIMEOUT):
+        # workers defaults to the number of CPUs. spawn is the safe start method for a process with threads.
+        if timeout is None or timeout <= 0:
+            raise InvalidFieldException("timeout: Should be (timeout > 0)")
+        self.__workers = workers if workers is not None else multiprocessing.cpu_count()
+        self.__mp_context = multiprocessing.get_context(start_method)
+        self.__timeout = timeout
+        self.__executor = self.__new_executor()
+        self.__picklable: Dict[Callable, bool] = {}
+        self.__lock = threading.Lock()
+        self.__offloaded = 0
+        self.__in_process = 0
+        self.__closed = False
+
+    def get_workers(self) -> int:
+        return self.__workers
+
+    def get_timeout(self) -> float:
+        return self.__timeout
+
+    def get_offloaded_count(self) -> int:
+        return self.__offloaded
+
+    def get_in_process_count(self) -> int:
+        return self.__in_process
+
+    def install(self, pipeline: RequestPipeline, asynchronous: bool = False):
+        # asynchronous must be True for the pipeline of asyncio adapters: the stage then awaits the worker.
+        pipeline.set_stage(PipelineStage.SERIALIZE, self.__prepare_async if asynchronous else self.__prepare)
+        pipeline.set_stage(PipelineStage.ENCRYPT, ProcessPoolPreparer.__skip_encrypt)
+        pipeline.remove_middleware(ProcessPoolPreparer.__skip_send)
+        pipeline.add_middleware(ProcessPoolPreparer.__skip_send, [PipelineStage.SEND])
+
+    @staticmethod
+    def uninstall(pipeline: RequestPipeline):
+        pipeline.set_stage(PipelineStage.SERIALIZE, None)
+        pipeline.set_stage(PipelineStage.ENCRYPT, None)
+        pipeline.remove_middleware(ProcessPoolPreparer.__skip_send)
+
+    def warm_up(self):
+        # Starts every worker and imports the SDK in them, so the first requests do not pay for it. Raises
+        # TimeoutError when the workers are not up within timeout seconds.
+        futures = [self.__executor.submit(ProcessPoolPreparer.get_worker_pid) for _ in range(self.__workers)]
+        _, not_done = concurrent.futures.wait(futures, self.__timeout)
+        if not_done:
+            raise TimeoutError(f"Process pool workers not started within {self.__timeout} seconds")
+        for future in futures:
+            future.result()
+
+    def shutdown(self, wait: bool = True):
+        with self.__lock:
+            self.__closed = True
+        self.__executor.shutdown(wait=wait)
+
+    def __enter__(self) -> 'ProcessPoolPreparer':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    @staticmethod
+    def get_worker_pid() -> int:
+        return multiprocessing.current_process().pid
+
+    @staticmethod
+    def prepare(serializer: Callable, encrypted: bool, request_snapshot: bytes,
+                credentials_fields: tuple) -> Tuple[Optional[dict], Optional[str], Optional[dict], Optional[bytes]]:
+        # Runs in the worker. Returns the headers, the clear query, the query parameters and the body.
+        request = pickle.loads(request_snapshot)
+        credentials = ProcessPoolPreparer.__get_worker_credentials(credentials_fields)
+        headers, payload = serializer(request, credentials)
+        if not encrypted:
+            return headers, None, None, payload
+        encryption_headers, query_parameters = RequestUtils.encrypt_query(payload, request.get_merchant_id(),
+                                                                          credentials)
+        return {**headers, **encryption_headers} if headers else encryption_headers, payload, query_parameters, None
+
+    def __prepare(self, context: RequestContext):
+        if not self.__is_picklable(context.get_route().get_serializer()):
+            self.__prepare_in_process(context)
+            return
+        if ProcessPoolPreparer.__is_expired(context):
+            ProcessPoolPreparer.__set_timeout_error(context)
+            return
+        executor = self.__executor
+        try:
+            future = self.__submit(executor, context)
+            if future is None:
+                self.__prepare_in_process(context)
+                return
+            ProcessPoolPreparer.__apply(context, future.result(self.__get_timeout(context)))
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            ProcessPoolPreparer.__set_timeout_error(context)
+        except BrokenProcessPool as e:
+            self.__set_broken_pool_error(executor, context, e)
+
+    def __prepare_async(self, context: RequestContext):
+        if not self.__is_picklable(context.get_route().get_serializer()):
+            self.__prepare_in_process(context)
+            return None
+        return self.__prepare_in_worker_async(context)
+
+    async def __prepare_in_worker_async(self, context: RequestContext):
+        if ProcessPoolPreparer.__is_expired(context):
+            ProcessPoolPreparer.__set_timeout_error(context)
+            return
+        executor = self.__executor
+        try:
+            future = self.__submit(executor, context)
+            if future is None:
+                self.__prepare_in_process(context)
+                return
+            ProcessPoolPreparer.__apply(context, await asyncio.wait_for(asyncio.wrap_future(future),
+                                                                        self.__get_timeout(context)))
+        except asyncio.TimeoutError:
+            ProcessPoolPreparer.__set_timeout_error(context)
+        except BrokenProcessPool as e:
+            self.__set_broken_pool_error(executor, context, e)
+
+    def __submit(self, executor: ProcessPoolExecutor, context: RequestContext) -> Optional[Future]:
+        # None when the pool was shut down, by shutdown() or because another request replaced a broken pool.
+        snapshot = pickle.dumps(context.get_request(), pickle.HIGHEST_PROTOCOL)
+        try:
+            future = executor.submit(ProcessPoolPreparer.prepare, serializer=context.get_route().get_serializer(),
+                                     encrypted=context.get_route().is_encrypted(), request_snapshot=snapshot,
+                                     credentials_fields=ProcessPoolPreparer.__get_credentials_fields(context))
+        except BrokenProcessPool:
+            raise
+        except RuntimeError:
+            return None
+        with self.__lock:
+            self.__offloaded += 1
+        return future
+
+    def __get_timeout(self, context: RequestContext) -> float:
+        deadline = context.get_deadline()
+        return min(deadline.remaining(), self.__timeout) if deadline is not None else self.__timeout
+
+    @staticmethod
+    def __is_expired(context: RequestContext) -> bool:
+        # An expired request is not submitted: a warm worker could otherwise prepare it before the wait times out.
+        deadline = context.get_deadline()
+        return deadline is not None and deadline.is_expired()
+
+    @staticmethod
+    def __set_timeout_error(context: RequestContext):
+        context.set_attribute(ProcessPoolPreparer.ERROR_ATTRIBUTE,
+                              (Error.DEADLINE_EXCEEDED, "Deadline exceeded while preparing the request"))
+
+    def __set_broken_pool_error(self, executor: ProcessPoolExecutor, context: RequestContext, error: Exception):
+        # A worker died (killed, out of memory...): the pool is replaced so the next requests are prepared again.
+        with self.__lock:
+            if self.__executor is executor and not self.__closed:
+                self.__executor = self.__new_executor()
+        executor.shutdown(wait=False)
+        context.set_attribute(ProcessPoolPreparer.ERROR_ATTRIBUTE,
+                              (Error.NETWORK_ERROR, f"{type(error).__name__}: {error}"))
+
+    def __new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.__workers, mp_context=self.__mp_context)
+
+    def __is_picklable(self, serializer: Callable) -> bool:
+        picklable = self.__picklable.get(serializer)
+        if picklable is None:
+            try:
+                pickle.dumps(serializer)
+                picklable = True
+            except (pickle.PicklingError, AttributeError, TypeError):
+                picklable = False
+            self.__picklable[serializer] = picklable
+        return picklable
+
+    @staticmethod
+    def __get_credentials_fields(context: RequestContext) -> tuple:
+        credentials = context.get_credentials()
+        environment = credentials.get_environment()
+        return (credentials.get_merchant_id(), credentials.get_merchant_pass(), credentials.get_merchant_key(),
+                environment.value if environment is not None else None, credentials.get_product_id(),
+                credentials.get_api_version())
+
+    @staticmethod
+    def __get_worker_credentials(credentials_fields: tuple) -> Credentials:
+        credentials = ProcessPoolPreparer.__worker_credentials.get(credentials_fields)
+        if credentials is None:
+            merchant_id, merchant_pass, merchant_key, environment, product_id, api_version = credentials_fields
+            credentials = Credentials()
+            credentials.set_merchant_id(merchant_id)
+            credentials.set_merchant_pass(merchant_pass)
+            if merchant_key is not None:
+                credentials.set_merchant_key(merchant_key)
+            if environment is not None:
+                credentials.set_environment(Environment(environment))
+            if product_id is not None:
+                credentials.set_product_id(product_id)
+            if api_version is not None:
+                credentials.set_api_version(api_version)
+            ProcessPoolPreparer.__worker_credentials[credentials_fields] = credentials
+        return credentials
+
+    def __prepare_in_process(self, context: RequestContext):
+        # Custom serializers that cannot be pickled, like lambdas, run in the calling process instead.
+        with self.__lock:
+            self.__in_process += 1
+        headers, payload = context.get_route().get_serializer()(context.get_request(), context.get_credentials())
+        if not context.get_route().is_encrypted():
+            ProcessPoolPreparer.__apply(context, (headers, None, None, payload))
+            return
+        encryption_headers, query_parameters = RequestUtils.encrypt_query(
+            payload, context.get_request().get_merchant_id(), context.get_credentials()
+        )
+        ProcessPoolPreparer.__apply(context, ({**headers, **encryption_headers} if headers else encryption_headers,
+                                              payload, query_parameters, None))
+
+    @staticmethod
+    def __apply(context: RequestContext, prepared: Tuple[Optional[dict], Optional[str], Optional[dict],
+                                                         Optional[bytes]]):
+        headers, query, query_parameters, body = prepared
+        context.set_headers(headers)
+        if query is not None:
+            context.set_query(query)
+            context.set_query_parameters(query_parameters)
+        if body is not None:
+            context.set_body(body)
+
+    @staticmethod
+    def __skip_encrypt(context: RequestContext):
+        # The worker already encrypted the query in the SERIALIZE stage.
+        pass
+
+    @staticmethod
+    def __skip_send(_stage: PipelineStage, context: RequestContext, proceed: Callable):
+        # A request that could not be prepared is answered with the error instead of being sent.
+        error = context.get_attribute(ProcessPoolPreparer.ERROR_ATTRIBUTE)
+        if error is None:
+            return proceed()
+        context.set_response(error)
+        return None
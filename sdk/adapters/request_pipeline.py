@@ -0,0 +1,193 @@
+import inspect
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.exceptions.field_exception import MissingFieldException
+from sdk.models.request_context import RequestContext
+from sdk.models.retry_policy import RetryPolicy
+from sdk.utils.request_utils import RequestUtils
+
+
+class RequestPipeline:
+    # Runs every request of the payment adapters through the same stages, in PipelineStage order. A middleware
+    # is called as middleware(stage, context, proceed) and wraps the stage: it can act before and after
+    # proceed(), or skip the stage by not calling it. Timing hooks are called as hook(stage, context, seconds)
+    # once each stage finishes, including its middlewares and also when it raises. The exception is then set on
+    # the context before the hooks are called.
+
+    def __init__(self, network_adapter=None, retry_policy: RetryPolicy = None):
+        self.__network_adapter = network_adapter
+        self.__retry_policy = retry_policy
+        self.__stages: Dict[PipelineStage, Callable[[RequestContext], None]] = {}
+        self.__middlewares: Dict[PipelineStage, List[Callable]] = {stage: [] for stage in PipelineStage}
+        self.__timing_hooks: List[Callable[[PipelineStage, RequestContext, float], None]] = []
+
+    def set_network_adapter(self, network_adapter):
+        self.__network_adapter = network_adapter
+
+    def get_network_adapter(self):
+        return self.__network_adapter
+
+    def set_retry_policy(self, retry_policy: RetryPolicy):
+        self.__retry_policy = retry_policy
+
+    def get_retry_policy(self) -> Optional[RetryPolicy]:
+        return self.__retry_policy
+
+    def set_stage(self, stage: PipelineStage, handler: Optional[Callable[[RequestContext], None]]):
+        # Replaces the default implementation of a stage, None restores it. In execute_async the handler may
+        # return an awaitable.
+        if handler is None:
+            self.__stages.pop(stage, None)
+        else:
+            self.__stages[stage] = handler
+
+    def add_middleware(self, middleware: Callable, stages: Iterable[PipelineStage] = None):
+        # The first middleware added is the outermost one.
+        for stage in (stages if stages is not None else PipelineStage):
+            self.__middlewares[stage].append(middleware)
+
+    def remove_middleware(self, middleware: Callable):
+        for middlewares in self.__middlewares.values():
+            if middleware in middlewares:
+                middlewares.remove(middleware)
+
+    def add_timing_hook(self, hook: Callable[[PipelineStage, RequestContext, float], None]):
+        self.__timing_hooks.append(hook)
+
+    def remove_timing_hook(self, hook: Callable[[PipelineStage, RequestContext, float], None]):
+        if hook in self.__timing_hooks:
+            self.__timing_hooks.remove(hook)
+
+    def execute(self, context: RequestContext):
+        for stage in PipelineStage:
+            start = time.perf_counter()
+            try:
+                self.__chain(stage, context, self.__get_handler(stage, False))()
+            except Exception as e:
+                context.set_exception(e)
+                raise
+            finally:
+                self.__record(stage, context, time.perf_counter() - start)
+        return context.get_result()
+
+    async def execute_async(self, context: RequestContext):
+        # Same stages, with the network adapter awaited. A middleware around SEND gets an awaitable back from
+        # proceed(): it can return it as is, or be a coroutine function that awaits it.
+        for stage in PipelineStage:
+            start = time.perf_counter()
+            try:
+                result = self.__chain(stage, context, self.__get_handler(stage, True))()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                context.set_exception(e)
+                raise
+            finally:
+                self.__record(stage, context, time.perf_counter() - start)
+        return context.get_result()
+
+    def __get_handler(self, stage: PipelineStage, asynchronous: bool) -> Callable[[RequestContext], None]:
+        handler = self.__stages.get(stage)
+        if handler is not None:
+            return handler
+        if stage == PipelineStage.SEND:
+            return self.__send_async if asynchronous else self.__send
+        return RequestPipeline.__DEFAULT_STAGES[stage]
+
+    def __chain(self, stage: PipelineStage, context: RequestContext, handler: Callable[[RequestContext], None]):
+        def proceed():
+            return handler(context)
+
+        for middleware in reversed(self.__middlewares[stage]):
+            proceed = RequestPipeline.__wrap(middleware, stage, context, proceed)
+        return proceed
+
+    def __record(self, stage: PipelineStage, context: RequestContext, duration: float):
+        context.record_duration(stage, duration)
+        for hook in self.__timing_hooks:
+            hook(stage, context, duration)
+
+    def __send(self, context: RequestContext):
+        context.set_response(RequestUtils.send_request(
+            self.__network_adapter, self.__retry_policy, context.get_request(),
+            **RequestPipeline.__send_arguments(context)
+        ))
+
+    async def __send_async(self, context: RequestContext):
+        context.set_response(await RequestUtils.async_send_request(
+            self.__network_adapter, self.__retry_policy, context.get_request(),
+            **RequestPipeline.__send_arguments(context)
+        ))
+
+    @staticmethod
+    def __send_arguments(context: RequestContext) -> dict:
+        arguments = {
+            "headers": context.get_headers(),
+            "query_parameters": context.get_query_parameters(),
+            "json": None,
+            "url": context.get_url(),
+            "deadline": context.get_deadline()
+        }
+        # Encrypted routes have no body, and are sent with the same arguments as before the pipeline.
+        if context.get_body() is not None:
+            arguments["body"] = context.get_body()
+        return arguments
+
+    @staticmethod
+    def __wrap(middleware: Callable, stage: PipelineStage, context: RequestContext, proceed: Callable):
+        return lambda: middleware(stage, context, proceed)
+
+    @staticmethod
+    def __check_credentials(context: RequestContext):
+        is_missing_cred = context.get_request().check_credentials(context.get_credentials())
+        if is_missing_cred[0]:
+            raise MissingFieldException(is_missing_cred[1], True)
+
+    @staticmethod
+    def __select_endpoint(context: RequestContext):
+        context.set_endpoint(context.get_route().get_endpoint(context.get_credentials().get_environment()))
+
+    @staticmethod
+    def __set_credentials(context: RequestContext):
+        context.get_request().set_credentials(context.get_credentials())
+
+    @staticmethod
+    def __validate(context: RequestContext):
+        is_missing_field = context.get_request().is_missing_field()
+        if is_missing_field[0]:
+            raise MissingFieldException(is_missing_field[1], False)
+
+    @staticmethod
+    def __serialize(context: RequestContext):
+        headers, payload = context.get_route().get_serializer()(context.get_request(), context.get_credentials())
+        context.set_headers(headers)
+        if context.get_route().is_encrypted():
+            context.set_query(payload)
+        else:
+            context.set_body(payload)
+
+    @staticmethod
+    def __encrypt(context: RequestContext):
+        if not context.get_route().is_encrypted():
+            return
+        headers, query_parameters = RequestUtils.encrypt_query(
+            context.get_query(), context.get_request().get_merchant_id(), context.get_credentials()
+        )
+        context.set_headers({**context.get_headers(), **headers} if context.get_headers() else headers)
+        context.set_query_parameters(query_parameters)
+
+    @staticmethod
+    def __map_response(context: RequestContext):
+        context.set_result(context.get_route().get_response_mapper()(context.get_response()))
+
+    __DEFAULT_STAGES: Dict[PipelineStage, Callable[[RequestContext], None]] = {
+        PipelineStage.CHECK_CREDENTIALS: __check_credentials,
+        PipelineStage.ENDPOINT: __select_endpoint,
+        PipelineStage.SET_CREDENTIALS: __set_credentials,
+        PipelineStage.VALIDATE: __validate,
+        PipelineStage.SERIALIZE: __serialize,
+        PipelineStage.ENCRYPT: __encrypt,
+        PipelineStage.MAP_RESPONSE: __map_response,
+    }
@@ -0,0 +1,399 @@
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sdk.adapters import notification_adapter
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.hosted_payment_adapter import HostedPaymentAdapter
+from sdk.adapters.hosted_quix_payment_adapter import HostedQuixPaymentAdapter
+from sdk.adapters.js_payment_adapter import JSPaymentAdapter
+from sdk.adapters.js_quix_payment_adapter import JSQuixPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.enums.category import Category
+from sdk.enums.country_code import CountryCodeAlpha2, CountryCodeAlpha3
+from sdk.enums.currency import Currency
+from sdk.enums.environment import Environment
+from sdk.enums.operation_types import OperationTypes
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.models.credentials import Credentials
+from sdk.models.quix_models.quix_address import QuixAddress
+from sdk.models.quix_models.quix_billing import QuixBilling
+from sdk.models.quix_models.quix_product.quix_article_product import QuixArticleProduct
+from sdk.models.quix_models.quix_product.quix_cart_product import QuixCartProduct
+from sdk.models.quix_models.quix_product.quix_item_pay_sol_extended_data import QuixItemPaySolExtendedData
+from sdk.models.quix_models.quix_product.quix_product_cart_item import QuixProductCartItem
+from sdk.models.requests.h2h.h2h_redirection import H2HRedirection
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.requests.hosted.hosted_payment_redirection import HostedPaymentRedirection
+from sdk.models.requests.js.js_charge import JSCharge
+from sdk.models.requests.quix_hosted.hosted_quix_item import HostedQuixItem
+from sdk.models.requests.quix_js.js_quix_item import JSQuixItem
+from sdk.utils.general_utils import GeneralUtils
+from sdk.utils.query_serializer import QuerySerializer
+from sdk.utils.request_utils import RequestUtils
+from sdk.utils.security_utils import SecurityUtils
+
+RESULTS_FORMAT = 1
+
+CART_SIZES = (1, 10, 100, 1000)
+
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_THRESHOLD = 0.10
+
+NOTIFICATIONS_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests",
+                                       "notifications")
+
+FIXED_IV = bytes(range(16))
+
+
+class StaticNetworkAdapter(NetworkAdapter):
+    # Answers every request with the same response, so the macro benchmarks measure the SDK and not the network.
+
+    def __init__(self, response: str):
+        super().__init__()
+        self.__response = response
+
+    # pylint: disable-next=unused-argument
+    def send_request(self, headers, query_parameters, json, url, deadline=None, body=None):
+        return 200, self.__response
+
+
+def create_credentials() -> Credentials:
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_merchant_key("35354a8e-ce22-40e1-863a-e58a8e53488e")
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id("1168190001")
+    credentials.set_api_version(5)
+    return credentials
+
+
+def read_notification(name: str) -> str:
+    with open(os.path.join(NOTIFICATIONS_DIRECTORY, name), 'r', encoding="utf-8") as file:
+        return file.read()
+
+
+def get_notification_corpus() -> List[str]:
+    # Every sample notification of the tests that parse_notification accepts, sorted to keep the names stable.
+    names = []
+    for path in sorted(glob.glob(os.path.join(NOTIFICATIONS_DIRECTORY, "**", "*.*"), recursive=True)):
+        name = os.path.relpath(path, NOTIFICATIONS_DIRECTORY).replace(os.sep, "/")
+        if notification_adapter.parse_notification(read_notification(name)) is not None:
+            names.append(name)
+    return names
+
+
+def set_urls(request):
+    request.set_status_url("https://test.com/status")
+    request.set_success_url("https://test.com/success")
+    request.set_error_url("https://test.com/fail")
+    request.set_awaiting_url("https://test.com/await")
+    request.set_cancel_url("https://test.com/cancel")
+
+
+def create_quix_pay_sol_extended_data(item_count: int) -> QuixItemPaySolExtendedData:
+    # A synthetic cart of item_count different articles of 10.00 each.
+    items = []
+    for index in range(item_count):
+        article = QuixArticleProduct()
+        article.set_name(f"Article {index}")
+        article.set_reference(f"{4912345000000 + index}")
+        article.set_unit_price_with_tax(Decimal(10))
+        article.set_category(Category.PHYSICAL)
+        cart_item = QuixProductCartItem()
+        cart_item.set_article(article)
+        cart_item.set_units(1)
+        cart_item.set_auto_shipping(True)
+        cart_item.set_total_price_with_tax(Decimal(10))
+        items.append(cart_item)
+
+    cart = QuixCartProduct()
+    cart.set_currency(Currency.EUR)
+    cart.set_items(items)
+    cart.set_total_price_with_tax(Decimal(10 * item_count))
+
+    address = QuixAddress()
+    address.set_city("Barcelona")
+    address.set_country(CountryCodeAlpha3.ESP)
+    address.set_street_address("Nombre de la vía y nº")
+    address.set_postal_code("28003")
+    billing = QuixBilling()
+    billing.set_address(address)
+    billing.set_first_name("Nombre")
+    billing.set_last_name("Apellido")
+
+    pay_sol_extended_data = QuixItemPaySolExtendedData()
+    pay_sol_extended_data.set_cart(cart)
+    pay_sol_extended_data.set_billing(billing)
+    pay_sol_extended_data.set_product("instalments")
+    return pay_sol_extended_data
+
+
+def create_quix_item(request_class, item_count: int):
+    request = request_class()
+    request.set_amount(str(10 * item_count))
+    request.set_customer_id("903")
+    request.set_merchant_transaction_id("34441")
+    request.set_customer_email("test@mail.com")
+    request.set_customer_national_id("99999999R")
+    request.set_dob("01-12-1999")
+    request.set_first_name("Name")
+    request.set_last_name("Last Name")
+    request.set_ip_address("0.0.0.0")
+    set_urls(request)
+    if request_class is JSQuixItem:
+        request.set_prepay_token("55354a9e-c121-41e7-863e-e58a7653499e")
+    request.set_pay_sol_extended_data(create_quix_pay_sol_extended_data(item_count))
+    return request
+
+
+def create_h2h_redirection() -> H2HRedirection:
+    request = H2HRedirection()
+    request.set_amount("50")
+    request.set_currency(Currency.EUR)
+    request.set_country(CountryCodeAlpha2.ES)
+    request.set_card_number("4907270002222227")
+    request.set_customer_id("903")
+    request.set_merchant_transaction_id("33312")
+    request.set_ch_name("First name Last name")
+    request.set_cvn_number("123")
+    request.set_exp_date("0625")
+    request.set_payment_solution(PaymentSolutions.creditcards)
+    set_urls(request)
+    return request
+
+
+def create_h2h_void() -> H2HVoid:
+    request = H2HVoid()
+    request.set_payment_solution(PaymentSolutions.creditcards)
+    request.set_transaction_id("7817740")
+    request.set_merchant_transaction_id("12345")
+    return request
+
+
+def create_hosted_payment() -> HostedPaymentRedirection:
+    request = HostedPaymentRedirection()
+    request.set_amount("50")
+    request.set_currency(Currency.EUR)
+    request.set_country(CountryCodeAlpha2.ES)
+    request.set_customer_id("903")
+    request.set_merchant_transaction_id("3123123")
+    request.set_payment_solution(PaymentSolutions.creditcards)
+    set_urls(request)
+    return request
+
+
+def create_js_charge() -> JSCharge:
+    request = JSCharge()
+    request.set_amount("30")
+    request.set_prepay_token("55354a9e-c121-41e7-863e-e58a7653499e")
+    request.set_country(CountryCodeAlpha2.ES)
+    request.set_customer_id("55")
+    request.set_currency(Currency.EUR)
+    request.set_operation_type(OperationTypes.DEBIT)
+    request.set_payment_solution(PaymentSolutions.creditcards)
+    set_urls(request)
+    return request
+
+
+def create_benchmarks() -> Dict[str, Callable[[], object]]:
+    # Names are "<micro|macro>.<stage or adapter method>.<workload>". The workloads only depend on the code, so
+    # results of two runs on the same machine can be compared.
+    credentials = create_credentials()
+    key = credentials.get_merchant_pass().encode('utf-8')
+    benchmarks: Dict[str, Callable[[], object]] = {}
+
+    h2h_redirection = create_h2h_redirection()
+    h2h_redirection.set_credentials(credentials)
+    benchmarks["micro.generate_query.h2h_redirection"] = lambda: GeneralUtils.generate_query(h2h_redirection)
+    benchmarks["micro.query_serializer.h2h_redirection"] = lambda: QuerySerializer.generate_query(h2h_redirection)
+
+    for item_count in CART_SIZES:
+        workload = f"quix_cart_{item_count}"
+        hosted_quix_item = create_quix_item(HostedQuixItem, item_count)
+        hosted_quix_item.set_credentials(credentials)
+        js_quix_item = create_quix_item(JSQuixItem, item_count)
+        js_quix_item.set_credentials(credentials)
+        query = RequestUtils.hosted_quix_query(hosted_quix_item)
+        encoded_query = GeneralUtils.encode_url_bytes(query)
+
+        benchmarks[f"micro.hosted_quix_query.{workload}"] = \
+            lambda request=hosted_quix_item: RequestUtils.hosted_quix_query(request)
+        benchmarks[f"micro.encode_url.{workload}"] = lambda clear_query=query: GeneralUtils.encode_url(clear_query)
+        benchmarks[f"micro.cbc_encryption.{workload}"] = \
+            lambda data=encoded_query: SecurityUtils.cbc_encryption(data, key, FIXED_IV)
+        benchmarks[f"micro.encrypt_query.{workload}"] = \
+            lambda clear_query=query: RequestUtils.encrypt_query(clear_query, "116819", credentials)
+        benchmarks[f"micro.js_quix_body.{workload}"] = lambda request=js_quix_item: RequestUtils.js_quix_body(request)
+
+    for name in get_notification_corpus():
+        content = read_notification(name)
+        benchmarks[f"micro.parse_notification.{name}"] = \
+            lambda notification=content: notification_adapter.parse_notification(notification)
+
+    h2h_adapter = H2HPaymentAdapter(credentials, StaticNetworkAdapter(read_notification("h2h_response.xml")))
+    hosted_adapter = HostedPaymentAdapter(credentials, StaticNetworkAdapter("https://test.com/redirect"))
+    hosted_quix_adapter = HostedQuixPaymentAdapter(credentials, StaticNetworkAdapter("https://test.com/redirect"))
+    js_adapter = JSPaymentAdapter(credentials, StaticNetworkAdapter(read_notification("js_charge.json")))
+    js_quix_adapter = JSQuixPaymentAdapter(credentials, StaticNetworkAdapter(read_notification("js_quix.json")))
+
+    benchmarks["macro.send_h2h_payment_request.h2h_redirection"] = \
+        lambda: h2h_adapter.send_h2h_payment_request(create_h2h_redirection())
+    benchmarks["macro.send_h2h_void_request.h2h_void"] = lambda: h2h_adapter.send_h2h_void_request(create_h2h_void())
+    benchmarks["macro.send_hosted_payment_request.hosted_payment"] = \
+        lambda: hosted_adapter.send_hosted_payment_request(create_hosted_payment())
+    benchmarks["macro.send_js_charge_request.js_charge"] = lambda: js_adapter.send_js_charge_request(create_js_charge())
+    for item_count in CART_SIZES:
+        # The requests are built once: building a 1000 items cart would dominate the send.
+        hosted_quix_item = create_quix_item(HostedQuixItem, item_count)
+        js_quix_item = create_quix_item(JSQuixItem, item_count)
+        benchmarks[f"macro.send_hosted_quix_item_request.quix_cart_{item_count}"] = \
+            lambda request=hosted_quix_item: hosted_quix_adapter.send_hosted_quix_item_request(request)
+        benchmarks[f"macro.send_js_quix_item_request.quix_cart_{item_count}"] = \
+            lambda request=js_quix_item: js_quix_adapter.send_js_quix_item_request(request)
+    return benchmarks
+
+
+def run(pattern: str = None, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME,
+        benchmarks: Dict[str, Callable[[], object]] = None) -> dict:
+    # Each benchmark is calibrated to run at least min_time per repeat. best is the fastest repeat, which is the
+    # least affected by the machine load, so it is the one compared against the baseline.
+    if benchmarks is None:
+        benchmarks = create_benchmarks()
+    results = {}
+    for name, function in benchmarks.items():
+        if pattern is not None and pattern not in name:
+            continue
+        timer = timeit.Timer(function)
+        number = calibrate(timer, min_time)
+        timings = [timing / number * 1e6 for timing in timer.repeat(repeat=repeat, number=number)]
+        results[name] = {
+            "number": number,
+            "best_us": round(min(timings), 3),
+            "median_us": round(statistics.median(timings), 3),
+            "stdev_us": round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0
+        }
+    return {
+        "format": RESULTS_FORMAT,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "benchmarks": results
+    }
+
+
+def calibrate(timer: timeit.Timer, min_time: float) -> int:
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            return number
+        number *= 10 if number < 1000 else 2
+
+
+def compare(baseline: dict, current: dict,
+            threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, Optional[float], Optional[float], str]]:
+    # Returns (name, baseline us, current us, verdict) for the benchmarks of both results, and the ones only in one
+    # of them. A benchmark is a regression when it is more than threshold slower than the baseline.
+    rows = []
+    baseline_benchmarks = baseline["benchmarks"]
+    current_benchmarks = current["benchmarks"]
+    for name in sorted(set(baseline_benchmarks) | set(current_benchmarks)):
+        before = baseline_benchmarks.get(name, {}).get("best_us")
+        after = current_benchmarks.get(name, {}).get("best_us")
+        if before is None:
+            verdict = "new"
+        elif after is None:
+            verdict = "missing"
+        elif after > before * (1 + threshold):
+            verdict = "regression"
+        elif after < before * (1 - threshold):
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        rows.append((name, before, after, verdict))
+    return rows
+
+
+def has_regressions(rows: List[Tuple[str, Optional[float], Optional[float], str]]) -> bool:
+    return any(verdict == "regression" for _, _, _, verdict in rows)
+
+
+def print_results(results: dict):
+    print(f"{'benchmark':<64}{'best (us)':>14}{'median (us)':>14}")
+    for name, result in results["benchmarks"].items():
+        print(f"{name:<64}{result['best_us']:>14.2f}{result['median_us']:>14.2f}")
+
+
+def print_comparison(rows: List[Tuple[str, Optional[float], Optional[float], str]]):
+    print(f"{'benchmark':<64}{'baseline (us)':>14}{'current (us)':>14}{'change':>10}  verdict")
+    for name, before, after, verdict in rows:
+        change = f"{(after / before - 1) * 100:+.1f}%" if before and after else ""
+        before_text = f"{before:.2f}" if before is not None else "-"
+        after_text = f"{after:.2f}" if after is not None else "-"
+        print(f"{name:<64}{before_text:>14}{after_text:>14}{change:>10}  {verdict}")
+
+
+def load(path: str) -> dict:
+    with open(path, 'r', encoding="utf-8") as file:
+        results = json.load(file)
+    if results.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"{path} is not a benchmark results file of format {RESULTS_FORMAT}")
+    return results
+
+
+def main(arguments: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m sdk.benchmarks.benchmark_suite",
+                                     description="Micro and macro benchmarks of the SDK request path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks and write the results as JSON")
+    run_parser.add_argument("--output", help="results file, printed only when omitted")
+    run_parser.add_argument("--filter", help="only run the benchmarks whose name contains this text")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="seconds per repeat")
+    run_parser.add_argument("--baseline", help="results file to compare the run against")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser("compare", help="compare a results file against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="slowdown flagged as a regression, 0.10 is 10%%")
+
+    arguments = parser.parse_args(arguments)
+    if arguments.command == "run":
+        baseline = load(arguments.baseline) if arguments.baseline else None
+        if baseline is not None and arguments.filter:
+            baseline["benchmarks"] = {name: result for name, result in baseline["benchmarks"].items()
+                                      if arguments.filter in name}
+        current = run(arguments.filter, arguments.repeat, arguments.min_time)
+        if arguments.output:
+            with open(arguments.output, 'w', encoding="utf-8") as file:
+                json.dump(current, file, indent=2)
+        print_results(current)
+    else:
+        baseline = load(arguments.baseline)
+        current = load(arguments.current)
+
+    if baseline is None:
+        return 0
+    rows = compare(baseline, current, arguments.threshold)
+    print_comparison(rows)
+    # A non-zero exit code fails the CI job that gates on the baseline.
+    return 1 if has_regressions(rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import base64
+import timeit
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad
+
+from sdk.models.credentials import Credentials
+from sdk.utils.general_utils import GeneralUtils
+from sdk.utils.request_utils import RequestUtils
+from sdk.utils.security_utils import SecurityUtils
+
+NUMBER = 2000
+
+
+def legacy_encrypt_query(http_query: str, merchant_id: str, credentials: Credentials):
+    # The encrypted query path before the staged pipeline, kept here as the baseline.
+    formatted_request = bytearray(GeneralUtils.encode_url(http_query), 'utf-8')
+    clear_iv = SecurityUtils.generate_iv()
+    cipher = AES.new(bytearray(credentials.get_merchant_pass(), 'utf-8'), AES.MODE_CBC, clear_iv)
+    encrypted_request = cipher.encrypt(pad(formatted_request, AES.block_size))
+    signature = SecurityUtils.hash256(formatted_request)
+    headers = {
+        "apiVersion": str(credentials.get_api_version()),
+        "encryptionMode": "CBC",
+        "iv": base64.b64encode(clear_iv).decode('utf-8')
+    }
+    query_parameters = {
+        "merchantId": str(merchant_id),
+        "encrypted": base64.b64encode(encrypted_request).decode('utf-8'),
+        "integrityCheck": ''.join(f'{byte:02x}' for byte in signature).lower()
+    }
+    return headers, query_parameters
+
+
+def create_query(item_count: int) -> str:
+    items = ",".join(
+        f'{{"article":{{"name":"Article {index}","unitPrice":"10.00","category":"physical"}},"units":1,'
+        f'"totalPrice":"10.00"}}' for index in range(item_count)
+    )
+    return ("amount=50.0000&currency=EUR&country=ES&customerId=903&merchantTransactionId=33312"
+            "&paymentSolution=creditcards&statusUrl=https://test.com/status&successUrl=https://test.com/success"
+            f"&paysolExtendedData={{\"cart\":{{\"items\":[{items}]}}}}")
+
+
+def main():
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_api_version(5)
+
+    print(f"{'payload (bytes)':<18}{'legacy (us)':>14}{'pipeline (us)':>16}{'speedup':>10}")
+    for item_count in (0, 10, 300):
+        http_query = create_query(item_count)
+        legacy = min(timeit.repeat(lambda: legacy_encrypt_query(http_query, "116819", credentials),
+                                   number=NUMBER, repeat=5))
+        pipeline = min(timeit.repeat(lambda: RequestUtils.encrypt_query(http_query, "116819", credentials),
+                                     number=NUMBER, repeat=5))
+        print(f"{len(GeneralUtils.encode_url(http_query)):<18}{legacy / NUMBER * 1e6:>14.2f}"
+              f"{pipeline / NUMBER * 1e6:>16.2f}{legacy / pipeline:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
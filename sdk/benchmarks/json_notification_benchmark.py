@@ -0,0 +1,38 @@
+import json
+import os
+import timeit
+
+from sdk.adapters import notification_adapter
+from sdk.models.responses.notification import Response
+
+NUMBER = 500
+
+NOTIFICATIONS_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests",
+                                       "notifications")
+
+CORPUS = ("js_charge.json", "js_quix.json", os.path.join("sample_response", "notification.json"))
+
+
+def legacy_parse_json_notification(notification_string: str):
+    # The dataclasses_json path parse_notification used before the direct decoder, kept here as the baseline.
+    data = json.loads(notification_string)
+    if str(data["response"])[0] == '<':
+        raise ValueError("XML notifications are covered by xml_notification_benchmark")
+    return Response.from_json(notification_string).response
+
+
+def main():
+    print(f"{'notification':<36}{'legacy (us)':>14}{'direct (us)':>14}{'speedup':>10}")
+    for name in CORPUS:
+        with open(os.path.join(NOTIFICATIONS_DIRECTORY, name), 'r', encoding="utf-8") as file:
+            content = file.read()
+        assert notification_adapter.parse_notification(content) == legacy_parse_json_notification(content)
+
+        legacy = min(timeit.repeat(lambda: legacy_parse_json_notification(content), number=NUMBER, repeat=5))
+        direct = min(timeit.repeat(lambda: notification_adapter.parse_notification(content), number=NUMBER,
+                                   repeat=5))
+        print(f"{name:<36}{legacy / NUMBER * 1e6:>14.2f}{direct / NUMBER * 1e6:>14.2f}{legacy / direct:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
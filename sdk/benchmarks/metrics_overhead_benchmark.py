@@ -0,0 +1,60 @@
+import timeit
+
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.enums.environment import Environment
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.models.credentials import Credentials
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.sdk_metrics import SdkMetrics
+
+NUMBER = 2000
+REPEAT = 10
+
+RESPONSE = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?><response><operations><operation>'
+            '<merchantTransactionId>12345</merchantTransactionId><status>SUCCESS</status>'
+            '<transactionId>7817740</transactionId></operation></operations><status>SUCCESS</status></response>')
+
+
+class StaticNetworkAdapter(NetworkAdapter):
+
+    # pylint: disable-next=unused-argument
+    def send_request(self, headers, query_parameters, json, url, deadline=None, body=None):
+        return 200, RESPONSE
+
+
+def create_h2h_void() -> H2HVoid:
+    h2h_void = H2HVoid()
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_void.set_transaction_id("7817740")
+    h2h_void.set_merchant_transaction_id("12345")
+    return h2h_void
+
+
+def main():
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id("1168190001")
+    credentials.set_api_version(5)
+
+    plain = H2HPaymentAdapter(credentials, StaticNetworkAdapter())
+    measured = H2HPaymentAdapter(credentials, StaticNetworkAdapter())
+    metrics = SdkMetrics()
+    metrics.install(measured.get_pipeline())
+
+    # The two variants are timed alternately, so both see the same machine load.
+    without, with_metrics = [], []
+    for _ in range(REPEAT):
+        without.append(timeit.timeit(lambda: plain.send_h2h_void_request(create_h2h_void()), number=NUMBER))
+        with_metrics.append(timeit.timeit(lambda: measured.send_h2h_void_request(create_h2h_void()), number=NUMBER))
+    without, with_metrics = min(without), min(with_metrics)
+
+    print(f"{'without metrics (us)':<24}{'with metrics (us)':>20}{'overhead (us)':>16}")
+    print(f"{without / NUMBER * 1e6:<24.2f}{with_metrics / NUMBER * 1e6:>20.2f}"
+          f"{(with_metrics - without) / NUMBER * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
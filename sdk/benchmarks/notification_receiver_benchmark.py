@@ -0,0 +1,67 @@
+import io
+import os
+import threading
+import time
+
+from sdk.adapters.notification_receiver import NotificationReceiver
+
+NOTIFICATIONS = 20000
+CLIENTS = 8
+
+NOTIFICATIONS_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests",
+                                       "notifications")
+
+# One transaction as the gateway reports it: TRA, 3DSv2 and the final notification.
+CORPUS = ("4907270002222227.xml", "js_charge.json", "js_quix.json")
+
+
+def post(receiver: NotificationReceiver, body: bytes) -> str:
+    statuses = []
+    environ = {"REQUEST_METHOD": "POST", "CONTENT_LENGTH": str(len(body)), "wsgi.input": io.BytesIO(body)}
+    receiver.wsgi_app(environ, lambda status, headers: statuses.append(status))
+    return statuses[0]
+
+
+def run(workers: int, lazy: bool):
+    bodies = []
+    for name in CORPUS:
+        with open(os.path.join(NOTIFICATIONS_DIRECTORY, name), 'rb') as file:
+            bodies.append(file.read())
+
+    results = []
+    receiver = NotificationReceiver(lambda notification: results.append(notification.get_transaction_result()),
+                                    workers=workers, lazy=lazy)
+    receiver.start()
+
+    def client(count: int):
+        for index in range(count):
+            while post(receiver, bodies[index % len(bodies)]) != "200 OK":
+                # The gateway retries a rejected notification, here after a short pause.
+                time.sleep(0.001)
+
+    started_at = time.perf_counter()
+    clients = [threading.Thread(target=client, args=(NOTIFICATIONS // CLIENTS,)) for _ in range(CLIENTS)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    accepted_at = time.perf_counter()
+    receiver.join()
+    finished_at = time.perf_counter()
+    receiver.stop()
+
+    assert len(results) == receiver.get_processed() == receiver.get_received()
+    return (receiver.get_received() / (accepted_at - started_at), receiver.get_processed() / (finished_at - started_at),
+            receiver.get_rejected())
+
+
+def main():
+    print(f"{'workers':<10}{'lazy':<8}{'accepted (/s)':>16}{'processed (/s)':>16}{'rejected':>10}")
+    for workers in (1, 4):
+        for lazy in (False, True):
+            accepted, processed, rejected = run(workers, lazy)
+            print(f"{workers:<10}{str(lazy):<8}{accepted:>16.0f}{processed:>16.0f}{rejected:>10}")
+
+
+if __name__ == "__main__":
+    main()
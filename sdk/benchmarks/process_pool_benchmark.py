@@ -0,0 +1,44 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sdk.adapters.hosted_quix_payment_adapter import HostedQuixPaymentAdapter
+from sdk.adapters.process_pool_preparer import ProcessPoolPreparer
+from sdk.benchmarks.benchmark_suite import create_credentials, create_quix_item
+from sdk.loadtest.stub_network_adapter import StubNetworkAdapter
+from sdk.models.requests.quix_hosted.hosted_quix_item import HostedQuixItem
+
+THREADS = 16
+REQUESTS = 400
+CART_ITEMS = 300
+CPU_COUNT = os.cpu_count() or 1
+
+
+def measure(preparer: ProcessPoolPreparer = None) -> float:
+    # Requests per second of hosted Quix carts sent by THREADS threads through one adapter and its pooled stub.
+    adapter = HostedQuixPaymentAdapter(create_credentials(), StubNetworkAdapter())
+    if preparer is not None:
+        preparer.install(adapter.get_pipeline())
+    requests = [create_quix_item(HostedQuixItem, CART_ITEMS) for _ in range(THREADS)]
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(adapter.send_hosted_quix_item_request, requests))
+        started_at = time.perf_counter()
+        list(executor.map(lambda index: adapter.send_hosted_quix_item_request(requests[index % THREADS]),
+                          range(REQUESTS)))
+        return REQUESTS / (time.perf_counter() - started_at)
+
+
+def main():
+    print(f"{CPU_COUNT} CPUs, {THREADS} threads, {CART_ITEMS} cart items")
+    in_process = measure()
+    print(f"{'workers':<10}{'requests/s':>12}{'speedup':>10}")
+    print(f"{'none':<10}{in_process:>12.1f}{1:>9.1f}x")
+    for workers in sorted({1, 2, 4, CPU_COUNT}):
+        with ProcessPoolPreparer(workers) as preparer:
+            preparer.warm_up()
+            offloaded = measure(preparer)
+        print(f"{workers:<10}{offloaded:>12.1f}{offloaded / in_process:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import timeit
+
+from sdk.enums.country_code import CountryCodeAlpha2
+from sdk.enums.currency import Currency
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.models.credentials import Credentials
+from sdk.models.requests.h2h.h2h_payment_recurrent_initial import H2HPaymentRecurrentInitial
+from sdk.models.requests.h2h.h2h_redirection import H2HRedirection
+from sdk.models.requests.hosted.hosted_payment_redirection import HostedPaymentRedirection
+from sdk.utils.general_utils import GeneralUtils
+from sdk.utils.query_serializer import QuerySerializer
+
+NUMBER = 20000
+
+
+def create_request(request_class):
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_product_id("1168190001")
+
+    request = request_class()
+    request.set_amount("50.4321222")
+    request.set_currency(Currency.EUR)
+    request.set_country(CountryCodeAlpha2.ES)
+    request.set_customer_id("903")
+    request.set_merchant_transaction_id("33312")
+    request.set_payment_solution(PaymentSolutions.creditcards)
+    request.set_status_url("https://test.com/status")
+    request.set_success_url("https://test.com/success")
+    request.set_error_url("https://test.com/fail")
+    request.set_awaiting_url("https://test.com/await")
+    request.set_cancel_url("https://test.com/cancel")
+    request.set_merchant_params([("name", "pablo"), ("surname", "ferrer")])
+    request.set_credentials(credentials)
+    return request
+
+
+def main():
+    print(f"{'request':<30}{'reflection (us)':>18}{'compiled (us)':>18}{'speedup':>10}")
+    for request_class in (H2HRedirection, H2HPaymentRecurrentInitial, HostedPaymentRedirection):
+        request = create_request(request_class)
+        assert QuerySerializer.generate_query(request) == GeneralUtils.generate_query(request)
+
+        reflection = min(timeit.repeat(lambda: GeneralUtils.generate_query(request), number=NUMBER, repeat=5))
+        compiled = min(timeit.repeat(lambda: QuerySerializer.generate_query(request), number=NUMBER, repeat=5))
+        print(f"{request_class.__name__:<30}{reflection / NUMBER * 1e6:>18.2f}{compiled / NUMBER * 1e6:>18.2f}"
+              f"{reflection / compiled:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import glob
+import os
+import timeit
+import xml.etree.ElementTree as ElementTree
+
+from sdk.adapters import notification_adapter
+from sdk.adapters.notification_adapter import xml_to_dict
+from sdk.models.responses.notification import *
+
+NUMBER = 500
+
+NOTIFICATIONS_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests",
+                                       "notifications")
+
+
+# The find() based walker parse_notification used before the single-pass parser, kept here as the baseline.
+
+def legacy_get_text(element, tag):
+    found = element.find(tag)
+    return found.text if found is not None else None
+
+
+def legacy_get_enum_value(cls, str_value: str):
+    try:
+        return cls[str_value] if str_value is not None else None
+    except KeyError:
+        return None
+
+
+def legacy_xml_to_dataclass(element):
+    if element is None:
+        return None
+    if element.tag == "response" or element.tag == "payfrex-response":
+        return Notification(
+            message=legacy_get_text(element, "message"),
+            status=legacy_get_text(element, "status"),
+            operations=[legacy_xml_to_dataclass(op) for op in element.find("operations")],
+            workFlowResponse=legacy_xml_to_dataclass(element.find("workFlowResponse")),
+            optionalTransactionParams=legacy_xml_to_dataclass(element.find("optionalTransactionParams")),
+        )
+    elif element.tag == "operation":
+        return Operation(
+            amount=float(legacy_get_text(element, "amount")) if legacy_get_text(element, "amount") else None,
+            currency=legacy_get_enum_value(Currency, legacy_get_text(element, "currency")),
+            details=legacy_get_text(element, "details"),
+            merchantTransactionId=legacy_get_text(element, "merchantTransactionId"),
+            paySolTransactionId=legacy_get_text(element, "paySolTransactionId"),
+            service=legacy_get_text(element, "service"),
+            status=legacy_get_text(element, "status"),
+            transactionId=legacy_get_text(element, "transactionId"),
+            respCode=legacy_xml_to_dataclass(element.find("respCode")),
+            operationType=legacy_get_enum_value(OperationTypes, legacy_get_text(element, "operationType")),
+            paymentDetails=legacy_xml_to_dataclass(element.find("paymentDetails")),
+            mpi=legacy_xml_to_dataclass(element.find("mpi")),
+            paymentCode=legacy_get_text(element, "paymentCode"),
+            paymentMessage=legacy_get_text(element, "paymentMessage"),
+            message=legacy_get_text(element, "message"),
+            paymentMethod=legacy_get_text(element, "paymentMethod"),
+            paymentSolution=legacy_get_enum_value(PaymentSolutions, legacy_get_text(element, "paymentSolution")),
+            authCode=legacy_get_text(element, "authCode"),
+            rad=legacy_get_text(element, "rad"),
+            radMessage=legacy_get_text(element, "radMessage"),
+            redirectionResponse=legacy_get_text(element, "redirectionResponse"),
+            subscriptionPlan=legacy_get_text(element, "subscriptionPlan"),
+            optionalTransactionParams=legacy_xml_to_dataclass(element.find("optionalTransactionParams")),
+        )
+    elif element.tag == "respCode":
+        return ResponseCode(
+            code=legacy_get_text(element, "code"),
+            message=legacy_get_text(element, "message"),
+            uuid=legacy_get_text(element, "uuid"),
+        )
+    elif element.tag == "paymentDetails":
+        return PaymentDetails(
+            cardNumberToken=legacy_get_text(element, "cardNumberToken"),
+            account=legacy_get_text(element, "account"),
+            cardHolderName=legacy_get_text(element, "cardHolderName"),
+            cardNumber=legacy_get_text(element, "cardNumber"),
+            cardType=legacy_get_text(element, "cardType"),
+            expDate=legacy_get_text(element, "expDate"),
+            issuerBank=legacy_get_text(element, "issuerBank"),
+            issuerCountry=legacy_get_text(element, "issuerCountry"),
+            extraDetails=legacy_xml_to_dataclass(element.find("extraDetails")),
+        )
+    elif element.tag == "extraDetails":
+        xml_dict = xml_to_dict(element)
+        return ExtraDetails(
+            entry=[legacy_xml_to_dataclass(entry) for entry in element],
+        ) if xml_dict is not None else ExtraDetails()
+    elif element.tag == "optionalTransactionParams":
+        xml_dict = xml_to_dict(element)
+        return OptionalTransactionParams(
+            entry=[legacy_xml_to_dataclass(entry) for entry in element],
+        ) if xml_dict is not None else OptionalTransactionParams()
+    elif element.tag == "entry":
+        xml_dict = xml_to_dict(element)
+        return Entry(
+            key=xml_dict["key"], value=xml_dict["value"]
+        )
+    elif element.tag == "mpi":
+        return Mpi(
+            acsTransID=legacy_get_text(element, "acsTransID"),
+            authMethod=legacy_get_text(element, "authMethod"),
+            authTimestamp=legacy_get_text(element, "authTimestamp"),
+            authenticationStatus=legacy_get_text(element, "authenticationStatus"),
+            cavv=legacy_get_text(element, "cavv"),
+            eci=legacy_get_text(element, "eci"),
+            messageVersion=legacy_get_text(element, "messageVersion"),
+            threeDSSessionData=legacy_get_text(element, "threeDSSessionData"),
+            threeDSv2Token=legacy_get_text(element, "threeDSv2Token"),
+        )
+    elif element.tag == "workFlowResponse":
+        return WorkFlowResponse(
+            id=legacy_get_text(element, "id"),
+            name=legacy_get_text(element, "name"),
+            version=legacy_get_text(element, "version"),
+        )
+
+
+def load_corpus():
+    paths = sorted(glob.glob(os.path.join(NOTIFICATIONS_DIRECTORY, "*.xml"))
+                   + glob.glob(os.path.join(NOTIFICATIONS_DIRECTORY, "sample_response", "*.xml")))
+    corpus = []
+    for path in paths:
+        with open(path, 'r', encoding="utf-8") as file:
+            corpus.append((os.path.relpath(path, NOTIFICATIONS_DIRECTORY), file.read()))
+    return corpus
+
+
+def main():
+    print(f"{'notification':<36}{'legacy (us)':>14}{'single-pass (us)':>18}{'speedup':>10}")
+    total_legacy = total_single_pass = 0
+    for name, content in load_corpus():
+        assert notification_adapter.parse_notification(content) == \
+            legacy_xml_to_dataclass(ElementTree.fromstring(content))
+
+        legacy = min(timeit.repeat(lambda: legacy_xml_to_dataclass(ElementTree.fromstring(content)),
+                                   number=NUMBER, repeat=5))
+        single_pass = min(timeit.repeat(lambda: notification_adapter.parse_notification(content),
+                                        number=NUMBER, repeat=5))
+        total_legacy += legacy
+        total_single_pass += single_pass
+        print(f"{name:<36}{legacy / NUMBER * 1e6:>14.2f}{single_pass / NUMBER * 1e6:>18.2f}"
+              f"{legacy / single_pass:>9.1f}x")
+    print(f"{'total':<36}{total_legacy / NUMBER * 1e6:>14.2f}{total_single_pass / NUMBER * 1e6:>18.2f}"
+          f"{total_legacy / total_single_pass:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import argparse
+import time
+
+from sdk.emulator.gateway_emulator import GatewayEmulator
+from sdk.models.credentials import Credentials
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m sdk.emulator", description="Local AddonPayments gateway emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--merchant-id", required=True)
+    parser.add_argument("--merchant-pass", required=True)
+    parser.add_argument("--merchant-key")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="random extra seconds, up to this value")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=GatewayEmulator.DEFAULT_ERROR_STATUS)
+    arguments = parser.parse_args()
+
+    credentials = Credentials()
+    credentials.set_merchant_id(arguments.merchant_id)
+    credentials.set_merchant_pass(arguments.merchant_pass)
+    if arguments.merchant_key is not None:
+        credentials.set_merchant_key(arguments.merchant_key)
+
+    emulator = GatewayEmulator(credentials, arguments.latency, arguments.latency_jitter, arguments.error_rate,
+                               arguments.error_status)
+    print(f"Gateway emulator listening on {emulator.start(arguments.host, arguments.port)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        emulator.stop()
+
+
+if __name__ == "__main__":
+    main()
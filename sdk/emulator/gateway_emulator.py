@@ -0,0 +1,315 @@
+import base64
+import binascii
+import hashlib
+import itertools
+import json
+import random
+import threading
+import time
+import urllib.parse
+import uuid
+import xml.etree.ElementTree as ElementTree
+from socketserver import ThreadingMixIn
+from typing import Dict, Optional, Tuple
+from wsgiref.simple_server import WSGIServer, WSGIRequestHandler, make_server
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import unpad
+
+from sdk.enums.endpoint_family import EndpointFamily
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.credentials import Credentials
+
+
+class GatewayEmulator:
+    # Local stand-in for the AddonPayments endpoints. H2H and tokenize requests are decrypted with the merchant
+    # pass and their integrityCheck verified, like the gateway does, and every endpoint answers in the same
+    # format as the real one. Latency and HTTP errors can be injected to test the adapters end to end offline.
+    DEFAULT_ERROR_STATUS: int = 503
+    XML_DECLARATION: str = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+
+    __FAMILIES_BY_PATH: Dict[str, EndpointFamily] = {
+        urllib.parse.urlparse(endpoint.value).path: EndpointFamily.get_by_endpoint(endpoint) for endpoint in Endpoints
+    }
+    __OPERATION_TYPES = {
+        EndpointFamily.CAPTURE: "CAPTURE",
+        EndpointFamily.VOID: "VOID",
+        EndpointFamily.REBATE: "REBATE",
+    }
+    __REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 405: "Method Not Allowed",
+                 429: "Too Many Requests", 500: "Internal Server Error", 502: "Bad Gateway",
+                 503: "Service Unavailable", 504: "Gateway Timeout"}
+
+    class __Server(ThreadingMixIn, WSGIServer):
+        daemon_threads = True
+
+    class __QuietHandler(WSGIRequestHandler):
+
+        def log_message(self, format, *args):
+            pass
+
+    def __init__(self, credentials: Credentials = None, latency: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = DEFAULT_ERROR_STATUS, seed: int = None):
+        self.__merchants: Dict[str, Credentials] = {}
+        self.__lock = threading.Lock()
+        self.__random = random.Random(seed)
+        self.__transaction_ids = itertools.count(7000000)
+        self.__latency = 0.0
+        self.__latency_jitter = 0.0
+        self.__error_rate = 0.0
+        self.__error_status = error_status
+        self.__forced_errors = []
+        self.__requests: Dict[EndpointFamily, int] = {}
+        self.__rejected = 0
+        self.__injected_errors = 0
+        self.__server = None
+        self.__thread: Optional[threading.Thread] = None
+        self.set_latency(latency, latency_jitter)
+        self.set_error_rate(error_rate, error_status)
+        if credentials is not None:
+            self.add_merchant(credentials)
+
+    def add_merchant(self, credentials: Credentials):
+        # Requests are checked against the merchantPass (H2H, tokenize) and merchantKey (JS) of their merchantId.
+        self.__merchants[str(credentials.get_merchant_id())] = credentials
+
+    def set_latency(self, latency: float, latency_jitter: float = 0.0):
+        if latency is None or latency < 0 or latency_jitter is None or latency_jitter < 0:
+            raise InvalidFieldException("latency: Should be (latency >= 0 and latencyJitter >= 0)")
+        self.__latency = latency
+        self.__latency_jitter = latency_jitter
+
+    def set_error_rate(self, error_rate: float, error_status: int = DEFAULT_ERROR_STATUS):
+        if error_rate is None or not 0 <= error_rate <= 1:
+            raise InvalidFieldException("errorRate: Should be (0 <= errorRate <= 1)")
+        self.__error_rate = error_rate
+        self.__error_status = error_status
+
+    def fail_next(self, count: int = 1, status: int = DEFAULT_ERROR_STATUS):
+        # The next count requests are answered with status, before any check.
+        with self.__lock:
+            self.__forced_errors.extend([status] * count)
+
+    def get_request_count(self, family: EndpointFamily = None) -> int:
+        if family is None:
+            return sum(self.__requests.values())
+        return self.__requests.get(family, 0)
+
+    def get_rejected_count(self) -> int:
+        return self.__rejected
+
+    def get_injected_error_count(self) -> int:
+        return self.__injected_errors
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        # Port 0 picks a free port. Returns the base URL of the emulator.
+        if self.__server is not None:
+            return self.get_base_url()
+        self.__server = make_server(host, port, self.wsgi_app, server_class=GatewayEmulator.__Server,
+                                    handler_class=GatewayEmulator.__QuietHandler)
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="gateway-emulator", daemon=True)
+        self.__thread.start()
+        return self.get_base_url()
+
+    def stop(self):
+        if self.__server is None:
+            return
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
+        self.__server = None
+        self.__thread = None
+
+    def __enter__(self) -> 'GatewayEmulator':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def get_base_url(self) -> Optional[str]:
+        if self.__server is None:
+            return None
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def get_url(self, endpoint: Endpoints) -> str:
+        return self.get_base_url() + urllib.parse.urlparse(endpoint.value).path
+
+    def install(self, pipeline):
+        # Sends the requests of the pipeline to the emulator instead of the endpoint picked for the credentials.
+        pipeline.add_middleware(self.__redirect, [PipelineStage.ENDPOINT])
+
+    def uninstall(self, pipeline):
+        pipeline.remove_middleware(self.__redirect)
+
+    def wsgi_app(self, environ, start_response):
+        length = environ.get("CONTENT_LENGTH") or "0"
+        stream = environ.get("wsgi.input")
+        body = stream.read(int(length)) if stream is not None and length.isdigit() and int(length) > 0 else b""
+        headers = {key[5:].replace("_", "").lower(): value for key, value in environ.items()
+                   if key.startswith("HTTP_")}
+        status, content_type, content = self.handle(
+            environ.get("REQUEST_METHOD"), environ.get("PATH_INFO", ""), headers,
+            dict(urllib.parse.parse_qsl(environ.get("QUERY_STRING", ""), keep_blank_values=True)), body
+        )
+        content = content.encode("utf-8")
+        start_response(f"{status} {GatewayEmulator.__REASONS.get(status, 'Unknown')}",
+                       [("Content-Type", f"{content_type}; charset=utf-8"), ("Content-Length", str(len(content)))])
+        return [content]
+
+    def handle(self, method: str, path: str, headers: Dict[str, str], query_parameters: Dict[str, str],
+               body: bytes) -> Tuple[int, str, str]:
+        # headers are keyed by their lowercase name without dashes. Returns (status, content type, content).
+        family = GatewayEmulator.__FAMILIES_BY_PATH.get(path)
+        if family is None:
+            return self.__reject(404, "Unknown endpoint")
+        if method != "POST":
+            return self.__reject(405, "Method Not Allowed")
+        with self.__lock:
+            self.__requests[family] = self.__requests.get(family, 0) + 1
+            forced_status = self.__forced_errors.pop(0) if self.__forced_errors else None
+            injected = forced_status is not None or self.__random.random() < self.__error_rate
+            delay = self.__latency + (self.__random.uniform(0, self.__latency_jitter) if self.__latency_jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+        if injected:
+            with self.__lock:
+                self.__injected_errors += 1
+            status = forced_status if forced_status is not None else self.__error_status
+            return status, "text/plain", GatewayEmulator.__REASONS.get(status, "Error")
+
+        if family == EndpointFamily.JS_AUTH:
+            return self.__authorize(body)
+        if family == EndpointFamily.JS_CHARGE:
+            return self.__charge(headers, body)
+        fields, error = self.__decrypt(headers, query_parameters)
+        if error is not None:
+            return self.__reject(400, error)
+        if family == EndpointFamily.TOKENIZE:
+            return 200, "text/plain", f"{self.get_base_url() or ''}/EPGCheckout/rest/online/redirect/{uuid.uuid4()}"
+        return 200, "application/xml", GatewayEmulator.__to_xml(self.__notification(family, fields))
+
+    def __redirect(self, _stage, context, proceed):
+        result = proceed()
+        context.set_url(self.get_url(context.get_endpoint()))
+        return result
+
+    def __reject(self, status: int, message: str) -> Tuple[int, str, str]:
+        with self.__lock:
+            self.__rejected += 1
+        return status, "text/plain", message
+
+    def __decrypt(self, headers: Dict[str, str], query_parameters: Dict[str, str]):
+        credentials = self.__merchants.get(query_parameters.get("merchantId"))
+        if credentials is None:
+            return None, "Unknown merchantId"
+        if headers.get("encryptionmode") != "CBC" or not headers.get("apiversion"):
+            return None, "Missing apiVersion or encryptionMode"
+        try:
+            cipher = AES.new(credentials.get_merchant_pass().encode("utf-8"), AES.MODE_CBC,
+                             base64.b64decode(headers.get("iv", ""), validate=True))
+            clear = unpad(cipher.decrypt(base64.b64decode(query_parameters.get("encrypted", ""), validate=True)),
+                          AES.block_size)
+        except (ValueError, binascii.Error):
+            return None, "Invalid encrypted payload"
+        if hashlib.sha256(clear).hexdigest() != query_parameters.get("integrityCheck", "").lower():
+            return None, "Invalid integrityCheck"
+        fields = dict(urllib.parse.parse_qsl(clear.decode("utf-8"), keep_blank_values=True))
+        if fields.get("merchantId") != query_parameters.get("merchantId"):
+            return None, "merchantId does not match the encrypted payload"
+        return fields, None
+
+    def __authorize(self, body: bytes) -> Tuple[int, str, str]:
+        fields = GatewayEmulator.__read_json(body)
+        credentials = self.__merchants.get(str(fields.get("merchantId"))) if fields is not None else None
+        if credentials is None:
+            return self.__reject(401, "Unknown merchantId")
+        if credentials.get_merchant_key() is not None and fields.get("merchantKey") != credentials.get_merchant_key():
+            return self.__reject(401, "Invalid merchantKey")
+        return 200, "application/json", json.dumps({"authToken": str(uuid.uuid4())})
+
+    def __charge(self, headers: Dict[str, str], body: bytes) -> Tuple[int, str, str]:
+        fields = GatewayEmulator.__read_json(body)
+        if fields is None or str(fields.get("merchantId")) not in self.__merchants:
+            return self.__reject(401, "Unknown merchantId")
+        if not headers.get("prepaytoken"):
+            return self.__reject(400, "Missing prepayToken")
+        notification = self.__notification(EndpointFamily.JS_CHARGE, {key: str(value) for key, value in
+                                                                      fields.items() if value is not None})
+        return 200, "application/json", GatewayEmulator.__to_json(notification)
+
+    def __notification(self, family: EndpointFamily, fields: Dict[str, str]) -> dict:
+        # Like the gateway, a payment (H2H pay or JS charge) passes its TRA check first and ends with the payment
+        # operation, which has no service. Capture, void and refund only have their own operation.
+        transaction_id = str(next(self.__transaction_ids))
+        operation_type = GatewayEmulator.__OPERATION_TYPES.get(family)
+        operations = [] if operation_type is not None else [self.__operation(fields, transaction_id, "TRA")]
+        operations.append(self.__operation(fields, transaction_id, None, operation_type))
+        return {
+            "message": f"WorkFlow has finished successfully, for transaction Id: {transaction_id}",
+            "status": "SUCCESS",
+            "operations": operations,
+        }
+
+    @staticmethod
+    def __operation(fields: Dict[str, str], transaction_id: str, service: Optional[str],
+                    operation_type: str = None) -> dict:
+        return {
+            "amount": fields.get("amount"),
+            "currency": fields.get("currency"),
+            "merchantTransactionId": fields.get("merchantTransactionId"),
+            "message": "Success",
+            "operationType": operation_type if operation_type is not None else fields.get("operationType", "DEBIT"),
+            "originalTransactionId": fields.get("transactionId"),
+            "paySolTransactionId": str(uuid.uuid4()),
+            "paymentSolution": fields.get("paymentSolution"),
+            "service": service,
+            "status": "SUCCESS",
+            "transactionId": transaction_id,
+            "respCode": {"code": "0000", "message": "Successful", "uuid": uuid.uuid4().hex},
+        }
+
+    @staticmethod
+    def __read_json(body: bytes) -> Optional[dict]:
+        try:
+            fields = json.loads(body.decode("utf-8"))
+        except (ValueError, UnicodeDecodeError):
+            return None
+        return fields if isinstance(fields, dict) else None
+
+    @staticmethod
+    def __to_xml(notification: dict) -> str:
+        root = ElementTree.Element("response", {"operation-size": str(len(notification["operations"]))})
+        ElementTree.SubElement(root, "message").text = notification["message"]
+        operations = ElementTree.SubElement(root, "operations")
+        for index, operation in enumerate(notification["operations"], 1):
+            element = ElementTree.SubElement(operations, "operation", {"sorted-order": str(index)})
+            for key, value in operation.items():
+                if isinstance(value, dict):
+                    child = ElementTree.SubElement(element, key)
+                    for nested_key, nested_value in value.items():
+                        ElementTree.SubElement(child, nested_key).text = nested_value
+                elif value is not None:
+                    ElementTree.SubElement(element, key).text = value
+        ElementTree.SubElement(root, "status").text = notification["status"]
+        return GatewayEmulator.XML_DECLARATION + ElementTree.tostring(root, encoding="unicode")
+
+    @staticmethod
+    def __to_json(notification: dict) -> str:
+        # Same layout as the charge/v2 responses: operationsArray, with payFrexTransactionId next to transactionId.
+        operations = []
+        for index, operation in enumerate(notification["operations"], 1):
+            operation = dict(operation, type="operation", sortedOrder=index)
+            operation["payFrexTransactionId"] = int(operation["transactionId"])
+            operation["respCode"] = dict(operation["respCode"], type="respCode")
+            operations.append(operation)
+        return json.dumps({"response": {
+            "status": notification["status"],
+            "message": notification["message"],
+            "optionalTransactionParams": {},
+            "operationSize": len(operations),
+            "operationsArray": operations,
+        }})
@@ -0,0 +1,39 @@
+from enum import Enum
+
+from sdk.enums.endpoints import Endpoints
+
+
+class EndpointFamily(Enum):
+    H2H_PAY = "H2H_PAY"
+    CAPTURE = "CAPTURE"
+    VOID = "VOID"
+    REBATE = "REBATE"
+    JS_AUTH = "JS_AUTH"
+    JS_CHARGE = "JS_CHARGE"
+    TOKENIZE = "TOKENIZE"
+
+    @staticmethod
+    def get_by_endpoint(endpoint: Endpoints):
+        return _ENDPOINT_FAMILIES.get(endpoint)
+
+    @staticmethod
+    def get_by_url(url: str):
+        return _ENDPOINT_FAMILIES.get(Endpoints.get_by_url(url))
+
+
+_ENDPOINT_FAMILIES = {
+    Endpoints.H2H_ENDPOINT_STG: EndpointFamily.H2H_PAY,
+    Endpoints.H2H_ENDPOINT_PROD: EndpointFamily.H2H_PAY,
+    Endpoints.CAPTURE_ENDPOINT_STG: EndpointFamily.CAPTURE,
+    Endpoints.CAPTURE_ENDPOINT_PROD: EndpointFamily.CAPTURE,
+    Endpoints.VOID_ENDPOINT_STG: EndpointFamily.VOID,
+    Endpoints.VOID_ENDPOINT_PROD: EndpointFamily.VOID,
+    Endpoints.REFUND_ENDPOINT_STG: EndpointFamily.REBATE,
+    Endpoints.REFUND_ENDPOINT_PROD: EndpointFamily.REBATE,
+    Endpoints.AUTH_ENDPOINT_STG: EndpointFamily.JS_AUTH,
+    Endpoints.AUTH_ENDPOINT_PROD: EndpointFamily.JS_AUTH,
+    Endpoints.CHARGE_ENDPOINT_STG: EndpointFamily.JS_CHARGE,
+    Endpoints.CHARGE_ENDPOINT_PROD: EndpointFamily.JS_CHARGE,
+    Endpoints.HOSTED_ENDPOINT_STG: EndpointFamily.TOKENIZE,
+    Endpoints.HOSTED_ENDPOINT_PROD: EndpointFamily.TOKENIZE,
+}
@@ -16,3 +16,10 @@ class Endpoints(Enum):
     AUTH_ENDPOINT_PROD = "https://epgjs-mep.addonpayments.com/auth"
     HOSTED_ENDPOINT_STG = "https://checkout-stg.addonpayments.com/EPGCheckout/rest/online/tokenize"
     HOSTED_ENDPOINT_PROD = "https://checkout.addonpayments.com/EPGCheckout/rest/online/tokenize"
+
+    @staticmethod
+    def get_by_url(url: str):
+        try:
+            return Endpoints(url)
+        except ValueError:
+            return None
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class Idempotency(Enum):
+    # Safe to send again for the same transactionId, retried on network errors and on transient HTTP errors.
+    IDEMPOTENT = "IDEMPOTENT"
+    # Deduplicated by the gateway on merchantTransactionId. Retried when the connection failed, so the request never
+    # left. Retried on other network errors only when the RetryPolicy trusts the gateway deduplication.
+    DEDUPLICATED = "DEDUPLICATED"
+    # Never retried.
+    NON_IDEMPOTENT = "NON_IDEMPOTENT"
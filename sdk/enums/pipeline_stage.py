@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class PipelineStage(Enum):
+    CHECK_CREDENTIALS = "CHECK_CREDENTIALS"
+    ENDPOINT = "ENDPOINT"
+    SET_CREDENTIALS = "SET_CREDENTIALS"
+    VALIDATE = "VALIDATE"
+    SERIALIZE = "SERIALIZE"
+    ENCRYPT = "ENCRYPT"
+    SEND = "SEND"
+    MAP_RESPONSE = "MAP_RESPONSE"
@@ -0,0 +1,121 @@
+import argparse
+import json
+import sys
+import urllib.parse
+from typing import List
+
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.adapters.recording_network_adapter import RecordingNetworkAdapter
+from sdk.adapters.replay_network_adapter import ReplayNetworkAdapter
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.benchmarks.benchmark_suite import create_credentials
+from sdk.emulator.gateway_emulator import GatewayEmulator
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.loadtest.load_generator import LoadGenerator
+from sdk.loadtest.stub_network_adapter import StubNetworkAdapter
+from sdk.loadtest.transaction_mix import TransactionMix
+from sdk.models.cassette import Cassette
+
+STUB = "stub"
+EMULATOR = "emulator"
+URL = "url"
+REPLAY = "replay"
+
+
+def send_to(pipeline: RequestPipeline, base_url: str):
+    # Sends the requests of the pipeline to base_url, for an emulator started with python -m sdk.emulator.
+    def redirect(_stage, context, proceed):
+        result = proceed()
+        context.set_url(base_url.rstrip("/") + urllib.parse.urlparse(context.get_endpoint().value).path)
+        return result
+
+    pipeline.add_middleware(redirect, [PipelineStage.ENDPOINT])
+
+
+def main(arguments: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m sdk.loadtest",
+                                     description="Sends a mix of transactions through the SDK and reports the "
+                                                 "throughput, latency percentiles, CPU per request and errors")
+    parser.add_argument("--mode", choices=(LoadGenerator.CLOSED_LOOP, LoadGenerator.OPEN_LOOP),
+                        default=LoadGenerator.CLOSED_LOOP)
+    parser.add_argument("--rps", type=float, help="transactions started per second, for the open loop mode")
+    parser.add_argument("--concurrency", type=int, default=LoadGenerator.DEFAULT_CONCURRENCY,
+                        help="worker threads")
+    parser.add_argument("--duration", type=float, default=LoadGenerator.DEFAULT_DURATION, help="seconds")
+    parser.add_argument("--transactions", type=int, help="stop after this many transactions")
+    parser.add_argument("--mix", help="weights such as h2h_debit=50,preauth_capture=20,refund=10,js_charge=15,"
+                                      "quix_hosted=5")
+    parser.add_argument("--cart-items", type=int, default=TransactionMix.DEFAULT_CART_ITEMS,
+                        help="items in the Quix hosted carts")
+    parser.add_argument("--seed", type=int, help="seed of the transaction choice")
+    parser.add_argument("--transport", choices=(STUB, EMULATOR, URL, REPLAY), default=STUB,
+                        help="stub: canned responses in process, emulator: a GatewayEmulator started in process, "
+                             "url: an emulator already running at --url, replay: the responses of --cassette")
+    parser.add_argument("--url", help="base URL of the emulator for the url transport")
+    parser.add_argument("--cassette", help="cassette replayed by the replay transport")
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="factor applied to the recorded latencies by the replay transport")
+    parser.add_argument("--record", help="records the requests and responses to this cassette")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added by the stub or the emulator")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of failed requests, stub or emulator")
+    parser.add_argument("--merchant-id")
+    parser.add_argument("--merchant-pass")
+    parser.add_argument("--merchant-key")
+    parser.add_argument("--json", help="also write the report as JSON to this file")
+    arguments = parser.parse_args(arguments)
+    if arguments.transport == URL and not arguments.url:
+        parser.error("--url is required with the url transport")
+    if arguments.transport == REPLAY and not arguments.cassette:
+        parser.error("--cassette is required with the replay transport")
+
+    credentials = create_credentials()
+    if arguments.merchant_id:
+        credentials.set_merchant_id(arguments.merchant_id)
+    if arguments.merchant_pass:
+        credentials.set_merchant_pass(arguments.merchant_pass)
+    if arguments.merchant_key:
+        credentials.set_merchant_key(arguments.merchant_key)
+
+    emulator = None
+    if arguments.transport == STUB:
+        network_adapter = StubNetworkAdapter(arguments.latency, arguments.error_rate, seed=arguments.seed)
+    elif arguments.transport == REPLAY:
+        network_adapter = ReplayNetworkAdapter(Cassette.load(arguments.cassette), arguments.latency_scale)
+    else:
+        network_adapter = NetworkAdapter(pool_maxsize=max(arguments.concurrency, NetworkAdapter.DEFAULT_POOL_MAXSIZE))
+    cassette = None
+    if arguments.record:
+        cassette = Cassette()
+        network_adapter = RecordingNetworkAdapter(cassette, network_adapter)
+    weights = TransactionMix.parse_weights(arguments.mix) if arguments.mix else None
+    mix = TransactionMix(credentials, network_adapter, weights, arguments.cart_items)
+    if arguments.transport == EMULATOR:
+        emulator = GatewayEmulator(credentials, arguments.latency, error_rate=arguments.error_rate, seed=arguments.seed)
+        emulator.start()
+        for pipeline in mix.get_pipelines():
+            emulator.install(pipeline)
+    elif arguments.transport == URL:
+        for pipeline in mix.get_pipelines():
+            send_to(pipeline, arguments.url)
+
+    generator = LoadGenerator(mix, arguments.mode, arguments.concurrency, arguments.rps, arguments.duration,
+                              arguments.transactions, arguments.seed)
+    try:
+        report = generator.run()
+    finally:
+        if emulator is not None:
+            emulator.stop()
+        if cassette is not None:
+            cassette.save(arguments.record)
+
+    print(report.format())
+    if arguments.transport == EMULATOR:
+        print("\nThe CPU time includes the emulator, use --transport url to leave it out.")
+    if arguments.json:
+        with open(arguments.json, 'w', encoding="utf-8") as file:
+            json.dump(report.to_dict(), file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.loadtest.load_report import LoadReport
+from sdk.loadtest.transaction_mix import TransactionMix
+
+
+class LoadGenerator:
+    # Drives a TransactionMix from worker threads.
+    # Closed loop: each worker starts a transaction as soon as its previous one ends, so the rate follows the latency.
+    # Open loop: transactions start on a fixed schedule of rps per second whatever the latency. The latency is
+    # measured from the scheduled start, so the time spent waiting for a free worker is part of it.
+    CLOSED_LOOP: str = "closed"
+    OPEN_LOOP: str = "open"
+
+    DEFAULT_CONCURRENCY: int = 8
+    DEFAULT_DURATION: float = 10.0
+
+    def __init__(self, mix: TransactionMix, mode: str = CLOSED_LOOP, concurrency: int = DEFAULT_CONCURRENCY,
+                 rps: float = None, duration: float = DEFAULT_DURATION, transactions: int = None, seed: int = None):
+        if mode not in (LoadGenerator.CLOSED_LOOP, LoadGenerator.OPEN_LOOP):
+            raise InvalidFieldException(f"mode must be {LoadGenerator.CLOSED_LOOP} or {LoadGenerator.OPEN_LOOP}")
+        if mode == LoadGenerator.OPEN_LOOP and (rps is None or rps <= 0):
+            raise InvalidFieldException("the open loop mode needs a positive rps")
+        if concurrency < 1:
+            raise InvalidFieldException("concurrency must be at least 1")
+        if duration is None and transactions is None:
+            raise InvalidFieldException("a duration or a number of transactions is required")
+        self.__mix = mix
+        self.__mode = mode
+        self.__concurrency = concurrency
+        self.__rps = rps
+        self.__duration = duration
+        self.__transactions = transactions
+        self.__seed = seed
+
+    def run(self) -> LoadReport:
+        report = LoadReport()
+        started_at = time.perf_counter()
+        cpu_started_at = time.process_time()
+        if self.__mode == LoadGenerator.OPEN_LOOP:
+            self.__run_open_loop(report, started_at)
+        else:
+            self.__run_closed_loop(report, started_at)
+        report.set_run(self.__mode, self.__concurrency, self.__rps, time.perf_counter() - started_at,
+                       time.process_time() - cpu_started_at)
+        return report
+
+    def __run_closed_loop(self, report: LoadReport, started_at: float):
+        ends_at = self.__get_end(started_at)
+        remaining = itertools.count() if self.__transactions is not None else None
+        lock = threading.Lock()
+
+        def worker(index: int):
+            generator = random.Random(None if self.__seed is None else self.__seed + index)
+            while time.perf_counter() < ends_at:
+                if remaining is not None:
+                    with lock:
+                        if next(remaining) >= self.__transactions:
+                            return
+                name = self.__mix.choose(generator)
+                self.__execute(report, name, time.perf_counter())
+
+        workers = [threading.Thread(target=worker, args=(index,), name=f"loadtest-{index}", daemon=True)
+                   for index in range(self.__concurrency)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+    def __run_open_loop(self, report: LoadReport, started_at: float):
+        ends_at = self.__get_end(started_at)
+        generator = random.Random(self.__seed)
+        interval = 1.0 / self.__rps
+        with ThreadPoolExecutor(max_workers=self.__concurrency, thread_name_prefix="loadtest") as executor:
+            for index in itertools.count():
+                scheduled_at = started_at + index * interval
+                if scheduled_at >= ends_at or (self.__transactions is not None and index >= self.__transactions):
+                    break
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self.__execute, report, self.__mix.choose(generator), scheduled_at)
+
+    def __get_end(self, started_at: float) -> float:
+        return started_at + self.__duration if self.__duration is not None else float("inf")
+
+    def __execute(self, report: LoadReport, name: str, scheduled_at: float):
+        try:
+            responses = self.__mix.run(name)
+        except Exception as e:
+            report.record(name, time.perf_counter() - scheduled_at, exception=e)
+            return
+        report.record(name, time.perf_counter() - scheduled_at, responses)
+
+    def get_mode(self) -> str:
+        return self.__mode
+
+    def get_rps(self) -> Optional[float]:
+        return self.__rps
@@ -0,0 +1,137 @@
+import math
+import threading
+from typing import Dict, List, Optional
+
+from sdk.enums.error import Error
+
+
+class LoadReport:
+    # Results of a load test: transaction latencies per transaction name, the requests sent and their errors by
+    # Error name. Exceptions raised by the SDK are counted under their class name.
+    PERCENTILES = (50, 90, 99, 99.9)
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__latencies: Dict[str, List[float]] = {}
+        self.__requests = 0
+        self.__failed_transactions = 0
+        self.__errors: Dict[str, int] = {}
+        self.__wall_time = 0.0
+        self.__cpu_time = 0.0
+        self.__mode: Optional[str] = None
+        self.__target_rps: Optional[float] = None
+        self.__concurrency = 0
+
+    def record(self, name: str, latency: float, responses: List = None, exception: Exception = None):
+        errors = []
+        for response in responses or []:
+            if response.get_is_error():
+                error = response.get_error()
+                errors.append(error.name if isinstance(error, Error) else str(error))
+        if exception is not None:
+            errors.append(type(exception).__name__)
+        with self.__lock:
+            self.__latencies.setdefault(name, []).append(latency)
+            self.__requests += len(responses or []) + (1 if exception is not None else 0)
+            if errors:
+                self.__failed_transactions += 1
+            for error in errors:
+                self.__errors[error] = self.__errors.get(error, 0) + 1
+
+    def set_run(self, mode: str, concurrency: int, target_rps: Optional[float], wall_time: float, cpu_time: float):
+        self.__mode = mode
+        self.__concurrency = concurrency
+        self.__target_rps = target_rps
+        self.__wall_time = wall_time
+        self.__cpu_time = cpu_time
+
+    def get_transactions(self, name: str = None) -> int:
+        if name is not None:
+            return len(self.__latencies.get(name, []))
+        return sum(len(latencies) for latencies in self.__latencies.values())
+
+    def get_requests(self) -> int:
+        return self.__requests
+
+    def get_failed_transactions(self) -> int:
+        return self.__failed_transactions
+
+    def get_errors(self) -> Dict[str, int]:
+        return dict(self.__errors)
+
+    def get_wall_time(self) -> float:
+        return self.__wall_time
+
+    def get_cpu_time(self) -> float:
+        return self.__cpu_time
+
+    def get_throughput(self) -> float:
+        return self.get_transactions() / self.__wall_time if self.__wall_time > 0 else 0.0
+
+    def get_cpu_per_request(self) -> float:
+        return self.__cpu_time / self.__requests if self.__requests else 0.0
+
+    def get_percentile(self, percentile: float, name: str = None) -> Optional[float]:
+        if name is not None:
+            latencies = self.__latencies.get(name, [])
+        else:
+            latencies = [latency for values in self.__latencies.values() for latency in values]
+        return LoadReport.percentile(latencies, percentile)
+
+    @staticmethod
+    def percentile(values: List[float], percentile: float) -> Optional[float]:
+        # Nearest-rank percentile, so the value is one that was measured.
+        if not values:
+            return None
+        ordered = sorted(values)
+        return ordered[max(0, math.ceil(percentile / 100 * len(ordered)) - 1)]
+
+    def to_dict(self) -> dict:
+        transactions = {}
+        for name in sorted(self.__latencies):
+            transactions[name] = self.__summarize(self.__latencies[name])
+        return {
+            "mode": self.__mode,
+            "concurrency": self.__concurrency,
+            "target_rps": self.__target_rps,
+            "wall_time_s": round(self.__wall_time, 3),
+            "transactions": self.get_transactions(),
+            "requests": self.__requests,
+            "failed_transactions": self.__failed_transactions,
+            "throughput_tps": round(self.get_throughput(), 2),
+            "cpu_time_s": round(self.__cpu_time, 3),
+            "cpu_per_request_ms": round(self.get_cpu_per_request() * 1000, 3),
+            "latency": self.__summarize([latency for values in self.__latencies.values() for latency in values]),
+            "by_transaction": transactions,
+            "errors": dict(sorted(self.__errors.items())),
+        }
+
+    def format(self) -> str:
+        report = self.to_dict()
+        target = f", target {report['target_rps']:g}/s" if report["target_rps"] else ""
+        lines = [
+            f"mode {report['mode']}, concurrency {report['concurrency']}{target}, {report['wall_time_s']} s",
+            f"transactions {report['transactions']} ({report['failed_transactions']} failed), "
+            f"requests {report['requests']}, throughput {report['throughput_tps']} transactions/s",
+            f"cpu {report['cpu_time_s']} s, {report['cpu_per_request_ms']} ms per request",
+            "",
+            f"{'transaction':<20}{'count':>8}{'p50 (ms)':>12}{'p90 (ms)':>12}{'p99 (ms)':>12}{'max (ms)':>12}",
+        ]
+        for name, summary in list(report["by_transaction"].items()) + [("all", report["latency"])]:
+            lines.append(f"{name:<20}{summary['count']:>8}{summary['p50_ms']:>12.2f}{summary['p90_ms']:>12.2f}"
+                         f"{summary['p99_ms']:>12.2f}{summary['max_ms']:>12.2f}")
+        if report["errors"]:
+            lines.append("")
+            lines.append(f"{'error':<28}{'count':>8}")
+            for error, count in report["errors"].items():
+                lines.append(f"{error:<28}{count:>8}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def __summarize(latencies: List[float]) -> dict:
+        summary = {"count": len(latencies)}
+        for percentile in LoadReport.PERCENTILES:
+            value = LoadReport.percentile(latencies, percentile)
+            summary[f"p{percentile:g}_ms"] = round(value * 1000, 3) if value is not None else 0.0
+        summary["max_ms"] = round(max(latencies) * 1000, 3) if latencies else 0.0
+        return summary
@@ -0,0 +1,72 @@
+import json
+import random
+import threading
+import time
+
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.enums.endpoint_family import EndpointFamily
+from sdk.models.deadline import Deadline
+
+
+class StubNetworkAdapter(NetworkAdapter):
+    # Answers every endpoint with a canned successful response, without network access. Latency and HTTP errors can
+    # be injected like with the GatewayEmulator, but nothing is decrypted, so the CPU time measured is the SDK's.
+    DEFAULT_ERROR_STATUS: int = 503
+
+    __XML_RESPONSE = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?><response operation-size="1">'
+        '<message>WorkFlow has finished successfully, for transaction Id: 7817740</message><operations>'
+        '<operation sorted-order="1"><amount>50</amount><currency>EUR</currency>'
+        '<merchantTransactionId>12345</merchantTransactionId><message>Success</message>'
+        '<operationType>{operation_type}</operationType><paySolTransactionId>RP5M4NF5QPHFQ6M3</paySolTransactionId>'
+        '<paymentSolution>creditcards</paymentSolution><service>TRA</service><status>SUCCESS</status>'
+        '<transactionId>7817740</transactionId><respCode><code>0000</code><message>Successful</message>'
+        '<uuid>a4c3ad7c4e7a4f5d9f07e58aa3e01d20</uuid></respCode></operation></operations>'
+        '<status>SUCCESS</status></response>'
+    )
+    __CHARGE_RESPONSE = json.dumps({"response": {
+        "status": "SUCCESS",
+        "message": "WorkFlow has finished successfully, for transaction Id: 7817741",
+        "optionalTransactionParams": {},
+        "operationSize": 1,
+        "operationsArray": [{
+            "type": "operation", "sortedOrder": 1, "amount": "30", "currency": "EUR",
+            "merchantTransactionId": "12345", "message": "Success", "operationType": "DEBIT",
+            "paySolTransactionId": "RP5M4NF5QPHFQ6M4", "paymentSolution": "creditcards", "service": "TRA",
+            "status": "SUCCESS", "transactionId": "7817741", "payFrexTransactionId": 7817741,
+            "respCode": {"type": "respCode", "code": "0000", "message": "Successful",
+                         "uuid": "b5d4be8d5f8b405e8a18f69bb4f12e31"}
+        }]
+    }})
+    __RESPONSES = {
+        EndpointFamily.H2H_PAY: __XML_RESPONSE.replace("{operation_type}", "DEBIT"),
+        EndpointFamily.CAPTURE: __XML_RESPONSE.replace("{operation_type}", "CAPTURE"),
+        EndpointFamily.VOID: __XML_RESPONSE.replace("{operation_type}", "VOID"),
+        EndpointFamily.REBATE: __XML_RESPONSE.replace("{operation_type}", "REBATE"),
+        EndpointFamily.JS_AUTH: json.dumps({"authToken": "55354a9e-c121-41e7-863e-e58a7653499e"}),
+        EndpointFamily.JS_CHARGE: __CHARGE_RESPONSE,
+        EndpointFamily.TOKENIZE: "https://checkout-stg.addonpayments.com/EPGCheckout/rest/online/redirect/stub",
+    }
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, error_status: int = DEFAULT_ERROR_STATUS,
+                 seed: int = None):
+        super().__init__()
+        self.__latency = latency
+        self.__error_rate = error_rate
+        self.__error_status = error_status
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+
+    # pylint: disable-next=unused-argument
+    def send_request(self, headers, query_parameters, json, url, deadline: Deadline = None, body=None):
+        if self.__latency > 0:
+            time.sleep(self.__latency)
+        if self.__error_rate > 0:
+            with self.__lock:
+                failed = self.__random.random() < self.__error_rate
+            if failed:
+                return self.__error_status, "Service Unavailable"
+        response = StubNetworkAdapter.__RESPONSES.get(EndpointFamily.get_by_url(url))
+        if response is None:
+            return 404, "Unknown endpoint"
+        return 200, response
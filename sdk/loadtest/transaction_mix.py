@@ -0,0 +1,162 @@
+import itertools
+import random
+from typing import Callable, Dict, List, Tuple
+
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.hosted_quix_payment_adapter import HostedQuixPaymentAdapter
+from sdk.adapters.js_payment_adapter import JSPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.benchmarks.benchmark_suite import create_h2h_redirection, create_js_charge, create_quix_item
+from sdk.enums.country_code import CountryCodeAlpha2
+from sdk.enums.currency import Currency
+from sdk.enums.operation_types import OperationTypes
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.requests.h2h.h2h_pre_authorization import H2HPreAuthorization
+from sdk.models.requests.h2h.h2h_pre_authorization_capture import H2HPreAuthorizationCapture
+from sdk.models.requests.h2h.h2h_refund import H2HRefund
+from sdk.models.requests.js.js_authorization_request import JSAuthorizationRequest
+from sdk.models.requests.quix_hosted.hosted_quix_item import HostedQuixItem
+
+
+class TransactionMix:
+    # A weighted mix of transactions, each one sent through the payment adapters with the existing request models.
+    # A transaction can take several requests, like a pre-authorization and its capture.
+    H2H_DEBIT: str = "h2h_debit"
+    PRE_AUTHORIZATION_CAPTURE: str = "preauth_capture"
+    REFUND: str = "refund"
+    JS_CHARGE: str = "js_charge"
+    QUIX_HOSTED: str = "quix_hosted"
+
+    DEFAULT_WEIGHTS: Dict[str, float] = {
+        H2H_DEBIT: 50,
+        PRE_AUTHORIZATION_CAPTURE: 20,
+        REFUND: 10,
+        JS_CHARGE: 15,
+        QUIX_HOSTED: 5,
+    }
+    DEFAULT_CART_ITEMS: int = 10
+
+    def __init__(self, credentials: Credentials, network_adapter: NetworkAdapter = None,
+                 weights: Dict[str, float] = None, cart_items: int = DEFAULT_CART_ITEMS):
+        weights = dict(weights if weights is not None else TransactionMix.DEFAULT_WEIGHTS)
+        self.__transactions: Dict[str, Callable[[], List]] = {
+            TransactionMix.H2H_DEBIT: self.__h2h_debit,
+            TransactionMix.PRE_AUTHORIZATION_CAPTURE: self.__pre_authorization_capture,
+            TransactionMix.REFUND: self.__refund,
+            TransactionMix.JS_CHARGE: self.__js_charge,
+            TransactionMix.QUIX_HOSTED: self.__quix_hosted,
+        }
+        for name, weight in weights.items():
+            if name not in self.__transactions:
+                raise InvalidFieldException(f"unknown transaction {name}, expected one of {list(self.__transactions)}")
+            if weight < 0:
+                raise InvalidFieldException(f"weight of {name} must not be negative")
+        self.__names = [name for name, weight in weights.items() if weight > 0]
+        if not self.__names:
+            raise InvalidFieldException("at least one transaction needs a positive weight")
+        self.__cumulative_weights = list(itertools.accumulate(weights[name] for name in self.__names))
+        self.__cart_items = cart_items
+        self.__merchant_transaction_ids = itertools.count(1)
+
+        self.__h2h_adapter = H2HPaymentAdapter(credentials, network_adapter)
+        self.__js_adapter = JSPaymentAdapter(credentials, network_adapter)
+        self.__hosted_quix_adapter = HostedQuixPaymentAdapter(credentials, network_adapter)
+
+    @staticmethod
+    def parse_weights(text: str) -> Dict[str, float]:
+        # "h2h_debit=60,refund=40" as given on the command line.
+        weights = {}
+        for part in text.split(","):
+            name, separator, weight = part.partition("=")
+            if not separator:
+                raise InvalidFieldException(f"expected name=weight, got {part}")
+            try:
+                weights[name.strip()] = float(weight)
+            except ValueError:
+                raise InvalidFieldException(f"weight of {name.strip()} is not a number") from None
+        return weights
+
+    def get_names(self) -> List[str]:
+        return list(self.__names)
+
+    def get_pipelines(self) -> List[RequestPipeline]:
+        return [self.__h2h_adapter.get_pipeline(), self.__js_adapter.get_pipeline(),
+                self.__hosted_quix_adapter.get_pipeline()]
+
+    def choose(self, generator: random.Random) -> str:
+        return generator.choices(self.__names, cum_weights=self.__cumulative_weights)[0]
+
+    def run(self, name: str) -> List:
+        # Returns the responses of the requests sent, a failed request ending the transaction.
+        return self.__transactions[name]()
+
+    def run_next(self, generator: random.Random) -> Tuple[str, List]:
+        name = self.choose(generator)
+        return name, self.run(name)
+
+    def __next_merchant_transaction_id(self) -> str:
+        return str(next(self.__merchant_transaction_ids))
+
+    def __h2h_debit(self) -> List:
+        h2h_redirection = create_h2h_redirection()
+        h2h_redirection.set_merchant_transaction_id(self.__next_merchant_transaction_id())
+        return [self.__h2h_adapter.send_h2h_payment_request(h2h_redirection)]
+
+    def __pre_authorization_capture(self) -> List:
+        merchant_transaction_id = self.__next_merchant_transaction_id()
+        pre_authorization = H2HPreAuthorization()
+        pre_authorization.set_amount("50")
+        pre_authorization.set_currency(Currency.EUR)
+        pre_authorization.set_country(CountryCodeAlpha2.ES)
+        pre_authorization.set_merchant_transaction_id(merchant_transaction_id)
+        pre_authorization.set_card_number("4907270002222227")
+        pre_authorization.set_customer_id("903")
+        pre_authorization.set_ch_name("First name Last name")
+        pre_authorization.set_cvn_number("123")
+        pre_authorization.set_exp_date("0625")
+        pre_authorization.set_payment_solution(PaymentSolutions.creditcards)
+        pre_authorization.set_status_url("https://test.com/status")
+        pre_authorization.set_success_url("https://test.com/success")
+        pre_authorization.set_error_url("https://test.com/fail")
+        pre_authorization.set_awaiting_url("https://test.com/await")
+        pre_authorization.set_cancel_url("https://test.com/cancel")
+        response = self.__h2h_adapter.send_h2h_pre_authorization_request(pre_authorization)
+        if response.get_is_error():
+            return [response]
+
+        capture = H2HPreAuthorizationCapture()
+        capture.set_payment_solution(PaymentSolutions.creditcards)
+        capture.set_transaction_id(response.get_notification().get_operation(-1).transactionId)
+        capture.set_merchant_transaction_id(merchant_transaction_id)
+        return [response, self.__h2h_adapter.send_h2h_pre_authorization_capture(capture)]
+
+    def __refund(self) -> List:
+        refund = H2HRefund()
+        refund.set_amount("20")
+        refund.set_payment_solution(PaymentSolutions.creditcards)
+        refund.set_transaction_id("7817740")
+        refund.set_merchant_transaction_id(self.__next_merchant_transaction_id())
+        return [self.__h2h_adapter.send_h2h_refund_request(refund)]
+
+    def __js_charge(self) -> List:
+        authorization = JSAuthorizationRequest()
+        authorization.set_country(CountryCodeAlpha2.ES)
+        authorization.set_customer_id("55")
+        authorization.set_currency(Currency.EUR)
+        authorization.set_operation_type(OperationTypes.DEBIT)
+        response = self.__js_adapter.send_js_authorization_request(authorization)
+        if response.get_is_error():
+            return [response]
+
+        charge = create_js_charge()
+        charge.set_prepay_token(response.get_auth_token())
+        charge.set_merchant_transaction_id(self.__next_merchant_transaction_id())
+        return [response, self.__js_adapter.send_js_charge_request(charge)]
+
+    def __quix_hosted(self) -> List:
+        hosted_quix_item = create_quix_item(HostedQuixItem, self.__cart_items)
+        hosted_quix_item.set_merchant_transaction_id(self.__next_merchant_transaction_id())
+        return [self.__hosted_quix_adapter.send_hosted_quix_item_request(hosted_quix_item)]
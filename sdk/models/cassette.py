@@ -0,0 +1,126 @@
+import gzip
+import json
+import re
+import threading
+import urllib.parse
+from typing import Dict, List, Optional, Tuple
+
+from sdk.enums.error import Error
+from sdk.exceptions.field_exception import InvalidFieldException
+
+
+class Cassette:
+    # Request/response pairs recorded from a network adapter, replayed in order for each URL path, so a cassette
+    # recorded against the emulator or staging also answers the other hosts. The sensitive fields are redacted when
+    # the pair is recorded, so a cassette never holds card data or encrypted payloads.
+    FORMAT: int = 1
+    REDACTED: str = "REDACTED"
+    # The integrityCheck is a digest of the clear query, card number included, so it is redacted with it.
+    DEFAULT_REDACTED_FIELDS: Tuple[str, ...] = ("cardNumber", "cvnNumber", "encrypted", "integrityCheck",
+                                                "merchantKey")
+
+    def __init__(self, redacted_fields: Tuple[str, ...] = DEFAULT_REDACTED_FIELDS, loop: bool = True):
+        # With loop, the responses of a URL path start over once they have all been replayed.
+        self.__redacted_fields = frozenset(redacted_fields)
+        self.__xml_pattern = re.compile(
+            "<(" + "|".join(re.escape(field) for field in sorted(self.__redacted_fields)) + ")>[^<]*</\\1>"
+        ) if self.__redacted_fields else None
+        self.__loop = loop
+        self.__interactions: List[dict] = []
+        self.__by_path: Dict[str, List[dict]] = {}
+        self.__cursors: Dict[str, int] = {}
+        self.__lock = threading.Lock()
+
+    def get_interactions(self) -> List[dict]:
+        return list(self.__interactions)
+
+    def get_size(self) -> int:
+        return len(self.__interactions)
+
+    def get_redacted_fields(self) -> Tuple[str, ...]:
+        return tuple(sorted(self.__redacted_fields))
+
+    def record(self, url: str, headers: Optional[dict], query_parameters: Optional[dict], json_body, body: bytes,
+               response: Tuple[any, Optional[str]], elapsed: float):
+        status, text = response
+        interaction = {
+            "url": url,
+            "headers": dict(headers) if headers else None,
+            "query_parameters": self.__redact_value(dict(query_parameters)) if query_parameters else None,
+            "json": self.__redact_value(json_body) if json_body is not None else None,
+            "body": self.__redact_text(body.decode("utf-8")) if body is not None else None,
+            "status": status.name if isinstance(status, Error) else status,
+            "error": isinstance(status, Error),
+            "text": self.__redact_text(text) if text is not None else None,
+            "elapsed": round(elapsed, 6),
+        }
+        self.__add(interaction)
+
+    def next_interaction(self, url: str) -> Optional[dict]:
+        path = urllib.parse.urlparse(url).path
+        with self.__lock:
+            interactions = self.__by_path.get(path)
+            if not interactions:
+                return None
+            cursor = self.__cursors.get(path, 0)
+            if cursor >= len(interactions):
+                if not self.__loop:
+                    return None
+                cursor = 0
+            self.__cursors[path] = cursor + 1
+            return interactions[cursor]
+
+    @staticmethod
+    def get_response(interaction: dict) -> Tuple[any, Optional[str]]:
+        status = Error[interaction["status"]] if interaction["error"] else interaction["status"]
+        return status, interaction["text"]
+
+    def rewind(self):
+        with self.__lock:
+            self.__cursors.clear()
+
+    def save(self, path: str):
+        # Compact JSON, gzipped when the path ends with .gz.
+        content = json.dumps({"format": Cassette.FORMAT, "redacted_fields": self.get_redacted_fields(),
+                              "interactions": self.__interactions}, separators=(",", ":"))
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as file:
+            file.write(content)
+
+    @staticmethod
+    def load(path: str, loop: bool = True) -> 'Cassette':
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            content = json.load(file)
+        if content.get("format") != Cassette.FORMAT:
+            raise InvalidFieldException(f"{path} is not a cassette of format {Cassette.FORMAT}")
+        cassette = Cassette(tuple(content.get("redacted_fields", Cassette.DEFAULT_REDACTED_FIELDS)), loop)
+        for interaction in content["interactions"]:
+            cassette.__add(interaction)
+        return cassette
+
+    def __add(self, interaction: dict):
+        with self.__lock:
+            self.__interactions.append(interaction)
+            self.__by_path.setdefault(urllib.parse.urlparse(interaction["url"]).path, []).append(interaction)
+
+    def __redact_value(self, value):
+        if isinstance(value, dict):
+            return {key: Cassette.REDACTED if key in self.__redacted_fields else self.__redact_value(item)
+                    for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.__redact_value(item) for item in value]
+        return value
+
+    def __redact_text(self, text: str) -> str:
+        # JSON bodies are redacted by key, anything else (XML notifications) by element name.
+        if not self.__redacted_fields:
+            return text
+        stripped = text.lstrip()
+        if stripped.startswith("{") or stripped.startswith("["):
+            try:
+                return json.dumps(self.__redact_value(json.loads(text)), separators=(",", ":"))
+            except ValueError:
+                pass
+        return self.__xml_pattern.sub(lambda match: f"<{match.group(1)}>{Cassette.REDACTED}</{match.group(1)}>",
+                                      text)
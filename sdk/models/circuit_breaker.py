@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Tuple, Optional
+
+from sdk.enums.circuit_state import CircuitState
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.error import Error
+from sdk.enums.response_codes import ResponseCodes
+from sdk.exceptions.field_exception import InvalidFieldException
+
+
+class CircuitBreaker:
+    DEFAULT_WINDOW_SIZE: int = 20
+    DEFAULT_MINIMUM_CALLS: int = 10
+    DEFAULT_FAILURE_RATE_THRESHOLD: float = 0.5
+    DEFAULT_SLOW_CALL_DURATION: float = 10.0
+    DEFAULT_SLOW_CALL_RATE_THRESHOLD: float = 0.8
+    DEFAULT_PROBE_INTERVAL: float = 30.0
+
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE, minimum_calls: int = DEFAULT_MINIMUM_CALLS,
+                 failure_rate_threshold: float = DEFAULT_FAILURE_RATE_THRESHOLD,
+                 slow_call_duration: float = DEFAULT_SLOW_CALL_DURATION,
+                 slow_call_rate_threshold: float = DEFAULT_SLOW_CALL_RATE_THRESHOLD,
+                 probe_interval: float = DEFAULT_PROBE_INTERVAL):
+        if window_size is None or window_size < 1:
+            raise InvalidFieldException("windowSize: Should be (windowSize >= 1)")
+        if minimum_calls is None or minimum_calls < 1 or minimum_calls > window_size:
+            raise InvalidFieldException("minimumCalls: Should be (1 <= minimumCalls <= windowSize)")
+        for name, rate in (("failureRateThreshold", failure_rate_threshold),
+                           ("slowCallRateThreshold", slow_call_rate_threshold)):
+            if rate is None or rate <= 0 or rate > 1:
+                raise InvalidFieldException(f"{name}: Should be (0 < {name} <= 1)")
+        if slow_call_duration is None or slow_call_duration <= 0:
+            raise InvalidFieldException("slowCallDuration: Should be (slowCallDuration > 0)")
+        if probe_interval is None or probe_interval < 0:
+            raise InvalidFieldException("probeInterval: Should be (probeInterval >= 0)")
+        self.__window_size = window_size
+        self.__minimum_calls = minimum_calls
+        self.__failure_rate_threshold = failure_rate_threshold
+        self.__slow_call_duration = slow_call_duration
+        self.__slow_call_rate_threshold = slow_call_rate_threshold
+        self.__probe_interval = probe_interval
+        self.__lock = threading.Lock()
+        self.__states: Dict[Endpoints, CircuitState] = {}
+        # Sliding window of the last calls per endpoint, as (failed, slow) pairs.
+        self.__calls: Dict[Endpoints, deque] = {}
+        self.__opened_at: Dict[Endpoints, float] = {}
+        self.__probing: Dict[Endpoints, bool] = {}
+
+    def get_probe_interval(self) -> float:
+        return self.__probe_interval
+
+    def get_state(self, endpoint: Endpoints) -> CircuitState:
+        with self.__lock:
+            return self.__get_state(endpoint, time.monotonic())
+
+    def get_states(self) -> Dict[Endpoints, CircuitState]:
+        now = time.monotonic()
+        with self.__lock:
+            return {endpoint: self.__get_state(endpoint, now) for endpoint in Endpoints}
+
+    def is_healthy(self) -> bool:
+        return all(state != CircuitState.OPEN for state in self.get_states().values())
+
+    def allow_request(self, endpoint: Endpoints) -> bool:
+        with self.__lock:
+            state = self.__get_state(endpoint, time.monotonic())
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self.__probing.get(endpoint, False):
+                # Only one probe at a time, the other calls keep failing fast until it completes.
+                self.__states[endpoint] = CircuitState.HALF_OPEN
+                self.__probing[endpoint] = True
+                return True
+            return False
+
+    def record_response(self, endpoint: Endpoints, response: Tuple[any, Optional[str]], duration: float):
+        if isinstance(response[0], Error):
+            # A call cut by its Deadline is a failure too, even when the deadline is below slowCallDuration.
+            failed = response[0] in (Error.NETWORK_ERROR, Error.CONNECTION_ERROR, Error.DEADLINE_EXCEEDED)
+        else:
+            failed = not ResponseCodes.is_success(response[0]) and not ResponseCodes.is_client_error(response[0])
+        self.record_call(endpoint, failed, duration)
+
+    def record_call(self, endpoint: Endpoints, failed: bool, duration: float):
+        slow = duration >= self.__slow_call_duration
+        with self.__lock:
+            state = self.__states.get(endpoint, CircuitState.CLOSED)
+            if state == CircuitState.OPEN:
+                return
+            if state == CircuitState.HALF_OPEN:
+                self.__probing[endpoint] = False
+                if failed or slow:
+                    self.__open(endpoint)
+                else:
+                    self.__close(endpoint)
+                return
+
+            calls = self.__calls.setdefault(endpoint, deque(maxlen=self.__window_size))
+            calls.append((failed, slow))
+            if len(calls) < self.__minimum_calls:
+                return
+            failure_rate = sum(1 for call in calls if call[0]) / len(calls)
+            slow_call_rate = sum(1 for call in calls if call[1]) / len(calls)
+            if failure_rate >= self.__failure_rate_threshold or slow_call_rate >= self.__slow_call_rate_threshold:
+                self.__open(endpoint)
+
+    def reset(self, endpoint: Endpoints = None):
+        with self.__lock:
+            for circuit in ([endpoint] if endpoint is not None else list(self.__states)):
+                self.__close(circuit)
+
+    def __get_state(self, endpoint: Endpoints, now: float) -> CircuitState:
+        state = self.__states.get(endpoint, CircuitState.CLOSED)
+        if state == CircuitState.OPEN and now - self.__opened_at[endpoint] >= self.__probe_interval:
+            return CircuitState.HALF_OPEN
+        return state
+
+    def __open(self, endpoint: Endpoints):
+        self.__states[endpoint] = CircuitState.OPEN
+        self.__opened_at[endpoint] = time.monotonic()
+        self.__calls.pop(endpoint, None)
+
+    def __close(self, endpoint: Endpoints):
+        self.__states[endpoint] = CircuitState.CLOSED
+        self.__opened_at.pop(endpoint, None)
+        self.__calls.pop(endpoint, None)
+        self.__probing[endpoint] = False
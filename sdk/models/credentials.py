@@ -2,6 +2,7 @@ import re
 
 from sdk.enums.environment import Environment
 from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.utils.crypto_context import CryptoContext
 
 
 class Credentials:
@@ -11,6 +12,7 @@ class Credentials:
     __environment: Environment = None
     __productId: str = None
     __apiVersion: int = None
+    __cryptoContext: CryptoContext = None
 
     def set_merchant_id(self, new_merchant_id: str):
         if new_merchant_id is None or not new_merchant_id.isdigit() or len(new_merchant_id) < 4 or len(new_merchant_id) > 7:
@@ -30,10 +32,18 @@ class Credentials:
 
     def set_merchant_pass(self, new_merchant_pass: str):
         self.__merchantPass = new_merchant_pass
+        self.__cryptoContext = None
 
     def get_merchant_pass(self) -> str:
         return self.__merchantPass
 
+    def get_crypto_context(self) -> CryptoContext:
+        if self.__cryptoContext is None:
+            if self.__merchantPass is None:
+                raise InvalidFieldException("merchantPass")
+            self.__cryptoContext = CryptoContext(self.__merchantPass)
+        return self.__cryptoContext
+
     def set_environment(self, new_environment: Environment):
         self.__environment = new_environment
 
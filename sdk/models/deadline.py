@@ -0,0 +1,21 @@
+import time
+
+from sdk.exceptions.field_exception import InvalidFieldException
+
+
+class Deadline:
+    __expires_at: float = None
+
+    def __init__(self, timeout: float):
+        if timeout is None or timeout < 0:
+            raise InvalidFieldException("timeout: Should be (timeout >= 0)")
+        self.__expires_at = time.monotonic() + timeout
+
+    def get_expires_at(self) -> float:
+        return self.__expires_at
+
+    def remaining(self) -> float:
+        return max(0.0, self.__expires_at - time.monotonic())
+
+    def is_expired(self) -> bool:
+        return time.monotonic() >= self.__expires_at
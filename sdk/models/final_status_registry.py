@@ -0,0 +1,177 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, InvalidStateError
+from typing import Dict, List, Optional
+
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.responses.notification import Notification
+from sdk.models.transaction_state import TransactionState
+
+
+class FinalStatusRegistry:
+    # Futures waiting for the final notification of a merchantTransactionId, resolved by resolve() from the
+    # notification ingest path. All the timeouts share one timer thread. Final notifications are remembered for
+    # resultTtl seconds, so a waiter registered after the webhook already landed still gets it.
+    DEFAULT_RESULT_TTL: float = 60.0
+    DEFAULT_MAX_RESULTS: int = 10000
+
+    def __init__(self, result_ttl: float = DEFAULT_RESULT_TTL, max_results: int = DEFAULT_MAX_RESULTS):
+        if result_ttl is None or result_ttl < 0:
+            raise InvalidFieldException("resultTtl: Should be (resultTtl >= 0)")
+        if max_results is None or max_results < 0:
+            raise InvalidFieldException("maxResults: Should be (maxResults >= 0)")
+        self.__result_ttl = result_ttl
+        self.__max_results = max_results
+        self.__condition = threading.Condition()
+        self.__waiters: Dict[str, List[Future]] = {}
+        # merchantTransactionId -> (resolved at, final notification), oldest first.
+        self.__results: OrderedDict = OrderedDict()
+        self.__deadlines: list = []
+        # Futures whose deadline is still pending in the heap. The deadlines of the futures resolved or cancelled
+        # since are stale, and dropped from the heap once they are half of it.
+        self.__scheduled = set()
+        self.__stale_deadlines = 0
+        self.__sequence = itertools.count()
+        self.__timer: Optional[threading.Thread] = None
+        self.__closed = False
+
+    def get_waiter_count(self) -> int:
+        with self.__condition:
+            return sum(len(futures) for futures in self.__waiters.values())
+
+    def get_deadline_count(self) -> int:
+        with self.__condition:
+            return len(self.__deadlines)
+
+    def wait_for_final_status(self, merchant_transaction_id: str, timeout: float = None) -> Future:
+        # The future resolves to the final Notification, or fails with TimeoutError after timeout seconds.
+        future = Future()
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError("FinalStatusRegistry is closed")
+            notification = self.__get_result(merchant_transaction_id, time.monotonic())
+            if notification is None:
+                self.__waiters.setdefault(merchant_transaction_id, []).append(future)
+                if timeout is not None:
+                    heapq.heappush(self.__deadlines, (time.monotonic() + timeout, next(self.__sequence),
+                                                      merchant_transaction_id, future))
+                    self.__scheduled.add(future)
+                    self.__start_timer()
+                    self.__condition.notify()
+        if notification is not None:
+            future.set_result(notification)
+        else:
+            future.add_done_callback(lambda done: self.__discard(merchant_transaction_id, done))
+        return future
+
+    async def wait_for_final_status_async(self, merchant_transaction_id: str, timeout: float = None) -> Notification:
+        return await asyncio.wrap_future(self.wait_for_final_status(merchant_transaction_id, timeout))
+
+    def resolve(self, notification: Notification):
+        # Notification handler: only the final result of a payment operation resolves the waiters. The SUCCESS of
+        # its TRA or 3DS operation is not final, see TransactionState.get_operation_result.
+        if not FinalStatusRegistry.is_final(notification):
+            return
+        merchant_transaction_id = notification.get_merchant_transaction_id()
+        if merchant_transaction_id is None:
+            return
+        now = time.monotonic()
+        with self.__condition:
+            futures = self.__waiters.pop(merchant_transaction_id, [])
+            if self.__max_results > 0:
+                self.__results[merchant_transaction_id] = (now, notification)
+                self.__results.move_to_end(merchant_transaction_id)
+                self.__evict_results(now)
+        for future in futures:
+            FinalStatusRegistry.__complete(future, result=notification)
+
+    def close(self):
+        with self.__condition:
+            self.__closed = True
+            futures = [future for waiters in self.__waiters.values() for future in waiters]
+            self.__waiters.clear()
+            self.__deadlines.clear()
+            self.__scheduled.clear()
+            self.__stale_deadlines = 0
+            self.__condition.notify()
+        for future in futures:
+            future.cancel()
+
+    @staticmethod
+    def is_final(notification: Notification) -> bool:
+        try:
+            operation = notification.get_operation(-1)
+        except IndexError:
+            return False
+        return operation is not None and TransactionState.get_operation_result(operation) in \
+            TransactionState.FINAL_RESULTS
+
+    def __get_result(self, merchant_transaction_id: str, now: float) -> Optional[Notification]:
+        self.__evict_results(now)
+        result = self.__results.get(merchant_transaction_id)
+        return result[1] if result is not None else None
+
+    def __evict_results(self, now: float):
+        results = self.__results
+        while len(results) > self.__max_results:
+            results.popitem(last=False)
+        while results:
+            resolved_at = next(iter(results.values()))[0]
+            if now - resolved_at < self.__result_ttl:
+                break
+            results.popitem(last=False)
+
+    def __discard(self, merchant_transaction_id: str, future: Future):
+        with self.__condition:
+            futures = self.__waiters.get(merchant_transaction_id)
+            if futures is not None and future in futures:
+                futures.remove(future)
+                if not futures:
+                    del self.__waiters[merchant_transaction_id]
+            # The deadline of a timed out future was already popped by the timer.
+            if future in self.__scheduled:
+                self.__scheduled.remove(future)
+                self.__stale_deadlines += 1
+                if self.__stale_deadlines * 2 > len(self.__deadlines):
+                    self.__deadlines = [deadline for deadline in self.__deadlines if deadline[3] in self.__scheduled]
+                    heapq.heapify(self.__deadlines)
+                    self.__stale_deadlines = 0
+
+    def __start_timer(self):
+        if self.__timer is None:
+            self.__timer = threading.Thread(target=self.__expire, name="final-status-timer", daemon=True)
+            self.__timer.start()
+
+    def __expire(self):
+        while True:
+            with self.__condition:
+                while not self.__closed and (not self.__deadlines or self.__deadlines[0][0] > time.monotonic()):
+                    self.__condition.wait(self.__deadlines[0][0] - time.monotonic() if self.__deadlines else None)
+                if self.__closed:
+                    return
+                now = time.monotonic()
+                expired = []
+                while self.__deadlines and self.__deadlines[0][0] <= now:
+                    future = heapq.heappop(self.__deadlines)[3]
+                    if future in self.__scheduled:
+                        self.__scheduled.remove(future)
+                        expired.append(future)
+                    else:
+                        self.__stale_deadlines -= 1
+            for future in expired:
+                FinalStatusRegistry.__complete(future, exception=TimeoutError("Final status not received in time"))
+
+    @staticmethod
+    def __complete(future: Future, result=None, exception: BaseException = None):
+        # The future may have been resolved, timed out or cancelled concurrently.
+        try:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
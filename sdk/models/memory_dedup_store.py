@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict, deque
+
+from sdk.exceptions.field_exception import InvalidFieldException
+
+
+class MemoryDedupStore:
+    DEFAULT_MAX_ENTRIES: int = 100000
+    DEFAULT_TTL: float = 24 * 60 * 60
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL):
+        if max_entries is None or max_entries < 1:
+            raise InvalidFieldException("maxEntries: Should be (maxEntries >= 1)")
+        if ttl is None or ttl <= 0:
+            raise InvalidFieldException("ttl: Should be (ttl > 0)")
+        self.__max_entries = max_entries
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        # Key -> time it was first seen, ordered from the least to the most recently seen.
+        self.__entries: OrderedDict = OrderedDict()
+        # (time first seen, key) in insertion order, for the TTL sweep. A hit moves a key in __entries but not
+        # here, so a recently seen old key does not hide the expired keys behind it.
+        self.__expiry: deque = deque()
+
+    def get_max_entries(self) -> int:
+        return self.__max_entries
+
+    def get_ttl(self) -> float:
+        return self.__ttl
+
+    def add(self, key) -> bool:
+        # Returns False when the key was already seen within the TTL.
+        now = time.monotonic()
+        with self.__lock:
+            seen_at = self.__entries.get(key)
+            if seen_at is not None and now - seen_at < self.__ttl:
+                self.__entries.move_to_end(key)
+                return False
+            self.__entries[key] = now
+            self.__entries.move_to_end(key)
+            self.__expiry.append((now, key))
+            self.__evict(now)
+            return True
+
+    def contains(self, key) -> bool:
+        with self.__lock:
+            seen_at = self.__entries.get(key)
+            return seen_at is not None and time.monotonic() - seen_at < self.__ttl
+
+    def remove(self, key):
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__expiry.clear()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __evict(self, now: float):
+        entries = self.__entries
+        while len(entries) > self.__max_entries:
+            entries.popitem(last=False)
+        expiry = self.__expiry
+        while expiry and now - expiry[0][0] >= self.__ttl:
+            seen_at, key = expiry.popleft()
+            # The key may have been evicted, removed or added again since.
+            if entries.get(key) == seen_at:
+                del entries[key]
+        if len(expiry) > 2 * self.__max_entries:
+            # Keys evicted by size or removed leave their sweep entries behind until they expire.
+            self.__expiry = deque(sorted((seen_at, key) for key, seen_at in entries.items()))
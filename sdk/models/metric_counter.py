@@ -0,0 +1,44 @@
+import threading
+from typing import Dict, List, Tuple
+
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.utils.prometheus_utils import PrometheusUtils
+
+
+class MetricCounter:
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()):
+        self.__name = name
+        self.__help_text = help_text
+        self.__label_names = tuple(label_names)
+        self.__values: Dict[tuple, float] = {}
+        self.__lock = threading.Lock()
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_label_names(self) -> Tuple[str, ...]:
+        return self.__label_names
+
+    def inc(self, label_values: tuple = (), amount: float = 1.0):
+        if amount < 0:
+            raise InvalidFieldException("amount: Should be (amount >= 0)")
+        with self.__lock:
+            self.__values[label_values] = self.__values.get(label_values, 0.0) + amount
+
+    def get(self, label_values: tuple = ()) -> float:
+        return self.__values.get(label_values, 0.0)
+
+    def clear(self):
+        with self.__lock:
+            self.__values.clear()
+
+    def collect(self) -> List[str]:
+        with self.__lock:
+            values = sorted(self.__values.items())
+        lines = [f"# HELP {self.__name} {PrometheusUtils.escape_help(self.__help_text)}",
+                 f"# TYPE {self.__name} counter"]
+        for label_values, value in values:
+            labels = PrometheusUtils.format_labels(self.__label_names, label_values)
+            lines.append(f"{self.__name}{labels} {PrometheusUtils.format_value(value)}")
+        return lines
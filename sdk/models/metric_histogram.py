@@ -0,0 +1,72 @@
+import bisect
+import threading
+from typing import Dict, List, Tuple
+
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.utils.prometheus_utils import PrometheusUtils
+
+
+class MetricHistogram:
+    DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise InvalidFieldException("buckets: Should be a non empty list of increasing bounds")
+        self.__name = name
+        self.__help_text = help_text
+        self.__label_names = tuple(label_names)
+        self.__buckets = tuple(float(bound) for bound in buckets)
+        # label values -> [count per bucket, with the +Inf bucket last, sum]. Counts are not cumulative
+        # until they are collected, so an observation only increments one slot.
+        self.__values: Dict[tuple, list] = {}
+        self.__lock = threading.Lock()
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_label_names(self) -> Tuple[str, ...]:
+        return self.__label_names
+
+    def get_buckets(self) -> Tuple[float, ...]:
+        return self.__buckets
+
+    def observe(self, value: float, label_values: tuple = ()):
+        index = bisect.bisect_left(self.__buckets, value)
+        with self.__lock:
+            series = self.__values.get(label_values)
+            if series is None:
+                series = [[0] * (len(self.__buckets) + 1), 0.0]
+                self.__values[label_values] = series
+            series[0][index] += 1
+            series[1] += value
+
+    def get_count(self, label_values: tuple = ()) -> int:
+        series = self.__values.get(label_values)
+        return sum(series[0]) if series is not None else 0
+
+    def get_sum(self, label_values: tuple = ()) -> float:
+        series = self.__values.get(label_values)
+        return series[1] if series is not None else 0.0
+
+    def clear(self):
+        with self.__lock:
+            self.__values.clear()
+
+    def collect(self) -> List[str]:
+        with self.__lock:
+            values = sorted((label_values, list(series[0]), series[1])
+                            for label_values, series in self.__values.items())
+        lines = [f"# HELP {self.__name} {PrometheusUtils.escape_help(self.__help_text)}",
+                 f"# TYPE {self.__name} histogram"]
+        for label_values, counts, total in values:
+            cumulative = 0
+            for bound, count in zip(self.__buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{PrometheusUtils.format_value(bound)}"'
+                labels = PrometheusUtils.format_labels(self.__label_names, label_values, le)
+                lines.append(f"{self.__name}_bucket{labels} {cumulative}")
+            labels = PrometheusUtils.format_labels(self.__label_names, label_values)
+            lines.append(f"{self.__name}_sum{labels} {PrometheusUtils.format_value(total)}")
+            lines.append(f"{self.__name}_count{labels} {cumulative}")
+        return lines
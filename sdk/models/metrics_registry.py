@@ -0,0 +1,62 @@
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.metric_counter import MetricCounter
+from sdk.models.metric_histogram import MetricHistogram
+
+
+class MetricsRegistry:
+    # Local registry of counters and histograms, exported in the Prometheus text format by export() or served
+    # by wsgi_app on the scrape path. Nothing is sent anywhere.
+    CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self.__metrics: Dict[str, Union[MetricCounter, MetricHistogram]] = {}
+        self.__lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()) -> MetricCounter:
+        return self.__get_or_register(MetricCounter, name, label_names,
+                                      lambda: MetricCounter(name, help_text, label_names))
+
+    def histogram(self, name: str, help_text: str, label_names: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = MetricHistogram.DEFAULT_BUCKETS) -> MetricHistogram:
+        return self.__get_or_register(MetricHistogram, name, label_names,
+                                      lambda: MetricHistogram(name, help_text, label_names, buckets))
+
+    def get_metric(self, name: str) -> Optional[Union[MetricCounter, MetricHistogram]]:
+        return self.__metrics.get(name)
+
+    def unregister(self, name: str):
+        with self.__lock:
+            self.__metrics.pop(name, None)
+
+    def clear(self):
+        # Resets the values, the metrics stay registered.
+        for metric in list(self.__metrics.values()):
+            metric.clear()
+
+    def export(self) -> str:
+        with self.__lock:
+            metrics = sorted(self.__metrics.items())
+        lines = []
+        for _, metric in metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def wsgi_app(self, environ, start_response):
+        if environ.get("REQUEST_METHOD") != "GET":
+            start_response("405 Method Not Allowed", [("Content-Type", "text/plain")])
+            return [b"Method Not Allowed"]
+        start_response("200 OK", [("Content-Type", MetricsRegistry.CONTENT_TYPE)])
+        return [self.export().encode("utf-8")]
+
+    def __get_or_register(self, metric_class: type, name: str, label_names: Tuple[str, ...], create):
+        with self.__lock:
+            metric = self.__metrics.get(name)
+            if metric is None:
+                metric = create()
+                self.__metrics[name] = metric
+            elif not isinstance(metric, metric_class) or metric.get_label_names() != tuple(label_names):
+                raise InvalidFieldException(f"{name}: Already registered with another type or labels")
+        return metric
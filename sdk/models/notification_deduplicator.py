@@ -0,0 +1,85 @@
+import hashlib
+import threading
+from typing import Callable, Optional
+
+from sdk.models.memory_dedup_store import MemoryDedupStore
+from sdk.models.responses.notification import Notification
+from sdk.models.sqlite_dedup_store import SqliteDedupStore
+
+
+class NotificationDeduplicator:
+    # A notification is keyed on its merchantTransactionId and the transactionId and status of its last operation.
+    # Keys are kept as 16 byte digests, so the memory tier stays bounded by maxEntries whatever the ids look like.
+    # The optional SQLite tier is only queried when the memory tier has not seen the key.
+
+    def __init__(self, memory_store: MemoryDedupStore = None, persistent_store: SqliteDedupStore = None):
+        self.__memory_store = memory_store if memory_store is not None else MemoryDedupStore()
+        self.__persistent_store = persistent_store
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_memory_store(self) -> MemoryDedupStore:
+        return self.__memory_store
+
+    def get_persistent_store(self) -> Optional[SqliteDedupStore]:
+        return self.__persistent_store
+
+    def get_hits(self) -> int:
+        return self.__hits
+
+    def get_misses(self) -> int:
+        return self.__misses
+
+    def get_hit_ratio(self) -> float:
+        total = self.__hits + self.__misses
+        return self.__hits / total if total > 0 else 0.0
+
+    @staticmethod
+    def get_key(notification: Notification) -> Optional[bytes]:
+        try:
+            operation = notification.get_operation(-1)
+        except IndexError:
+            return None
+        if operation is None:
+            return None
+        merchant_transaction_id = operation.merchantTransactionId
+        if merchant_transaction_id is None and operation.transactionId is None:
+            return None
+        key = f"{merchant_transaction_id}\x1f{operation.transactionId}\x1f{operation.status}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+    def is_duplicate(self, notification: Notification) -> bool:
+        # Marks the notification as seen. Notifications without ids are never reported as duplicates.
+        key = NotificationDeduplicator.get_key(notification)
+        duplicate = key is not None and (
+            not self.__memory_store.add(key)
+            or (self.__persistent_store is not None and not self.__persistent_store.add(key))
+        )
+        with self.__lock:
+            if duplicate:
+                self.__hits += 1
+            else:
+                self.__misses += 1
+        return duplicate
+
+    def forget(self, notification: Notification):
+        # Lets a notification whose handler failed be processed again when the gateway retries it.
+        key = NotificationDeduplicator.get_key(notification)
+        if key is None:
+            return
+        self.__memory_store.remove(key)
+        if self.__persistent_store is not None:
+            self.__persistent_store.remove(key)
+
+    def wrap(self, handler: Callable[[Notification], None]) -> Callable[[Notification], None]:
+        def deduplicated_handler(notification: Notification):
+            if self.is_duplicate(notification):
+                return
+            try:
+                handler(notification)
+            except Exception:
+                self.forget(notification)
+                raise
+
+        return deduplicated_handler
@@ -0,0 +1,117 @@
+from typing import Any, Dict, Optional, Tuple
+
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.request_route import RequestRoute
+
+
+class RequestContext:
+    # State of one request going through the RequestPipeline. Each stage fills in the fields the next one needs.
+
+    def __init__(self, request, credentials: Credentials, route: RequestRoute, deadline: Deadline = None):
+        self.__request = request
+        self.__credentials = credentials
+        self.__route = route
+        self.__deadline = deadline
+        self.__endpoint: Optional[Endpoints] = None
+        self.__url: Optional[str] = None
+        self.__headers: Optional[dict] = None
+        self.__query: Optional[str] = None
+        self.__query_parameters: Optional[dict] = None
+        self.__body: Optional[bytes] = None
+        self.__response: Optional[Tuple[Any, Optional[str]]] = None
+        self.__result = None
+        self.__exception: Optional[Exception] = None
+        self.__durations: Dict[PipelineStage, float] = {}
+        self.__attributes: Dict[str, Any] = {}
+
+    def get_request(self):
+        return self.__request
+
+    def get_credentials(self) -> Credentials:
+        return self.__credentials
+
+    def get_route(self) -> RequestRoute:
+        return self.__route
+
+    def get_deadline(self) -> Optional[Deadline]:
+        return self.__deadline
+
+    def get_endpoint(self) -> Optional[Endpoints]:
+        return self.__endpoint
+
+    def set_endpoint(self, endpoint: Endpoints):
+        self.__endpoint = endpoint
+
+    def get_url(self) -> Optional[str]:
+        if self.__url is not None:
+            return self.__url
+        return self.__endpoint.value if self.__endpoint is not None else None
+
+    def set_url(self, url: Optional[str]):
+        # Sends the request somewhere else than the endpoint, for example to a GatewayEmulator.
+        self.__url = url
+
+    def get_headers(self) -> Optional[dict]:
+        return self.__headers
+
+    def set_headers(self, headers: Optional[dict]):
+        self.__headers = headers
+
+    def get_query(self) -> Optional[str]:
+        return self.__query
+
+    def set_query(self, query: Optional[str]):
+        self.__query = query
+
+    def get_query_parameters(self) -> Optional[dict]:
+        return self.__query_parameters
+
+    def set_query_parameters(self, query_parameters: Optional[dict]):
+        self.__query_parameters = query_parameters
+
+    def get_body(self) -> Optional[bytes]:
+        return self.__body
+
+    def set_body(self, body: Optional[bytes]):
+        self.__body = body
+
+    def get_response(self) -> Optional[Tuple[Any, Optional[str]]]:
+        return self.__response
+
+    def set_response(self, response: Tuple[Any, Optional[str]]):
+        self.__response = response
+
+    def get_result(self):
+        return self.__result
+
+    def set_result(self, result):
+        self.__result = result
+
+    def get_exception(self) -> Optional[Exception]:
+        # The exception raised by the stage that stopped the pipeline.
+        return self.__exception
+
+    def set_exception(self, exception: Optional[Exception]):
+        self.__exception = exception
+
+    def get_duration(self, stage: PipelineStage) -> Optional[float]:
+        return self.__durations.get(stage)
+
+    def get_durations(self) -> Dict[PipelineStage, float]:
+        return dict(self.__durations)
+
+    def get_total_duration(self) -> float:
+        return sum(self.__durations.values())
+
+    def record_duration(self, stage: PipelineStage, duration: float):
+        self.__durations[stage] = duration
+
+    def get_attribute(self, name: str, default=None):
+        # Free-form state shared between the middlewares of one request.
+        return self.__attributes.get(name, default)
+
+    def set_attribute(self, name: str, value):
+        self.__attributes[name] = value
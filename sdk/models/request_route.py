@@ -0,0 +1,37 @@
+from typing import Any, Callable, Optional, Tuple, Union
+
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.environment import Environment
+from sdk.models.credentials import Credentials
+
+
+class RequestRoute:
+    # Everything that differs between the operations sent through the RequestPipeline. The serializer returns
+    # the headers and the payload: the clear query string when the route is encrypted, the body otherwise.
+
+    def __init__(self, production_endpoint: Endpoints, staging_endpoint: Endpoints,
+                 serializer: Callable[[Any, Credentials], Tuple[Optional[dict], Union[str, bytes]]],
+                 response_mapper: Callable[[Tuple[Any, Optional[str]]], Any], encrypted: bool = True):
+        self.__production_endpoint = production_endpoint
+        self.__staging_endpoint = staging_endpoint
+        self.__serializer = serializer
+        self.__response_mapper = response_mapper
+        self.__encrypted = encrypted
+
+    def get_production_endpoint(self) -> Endpoints:
+        return self.__production_endpoint
+
+    def get_staging_endpoint(self) -> Endpoints:
+        return self.__staging_endpoint
+
+    def get_endpoint(self, environment: Environment) -> Endpoints:
+        return self.__production_endpoint if environment == Environment.PRODUCTION else self.__staging_endpoint
+
+    def get_serializer(self) -> Callable[[Any, Credentials], Tuple[Optional[dict], Union[str, bytes]]]:
+        return self.__serializer
+
+    def get_response_mapper(self) -> Callable[[Tuple[Any, Optional[str]]], Any]:
+        return self.__response_mapper
+
+    def is_encrypted(self) -> bool:
+        return self.__encrypted
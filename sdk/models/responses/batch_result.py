@@ -0,0 +1,20 @@
+from typing import Iterator, Tuple
+
+from sdk.models.responses.batch_summary import BatchSummary
+from sdk.models.responses.payment_response import PaymentResponse
+
+
+class BatchResult:
+
+    def __init__(self, results: Iterator[Tuple[any, PaymentResponse]], summary: BatchSummary):
+        self.__results = results
+        self.__summary = summary
+
+    def __iter__(self) -> Iterator[Tuple[any, PaymentResponse]]:
+        return self.__results
+
+    def get_summary(self) -> BatchSummary:
+        return self.__summary
+
+    def close(self):
+        self.__results.close()
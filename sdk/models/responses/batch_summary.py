@@ -0,0 +1,65 @@
+import threading
+import time
+from typing import Dict
+
+from sdk.enums.error import Error
+from sdk.models.responses.payment_response import PaymentResponse
+
+
+class BatchSummary:
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__total = 0
+        self.__succeeded = 0
+        self.__failed = 0
+        self.__errors: Dict[Error, int] = {}
+        self.__started_at: float = None
+        self.__finished_at: float = None
+
+    def start(self):
+        self.__started_at = time.monotonic()
+
+    def finish(self):
+        self.__finished_at = time.monotonic()
+
+    def record(self, response: PaymentResponse):
+        with self.__lock:
+            self.__total += 1
+            if response.get_is_error():
+                self.__failed += 1
+                self.__errors[response.get_error()] = self.__errors.get(response.get_error(), 0) + 1
+            else:
+                self.__succeeded += 1
+
+    def get_total(self) -> int:
+        return self.__total
+
+    def get_succeeded(self) -> int:
+        return self.__succeeded
+
+    def get_failed(self) -> int:
+        return self.__failed
+
+    def get_errors(self) -> Dict[Error, int]:
+        with self.__lock:
+            return dict(self.__errors)
+
+    def is_finished(self) -> bool:
+        return self.__finished_at is not None
+
+    def get_elapsed(self) -> float:
+        if self.__started_at is None:
+            return 0.0
+        end = self.__finished_at if self.__finished_at is not None else time.monotonic()
+        return end - self.__started_at
+
+    def get_throughput(self) -> float:
+        elapsed = self.get_elapsed()
+        return self.__total / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        errors = ", ".join(f"{error.name}={count}" for error, count in self.get_errors().items())
+        return (f"total={self.__total}, succeeded={self.__succeeded}, failed={self.__failed}, "
+                f"elapsed={self.get_elapsed():.3f}s, throughput={self.get_throughput():.1f}/s"
+                + (f", errors=[{errors}]" if errors else ""))
@@ -0,0 +1,103 @@
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from sdk.models.responses.notification import Notification, Operation, WorkFlowResponse, OptionalTransactionParams
+
+
+class LazyNotification(Notification):
+    # Keeps the parsed XML elements or JSON dicts and only builds the nested dataclasses when they are read.
+    # The status helpers go through get_operation, so they build the single operation they need.
+    __UNSET = object()
+
+    def __init__(self, message: Optional[str], status: Optional[str], raw_operations: Optional[list],
+                 raw_work_flow_response, raw_optional_transaction_params,
+                 build_operation: Callable[[Any], Operation],
+                 build_work_flow_response: Callable[[Any], WorkFlowResponse],
+                 build_optional_transaction_params: Callable[[Any], OptionalTransactionParams],
+                 build_entry_index: Callable[[list], Dict[str, Any]]):
+        self.message = message
+        self.status = status
+        self.__raw_operations = raw_operations
+        self.__raw_work_flow_response = raw_work_flow_response
+        self.__raw_optional_transaction_params = raw_optional_transaction_params
+        self.__build_operation = build_operation
+        self.__build_work_flow_response = build_work_flow_response
+        self.__build_optional_transaction_params = build_optional_transaction_params
+        self.__build_entry_index = build_entry_index
+        self.__raw_entry_index = None
+        self.__built_operations: Dict[int, Operation] = {}
+        self.__operations = LazyNotification.__UNSET
+        self.__work_flow_response = LazyNotification.__UNSET
+        self.__optional_transaction_params = LazyNotification.__UNSET
+
+    @property
+    def operations(self) -> Optional[List[Operation]]:
+        if self.__operations is LazyNotification.__UNSET:
+            if self.__raw_operations is None:
+                self.__operations = None
+            else:
+                self.__operations = [self.__get_built_operation(index)
+                                     for index in range(len(self.__raw_operations))]
+        return self.__operations
+
+    @operations.setter
+    def operations(self, operations: Optional[List[Operation]]):
+        self.__operations = operations
+
+    @property
+    def workFlowResponse(self) -> Optional[WorkFlowResponse]:
+        if self.__work_flow_response is LazyNotification.__UNSET:
+            self.__work_flow_response = self.__build(self.__build_work_flow_response,
+                                                     self.__raw_work_flow_response)
+        return self.__work_flow_response
+
+    @workFlowResponse.setter
+    def workFlowResponse(self, work_flow_response: Optional[WorkFlowResponse]):
+        self.__work_flow_response = work_flow_response
+
+    @property
+    def optionalTransactionParams(self) -> Optional[OptionalTransactionParams]:
+        if self.__optional_transaction_params is LazyNotification.__UNSET:
+            self.__optional_transaction_params = self.__build(self.__build_optional_transaction_params,
+                                                              self.__raw_optional_transaction_params)
+        return self.__optional_transaction_params
+
+    @optionalTransactionParams.setter
+    def optionalTransactionParams(self, optional_transaction_params: Optional[OptionalTransactionParams]):
+        self.__optional_transaction_params = optional_transaction_params
+
+    def get_operation(self, index: int) -> Optional[Operation]:
+        if self.__operations is not LazyNotification.__UNSET:
+            return super().get_operation(index)
+        if self.__raw_operations is None:
+            return None
+        # Normalizes negative indexes and raises IndexError like the list would.
+        return self.__get_built_operation(range(len(self.__raw_operations))[index])
+
+    def get_entry_index(self) -> Mapping[str, Any]:
+        # The extra details are indexed straight from the parsed tree, so no operation is built for it.
+        if self.__raw_entry_index is None:
+            self.__raw_entry_index = (self.__build_entry_index(self.__raw_operations)
+                                      if self.__raw_operations is not None else {})
+        return MappingProxyType(self.__raw_entry_index)
+
+    def is_materialized(self) -> bool:
+        return (self.__operations is not LazyNotification.__UNSET
+                and self.__work_flow_response is not LazyNotification.__UNSET
+                and self.__optional_transaction_params is not LazyNotification.__UNSET)
+
+    def to_notification(self) -> Notification:
+        return Notification(message=self.message, status=self.status, operations=self.operations,
+                            workFlowResponse=self.workFlowResponse,
+                            optionalTransactionParams=self.optionalTransactionParams)
+
+    def __get_built_operation(self, index: int) -> Operation:
+        operation = self.__built_operations.get(index, LazyNotification.__UNSET)
+        if operation is LazyNotification.__UNSET:
+            operation = self.__build_operation(self.__raw_operations[index])
+            self.__built_operations[index] = operation
+        return operation
+
+    @staticmethod
+    def __build(build: Callable, raw):
+        return build(raw) if raw is not None else None
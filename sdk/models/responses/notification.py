@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Iterable, Mapping, Tuple
 from dataclasses_json import dataclass_json, config, Undefined
 from sdk.enums.currency import Currency
 from sdk.enums.operation_types import OperationTypes
@@ -59,15 +60,41 @@ class Entry:
     value: Optional[str] = None
 
 
+class IndexedEntries:
+    # Case-insensitive index over the entry list, built on the first lookup and kept by the instance. The first
+    # entry of a key wins, like the linear search it replaces. Entries are not expected to change after parsing.
+    __index = None
+
+    def get_index(self) -> Mapping[str, Any]:
+        if self.__index is None:
+            self.__index = IndexedEntries.index_items(
+                {}, ((item.key, item.value) for item in self.entry or () if item is not None))
+        return MappingProxyType(self.__index)
+
+    def get_value(self, key: str) -> Optional[Any]:
+        return self.get_index().get(key.lower())
+
+    def get_values(self, *keys: str) -> Dict[str, Optional[Any]]:
+        index = self.get_index()
+        return {key: index.get(key.lower()) for key in keys}
+
+    @staticmethod
+    def index_items(index: Dict[str, Any], items: Iterable[Tuple[Any, Any]]) -> Dict[str, Any]:
+        for key, value in items:
+            if isinstance(key, str):
+                index.setdefault(key.lower(), value)
+        return index
+
+
 @dataclass_json(undefined=Undefined.EXCLUDE)
 @dataclass
-class ExtraDetails:
+class ExtraDetails(IndexedEntries):
     entry: Optional[List[Entry]] = None
 
 
 @dataclass_json(undefined=Undefined.EXCLUDE)
 @dataclass
-class OptionalTransactionParams:
+class OptionalTransactionParams(IndexedEntries):
     entry: Optional[List[Entry]] = None
 
 
@@ -135,31 +162,48 @@ class Notification:
     optionalTransactionParams: Optional[OptionalTransactionParams] = field(
         default=None, metadata=config(decoder=ParsingUtils.parse_optional_trx_params)
     )
+    # Not annotated, so it stays out of the dataclass fields.
+    __entry_index = None
 
-    def is_last_notification(self) -> bool:
+    def get_operation(self, index: int) -> Optional[Operation]:
         if self.operations is None:
+            return None
+        return self.operations[index]
+
+    def is_last_notification(self) -> bool:
+        operation = self.get_operation(-1)
+        if operation is None:
             return False
-        return self.operations[-1].status.lower() == "SUCCESS".lower() or self.operations[
-            -1].status.lower() == "ERROR".lower()
+        return operation.status.lower() == "SUCCESS".lower() or operation.status.lower() == "ERROR".lower()
 
     def get_redirect_url(self) -> Optional[str]:
-        if self.operations is None:
+        operation = self.get_operation(-1)
+        if operation is None:
             return None
-        redirection_url = self.operations[-1].redirectionResponse
+        redirection_url = operation.redirectionResponse
         if redirection_url is not None and len(redirection_url) > 0:
             return redirection_url.replace("redirect:", "")
         return None
 
+    def get_entry_index(self) -> Mapping[str, Any]:
+        # Extra details of every operation merged into one case-insensitive index, an earlier operation wins. Built
+        # on the first lookup and kept by the instance, like the IndexedEntries indexes.
+        if self.__entry_index is None:
+            index = {}
+            for operation in self.operations or ():
+                if (operation is not None and operation.paymentDetails is not None
+                        and operation.paymentDetails.extraDetails is not None):
+                    for key, value in operation.paymentDetails.extraDetails.get_index().items():
+                        index.setdefault(key, value)
+            self.__entry_index = index
+        return MappingProxyType(self.__entry_index)
+
     def get_entry(self, entry_key: str):
-        if (self.operations is None or self.operations[0].paymentDetails is None
-                or self.operations[0].paymentDetails.extraDetails is None
-                or self.operations[0].paymentDetails.extraDetails.entry is None):
-            return None
-        else:
-            entries = self.operations[0].paymentDetails.extraDetails.entry
-            search_string = entry_key.lower()
-            result = next((entry for entry in entries if entry.key.lower() == search_string), None)
-            return result.value if result is not None else None
+        return self.get_entry_index().get(entry_key.lower())
+
+    def get_entries(self, *entry_keys: str) -> Dict[str, Optional[Any]]:
+        index = self.get_entry_index()
+        return {entry_key: index.get(entry_key.lower()) for entry_key in entry_keys}
 
     def get_nemuru_txn_id(self) -> Optional[str]:
         return self.get_entry("nemuruTxnId")
@@ -180,15 +224,17 @@ class Notification:
         return self.get_entry("disableFormEdition")
 
     def get_merchant_transaction_id(self) -> Optional[str]:
-        if self.operations is None:
+        operation = self.get_operation(-1)
+        if operation is None:
             return None
-        return self.operations[-1].merchantTransactionId
+        return operation.merchantTransactionId
 
     def get_transaction_result(self) -> Optional[TransactionResult]:
-        if self.operations is None:
+        operation = self.get_operation(-1)
+        if operation is None:
             return None
         try:
-            return TransactionResult.get_by_status(self.operations[-1].status.upper())
+            return TransactionResult.get_by_status(operation.status.upper())
         except KeyError:
             return None
 
@@ -9,6 +9,7 @@ class PaymentResponse:
     __errorMessage: str
     __notification: Notification
     __redirectURL: str
+    __exception: Exception = None
 
     def get_raw_response(self) -> str:
         return self.__rawResponse
@@ -45,3 +46,9 @@ class PaymentResponse:
 
     def get_redirect_url(self) -> str:
         return self.__redirectURL
+
+    def set_exception(self, exception: Exception) -> None:
+        self.__exception = exception
+
+    def get_exception(self) -> Exception:
+        return self.__exception
@@ -0,0 +1,140 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Dict, Tuple, Optional, Awaitable
+
+from sdk.enums.error import Error
+from sdk.enums.idempotency import Idempotency
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.deadline import Deadline
+from sdk.models.requests.h2h.h2h_pre_authorization_capture import H2HPreAuthorizationCapture
+from sdk.models.requests.h2h.h2h_refund import H2HRefund
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.requests.js.js_authorization_request import JSAuthorizationRequest
+
+
+class RetryPolicy:
+    DEFAULT_MAX_ATTEMPTS: int = 3
+    DEFAULT_BASE_DELAY: float = 0.2
+    DEFAULT_MAX_DELAY: float = 5.0
+    DEFAULT_BUDGET_RATIO: float = 0.2
+    DEFAULT_MAX_BUDGET: float = 10.0
+
+    RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+
+    # Operations on an existing transaction (keyed on transactionId) can be sent again safely, every other request
+    # is a debit. A debit is sent again after Error.CONNECTION_ERROR only, when it never left, unless
+    # trust_gateway_deduplication: it is then also sent again after a Error.NETWORK_ERROR such as a read timeout,
+    # and only the gateway deduplicating its merchantTransactionId keeps it from being charged twice.
+    __DEFAULT_IDEMPOTENCY: Dict[type, Idempotency] = {
+        H2HVoid: Idempotency.IDEMPOTENT,
+        H2HRefund: Idempotency.IDEMPOTENT,
+        H2HPreAuthorizationCapture: Idempotency.IDEMPOTENT,
+        JSAuthorizationRequest: Idempotency.IDEMPOTENT,
+    }
+
+    def __init__(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS, base_delay: float = DEFAULT_BASE_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY, budget_ratio: float = DEFAULT_BUDGET_RATIO,
+                 max_budget: float = DEFAULT_MAX_BUDGET, trust_gateway_deduplication: bool = False):
+        if max_attempts is None or max_attempts < 1:
+            raise InvalidFieldException("maxAttempts: Should be (maxAttempts >= 1)")
+        if base_delay is None or base_delay < 0 or max_delay is None or max_delay < base_delay:
+            raise InvalidFieldException("baseDelay: Should be (0 <= baseDelay <= maxDelay)")
+        if budget_ratio is None or budget_ratio < 0 or max_budget is None or max_budget < 0:
+            raise InvalidFieldException("budgetRatio: Should be (budgetRatio >= 0 and maxBudget >= 0)")
+        self.__max_attempts = max_attempts
+        self.__base_delay = base_delay
+        self.__max_delay = max_delay
+        # Every request deposits budget_ratio tokens and every retry withdraws one, so retries stay
+        # below budget_ratio of the traffic when the gateway is failing.
+        self.__budget_ratio = budget_ratio
+        self.__max_budget = max_budget
+        self.__budget = max_budget
+        self.__budget_lock = threading.Lock()
+        self.__idempotency: Dict[type, Idempotency] = dict(RetryPolicy.__DEFAULT_IDEMPOTENCY)
+        self.__trust_gateway_deduplication = trust_gateway_deduplication
+
+    def get_max_attempts(self) -> int:
+        return self.__max_attempts
+
+    def get_base_delay(self) -> float:
+        return self.__base_delay
+
+    def get_max_delay(self) -> float:
+        return self.__max_delay
+
+    def get_budget(self) -> float:
+        return self.__budget
+
+    def get_trust_gateway_deduplication(self) -> bool:
+        return self.__trust_gateway_deduplication
+
+    def set_idempotency(self, request_class: type, idempotency: Idempotency):
+        self.__idempotency[request_class] = idempotency
+
+    def get_idempotency(self, request) -> Idempotency:
+        return self.__idempotency.get(type(request), Idempotency.DEDUPLICATED)
+
+    def get_backoff(self, attempt: int) -> float:
+        # Exponential backoff with full jitter.
+        return random.uniform(0, min(self.__max_delay, self.__base_delay * (2 ** (attempt - 1))))
+
+    def is_retryable(self, response: Tuple[any, Optional[str]], idempotency: Idempotency) -> bool:
+        if idempotency == Idempotency.NON_IDEMPOTENT:
+            return False
+        if response[0] == Error.CONNECTION_ERROR:
+            return True
+        if response[0] == Error.NETWORK_ERROR:
+            return idempotency == Idempotency.IDEMPOTENT or self.__trust_gateway_deduplication
+        return idempotency == Idempotency.IDEMPOTENT and response[0] in RetryPolicy.RETRYABLE_STATUS_CODES
+
+    def execute(self, send: Callable[[], Tuple[any, Optional[str]]], request,
+                deadline: Deadline = None) -> Tuple[any, Optional[str]]:
+        idempotency = self.get_idempotency(request)
+        self.__deposit()
+        response = send()
+        attempt = 1
+        while True:
+            delay = self.__next_delay(response, idempotency, attempt, deadline)
+            if delay is None:
+                return response
+            time.sleep(delay)
+            attempt += 1
+            response = send()
+
+    async def execute_async(self, send: Callable[[], Awaitable[Tuple[any, Optional[str]]]], request,
+                            deadline: Deadline = None) -> Tuple[any, Optional[str]]:
+        idempotency = self.get_idempotency(request)
+        self.__deposit()
+        response = await send()
+        attempt = 1
+        while True:
+            delay = self.__next_delay(response, idempotency, attempt, deadline)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+            response = await send()
+
+    def __next_delay(self, response: Tuple[any, Optional[str]], idempotency: Idempotency, attempt: int,
+                     deadline: Deadline = None) -> Optional[float]:
+        if attempt >= self.__max_attempts or not self.is_retryable(response, idempotency):
+            return None
+        delay = self.get_backoff(attempt)
+        if deadline is not None and delay >= deadline.remaining():
+            return None
+        if not self.__withdraw():
+            return None
+        return delay
+
+    def __deposit(self):
+        with self.__budget_lock:
+            self.__budget = min(self.__max_budget, self.__budget + self.__budget_ratio)
+
+    def __withdraw(self) -> bool:
+        with self.__budget_lock:
+            if self.__budget < 1:
+                return False
+            self.__budget -= 1
+            return True
@@ -0,0 +1,145 @@
+from typing import Tuple
+
+from sdk.adapters.notification_receiver import NotificationReceiver
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.enums.error import Error
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.enums.response_codes import ResponseCodes
+from sdk.exceptions.field_exception import FieldException
+from sdk.models.metrics_registry import MetricsRegistry
+from sdk.models.request_context import RequestContext
+from sdk.utils.request_utils import RequestUtils
+
+
+class SdkMetrics:
+    # The SDK metrics, fed by the timing hook of the request pipelines and the parse observer of the receivers.
+    # Observing is a dict lookup and a counter increment under a lock per metric, cheap enough to stay on.
+    LATENCY_BUCKETS: Tuple[float, ...] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                                          0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    SIZE_BUCKETS: Tuple[float, ...] = (128, 256, 512, 1024, 2048, 4096, 8192, 16384, 65536, 262144, 1048576)
+
+    UNKNOWN_ENDPOINT: str = "UNKNOWN"
+
+    __STAGE_LABELS = {stage: stage.value for stage in PipelineStage}
+
+    def __init__(self, registry: MetricsRegistry = None):
+        self.__registry = registry if registry is not None else MetricsRegistry()
+        self.__stage_seconds = self.__registry.histogram(
+            "addonpayments_request_stage_seconds", "Duration of each request pipeline stage.",
+            ("endpoint", "stage"), SdkMetrics.LATENCY_BUCKETS
+        )
+        self.__request_seconds = self.__registry.histogram(
+            "addonpayments_request_seconds", "Duration of the whole request pipeline.",
+            ("endpoint",), SdkMetrics.LATENCY_BUCKETS
+        )
+        self.__responses = self.__registry.counter(
+            "addonpayments_responses_total", "HTTP responses by status class.", ("endpoint", "status_class")
+        )
+        self.__errors = self.__registry.counter(
+            "addonpayments_errors_total", "Requests ending with an Error or an exception.", ("endpoint", "error")
+        )
+        self.__request_bytes = self.__registry.histogram(
+            "addonpayments_request_payload_bytes", "Size of the encrypted query or JSON body sent.",
+            ("endpoint",), SdkMetrics.SIZE_BUCKETS
+        )
+        self.__response_bytes = self.__registry.histogram(
+            "addonpayments_response_payload_bytes", "Size of the response bodies received.",
+            ("endpoint",), SdkMetrics.SIZE_BUCKETS
+        )
+        self.__parse_seconds = self.__registry.histogram(
+            "addonpayments_notification_parse_seconds", "Duration of parse_notification.",
+            ("format",), SdkMetrics.LATENCY_BUCKETS
+        )
+        self.__parse_failures = self.__registry.counter(
+            "addonpayments_notification_parse_failures_total", "Notifications that could not be parsed.",
+            ("format",)
+        )
+
+    def get_registry(self) -> MetricsRegistry:
+        return self.__registry
+
+    def export(self) -> str:
+        return self.__registry.export()
+
+    def install(self, pipeline: RequestPipeline):
+        pipeline.add_timing_hook(self.observe_stage)
+
+    def uninstall(self, pipeline: RequestPipeline):
+        pipeline.remove_timing_hook(self.observe_stage)
+
+    def install_notifications(self, receiver: NotificationReceiver):
+        receiver.set_parse_observer(self.observe_notification_parse)
+
+    @staticmethod
+    def uninstall_notifications(receiver: NotificationReceiver):
+        receiver.set_parse_observer(None)
+
+    def observe_stage(self, stage: PipelineStage, context: RequestContext, duration: float):
+        # The durations are kept on the context, so they are all observed once the request is over.
+        exception = context.get_exception()
+        if exception is not None:
+            endpoint = SdkMetrics.__get_endpoint_label(context)
+            error = Error.MISSING_PARAMETER.name if isinstance(exception, FieldException) else type(exception).__name__
+            self.__errors.inc((endpoint, error))
+            self.__observe_durations(endpoint, context)
+        elif stage is PipelineStage.SEND:
+            self.__observe_send(SdkMetrics.__get_endpoint_label(context), context)
+        elif stage is PipelineStage.MAP_RESPONSE:
+            endpoint = SdkMetrics.__get_endpoint_label(context)
+            result = context.get_result()
+            if result is not None and result.get_is_error() and result.get_error() is not None:
+                self.__errors.inc((endpoint, result.get_error().name))
+            elif result is not None and not result.get_is_error() and \
+                    context.get_route().get_response_mapper() is RequestUtils.to_payment_response:
+                # The responses of the installed pipelines are parsed while mapping them.
+                self.__observe_response_parse(context, result, duration)
+            self.__observe_durations(endpoint, context)
+
+    def observe_notification_parse(self, notification_format: str, duration: float, parsed: bool):
+        self.__parse_seconds.observe(duration, (notification_format,))
+        if not parsed:
+            self.__parse_failures.inc((notification_format,))
+
+    def __observe_response_parse(self, context: RequestContext, result, duration: float):
+        notification_format = "xml" if context.get_response()[1][:1] == '<' else "json"
+        self.observe_notification_parse(notification_format, duration, result.get_notification() is not None)
+
+    def __observe_durations(self, endpoint: str, context: RequestContext):
+        total = 0.0
+        for stage, duration in context.get_durations().items():
+            self.__stage_seconds.observe(duration, (endpoint, SdkMetrics.__STAGE_LABELS[stage]))
+            total += duration
+        self.__request_seconds.observe(total, (endpoint,))
+
+    def __observe_send(self, endpoint: str, context: RequestContext):
+        body = context.get_body()
+        if body is not None:
+            self.__request_bytes.observe(len(body), (endpoint,))
+        elif context.get_query_parameters() is not None:
+            self.__request_bytes.observe(len(context.get_query_parameters().get("encrypted", "")), (endpoint,))
+
+        response = context.get_response()
+        if response is None or isinstance(response[0], Error):
+            return
+        self.__responses.inc((endpoint, SdkMetrics.get_status_class(response[0])))
+        if response[1] is not None:
+            self.__response_bytes.observe(len(response[1]), (endpoint,))
+
+    @staticmethod
+    def __get_endpoint_label(context: RequestContext) -> str:
+        # The stages before ENDPOINT are labelled with the endpoint the request is going to.
+        endpoint = context.get_endpoint()
+        if endpoint is None:
+            credentials = context.get_credentials()
+            if credentials is None or credentials.get_environment() is None:
+                return SdkMetrics.UNKNOWN_ENDPOINT
+            endpoint = context.get_route().get_endpoint(credentials.get_environment())
+        return endpoint.name
+
+    @staticmethod
+    def get_status_class(status_code: int) -> str:
+        if ResponseCodes.is_success(status_code):
+            return "success"
+        if ResponseCodes.is_client_error(status_code):
+            return "client_error"
+        return "server_error"
@@ -0,0 +1,60 @@
+import sqlite3
+import threading
+import time
+
+from sdk.exceptions.field_exception import InvalidFieldException
+
+
+class SqliteDedupStore:
+    DEFAULT_TTL: float = 7 * 24 * 60 * 60
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL):
+        if ttl is None or ttl <= 0:
+            raise InvalidFieldException("ttl: Should be (ttl > 0)")
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS notification_dedup (key BLOB PRIMARY KEY, seen_at REAL NOT NULL)"
+        )
+
+    def get_ttl(self) -> float:
+        return self.__ttl
+
+    def add(self, key: bytes) -> bool:
+        # Returns False when the key was already seen within the TTL. Wall clock time, so it survives restarts.
+        now = time.time()
+        with self.__lock:
+            cursor = self.__connection.execute(
+                "INSERT INTO notification_dedup (key, seen_at) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET seen_at = excluded.seen_at WHERE seen_at <= ?",
+                (key, now, now - self.__ttl)
+            )
+            return cursor.rowcount == 1
+
+    def contains(self, key: bytes) -> bool:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT 1 FROM notification_dedup WHERE key = ? AND seen_at > ?", (key, time.time() - self.__ttl)
+            ).fetchone()
+            return row is not None
+
+    def remove(self, key: bytes):
+        with self.__lock:
+            self.__connection.execute("DELETE FROM notification_dedup WHERE key = ?", (key,))
+
+    def purge(self) -> int:
+        with self.__lock:
+            cursor = self.__connection.execute("DELETE FROM notification_dedup WHERE seen_at <= ?",
+                                               (time.time() - self.__ttl,))
+            return cursor.rowcount
+
+    def __len__(self):
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM notification_dedup").fetchone()[0]
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
@@ -0,0 +1,44 @@
+from typing import Dict, Tuple
+
+from sdk.enums.endpoint_family import EndpointFamily
+from sdk.exceptions.field_exception import InvalidFieldException
+
+
+class TimeoutConfig:
+    DEFAULT_CONNECT_TIMEOUT: float = 5.0
+    DEFAULT_READ_TIMEOUT: float = 30.0
+
+    __DEFAULT_READ_TIMEOUTS: Dict[EndpointFamily, float] = {
+        EndpointFamily.H2H_PAY: 60.0,
+        EndpointFamily.CAPTURE: 30.0,
+        EndpointFamily.VOID: 30.0,
+        EndpointFamily.REBATE: 30.0,
+        EndpointFamily.JS_AUTH: 15.0,
+        EndpointFamily.JS_CHARGE: 60.0,
+        EndpointFamily.TOKENIZE: 30.0,
+    }
+
+    def __init__(self, connect_timeout: float = DEFAULT_CONNECT_TIMEOUT, read_timeout: float = DEFAULT_READ_TIMEOUT):
+        TimeoutConfig.__check_timeouts(connect_timeout, read_timeout)
+        self.__connect_timeout = connect_timeout
+        self.__read_timeout = read_timeout
+        self.__timeouts: Dict[EndpointFamily, Tuple[float, float]] = {
+            family: (connect_timeout, read) for family, read in TimeoutConfig.__DEFAULT_READ_TIMEOUTS.items()
+        }
+
+    def set_timeout(self, endpoint_family: EndpointFamily, connect_timeout: float, read_timeout: float):
+        TimeoutConfig.__check_timeouts(connect_timeout, read_timeout)
+        self.__timeouts[endpoint_family] = (connect_timeout, read_timeout)
+
+    def get_timeout(self, endpoint_family: EndpointFamily) -> Tuple[float, float]:
+        return self.__timeouts.get(endpoint_family, (self.__connect_timeout, self.__read_timeout))
+
+    def get_timeout_by_url(self, url: str) -> Tuple[float, float]:
+        return self.get_timeout(EndpointFamily.get_by_url(url))
+
+    @staticmethod
+    def __check_timeouts(connect_timeout: float, read_timeout: float):
+        if connect_timeout is None or connect_timeout <= 0:
+            raise InvalidFieldException("connectTimeout: Should be (connectTimeout > 0)")
+        if read_timeout is None or read_timeout <= 0:
+            raise InvalidFieldException("readTimeout: Should be (readTimeout > 0)")
@@ -0,0 +1,89 @@
+import time
+from typing import Dict, List, Optional
+
+from sdk.enums.operation_types import OperationTypes
+from sdk.enums.transaction import TransactionResult
+from sdk.models.responses.notification import Operation
+
+
+class TransactionState:
+    FINAL_RESULTS = (TransactionResult.SUCCESS, TransactionResult.ERROR, TransactionResult.FAIL)
+    # Services of the operations that authenticate a payment (TRA, 3DSv1, 3DSv2) before the payment operation itself.
+    AUTHENTICATION_SERVICES = ("TRA", "3DS")
+
+    def __init__(self, merchant_transaction_id: str):
+        self.__merchant_transaction_id = merchant_transaction_id
+        self.__transaction_ids: List[str] = []
+        self.__operation_type: Optional[OperationTypes] = None
+        self.__result: Optional[TransactionResult] = None
+        self.__status: Optional[str] = None
+        # Result reached by each operation type, so a late notification of an earlier operation can be rejected.
+        self.__results: Dict[Optional[OperationTypes], Optional[TransactionResult]] = {}
+        self.__notifications = 0
+        self.__updated_at: float = None
+
+    def get_merchant_transaction_id(self) -> str:
+        return self.__merchant_transaction_id
+
+    def get_transaction_id(self) -> Optional[str]:
+        return self.__transaction_ids[-1] if self.__transaction_ids else None
+
+    def get_transaction_ids(self) -> List[str]:
+        return list(self.__transaction_ids)
+
+    def get_operation_type(self) -> Optional[OperationTypes]:
+        return self.__operation_type
+
+    def get_result(self) -> Optional[TransactionResult]:
+        return self.__result
+
+    def get_status(self) -> Optional[str]:
+        return self.__status
+
+    def get_results(self) -> Dict[Optional[OperationTypes], Optional[TransactionResult]]:
+        return dict(self.__results)
+
+    def get_result_for(self, operation_type: OperationTypes) -> Optional[TransactionResult]:
+        return self.__results.get(operation_type)
+
+    def get_notifications(self) -> int:
+        return self.__notifications
+
+    def get_updated_at(self) -> float:
+        return self.__updated_at
+
+    def is_final(self) -> bool:
+        return self.__result in TransactionState.FINAL_RESULTS
+
+    def has_operation_type(self, operation_type: Optional[OperationTypes]) -> bool:
+        return operation_type in self.__results
+
+    def apply(self, transaction_id: Optional[str], operation_type: Optional[OperationTypes],
+              result: Optional[TransactionResult], status: Optional[str]):
+        if transaction_id is not None and transaction_id not in self.__transaction_ids:
+            self.__transaction_ids.append(transaction_id)
+        self.__operation_type = operation_type
+        self.__result = result
+        self.__status = status
+        self.__results[operation_type] = result
+        self.__notifications += 1
+        self.__updated_at = time.time()
+
+    @staticmethod
+    def is_authentication_operation(operation: Operation) -> bool:
+        service = operation.service.upper() if operation.service is not None else ""
+        return any(service.startswith(prefix) for prefix in TransactionState.AUTHENTICATION_SERVICES)
+
+    @staticmethod
+    def get_operation_result(operation: Operation) -> Optional[TransactionResult]:
+        # The SUCCESS of a TRA or 3DS operation is not the result of the payment, only its redirection to the
+        # challenge is kept. Everything else of these operations counts as no result yet.
+        result = TransactionResult.get_by_status(operation.status.upper()) if operation.status is not None else None
+        if result != TransactionResult.REDIRECTED and TransactionState.is_authentication_operation(operation):
+            return None
+        return result
+
+    def __str__(self):
+        return (f"merchantTransactionId={self.__merchant_transaction_id}, transactionId={self.get_transaction_id()}, "
+                f"operationType={self.__operation_type.name if self.__operation_type else None}, "
+                f"result={self.__result.name if self.__result else None}, status={self.__status}")
@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from sdk.enums.transaction import TransactionResult
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.responses.notification import Notification
+from sdk.models.transaction_state import TransactionState
+
+
+class TransactionTracker:
+    # Folds the notifications of each merchantTransactionId into one TransactionState. Notifications can arrive out
+    # of order, so one that would move an operation back (e.g. REDIRECTED after SUCCESS) is rejected. A different
+    # operation type on the same transaction (capture, refund, void...) starts a new phase, even after a final
+    # result. The TRA and 3DS operations of a payment never make it final, only the payment operation does.
+    # Final transactions are kept for finalTtl seconds to absorb late notifications, then evicted.
+    DEFAULT_MAX_TRANSACTIONS: int = 100000
+    DEFAULT_FINAL_TTL: float = 300.0
+
+    __RANKS: Dict[Optional[TransactionResult], int] = {
+        None: 0,
+        TransactionResult.REDIRECTED: 1,
+        TransactionResult.PENDING: 2,
+        TransactionResult.SUCCESS: 3,
+        TransactionResult.ERROR: 3,
+        TransactionResult.FAIL: 3,
+    }
+
+    def __init__(self, max_transactions: int = DEFAULT_MAX_TRANSACTIONS, final_ttl: float = DEFAULT_FINAL_TTL):
+        if max_transactions is None or max_transactions < 1:
+            raise InvalidFieldException("maxTransactions: Should be (maxTransactions >= 1)")
+        if final_ttl is None or final_ttl < 0:
+            raise InvalidFieldException("finalTtl: Should be (finalTtl >= 0)")
+        self.__max_transactions = max_transactions
+        self.__final_ttl = final_ttl
+        self.__lock = threading.Lock()
+        self.__states: OrderedDict = OrderedDict()
+        self.__merchant_ids_by_transaction_id: Dict[str, str] = {}
+        # merchantTransactionId -> time it became final, oldest first.
+        self.__finalized: OrderedDict = OrderedDict()
+        self.__accepted = 0
+        self.__rejected = 0
+        self.__untracked = 0
+
+    def get_accepted(self) -> int:
+        return self.__accepted
+
+    def get_rejected(self) -> int:
+        return self.__rejected
+
+    def get_untracked(self) -> int:
+        return self.__untracked
+
+    def get_by_merchant_transaction_id(self, merchant_transaction_id: str) -> Optional[TransactionState]:
+        return self.__states.get(merchant_transaction_id)
+
+    def get_by_transaction_id(self, transaction_id: str) -> Optional[TransactionState]:
+        with self.__lock:
+            merchant_transaction_id = self.__merchant_ids_by_transaction_id.get(transaction_id)
+            return self.__states.get(merchant_transaction_id) if merchant_transaction_id is not None else None
+
+    def update(self, notification: Notification) -> Optional[TransactionState]:
+        # Returns the state after the notification, or None when it was rejected or cannot be tracked.
+        try:
+            operation = notification.get_operation(-1)
+        except IndexError:
+            operation = None
+        if operation is None or (operation.merchantTransactionId is None and operation.transactionId is None):
+            with self.__lock:
+                self.__untracked += 1
+            return None
+        result = TransactionState.get_operation_result(operation)
+        operation_type = operation.operationType
+        now = time.monotonic()
+
+        with self.__lock:
+            self.__evict_finalized(now)
+            merchant_transaction_id = operation.merchantTransactionId
+            if merchant_transaction_id is None:
+                merchant_transaction_id = self.__merchant_ids_by_transaction_id.get(operation.transactionId)
+                if merchant_transaction_id is None:
+                    self.__untracked += 1
+                    return None
+
+            state = self.__states.get(merchant_transaction_id)
+            if state is None:
+                state = TransactionState(merchant_transaction_id)
+                self.__states[merchant_transaction_id] = state
+            elif state.has_operation_type(operation_type) and self.__is_regression(
+                    state.get_result_for(operation_type), result):
+                self.__rejected += 1
+                return None
+
+            state.apply(operation.transactionId, operation_type, result, operation.status)
+            self.__states.move_to_end(merchant_transaction_id)
+            if operation.transactionId is not None:
+                self.__merchant_ids_by_transaction_id[operation.transactionId] = merchant_transaction_id
+            if state.is_final():
+                self.__finalized[merchant_transaction_id] = now
+                self.__finalized.move_to_end(merchant_transaction_id)
+            else:
+                self.__finalized.pop(merchant_transaction_id, None)
+            while len(self.__states) > self.__max_transactions:
+                self.__remove(next(iter(self.__states)))
+            self.__accepted += 1
+            return state
+
+    def evict_finalized(self):
+        with self.__lock:
+            self.__evict_finalized(time.monotonic())
+
+    def remove(self, merchant_transaction_id: str):
+        with self.__lock:
+            self.__remove(merchant_transaction_id)
+
+    def __len__(self):
+        return len(self.__states)
+
+    @staticmethod
+    def __is_regression(previous: Optional[TransactionResult], result: Optional[TransactionResult]) -> bool:
+        # A final result is never replaced, a repeated one is a duplicate.
+        if previous in TransactionState.FINAL_RESULTS:
+            return True
+        return TransactionTracker.__RANKS[result] < TransactionTracker.__RANKS[previous]
+
+    def __evict_finalized(self, now: float):
+        finalized = self.__finalized
+        while finalized:
+            merchant_transaction_id, finalized_at = next(iter(finalized.items()))
+            if now - finalized_at < self.__final_ttl:
+                break
+            self.__remove(merchant_transaction_id)
+
+    def __remove(self, merchant_transaction_id: str):
+        self.__finalized.pop(merchant_transaction_id, None)
+        state = self.__states.pop(merchant_transaction_id, None)
+        if state is None:
+            return
+        for transaction_id in state.get_transaction_ids():
+            if self.__merchant_ids_by_transaction_id.get(transaction_id) == merchant_transaction_id:
+                del self.__merchant_ids_by_transaction_id[transaction_id]
@@ -0,0 +1,193 @@
+import asyncio
+import os
+
+import pytest
+
+from sdk.adapters.async_h2h_payment_adapter import AsyncH2HPaymentAdapter
+from sdk.adapters.async_hosted_payment_adapter import AsyncHostedPaymentAdapter
+from sdk.adapters.async_js_payment_adapter import AsyncJSPaymentAdapter
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.enums.country_code import CountryCodeAlpha2
+from sdk.enums.currency import Currency
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.environment import Environment
+from sdk.enums.error import Error
+from sdk.enums.operation_types import OperationTypes
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.exceptions.field_exception import MissingFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.requests.h2h.h2h_redirection import H2HRedirection
+from sdk.models.requests.h2h.h2h_refund import H2HRefund
+from sdk.models.requests.hosted.hosted_payment_redirection import HostedPaymentRedirection
+from sdk.models.requests.js.js_charge import JSCharge
+
+mock_configurations = {
+    "merchantId": "116819",
+    "merchantPassword": "a193a2de8ed6140e848d5015620e8129",
+    "merchantKey": "35354a8e-ce22-40e1-863a-e58a8e53488e",
+    "productId": "1168190001",
+    "statusUrl": "https://test.com/status",
+    "successUrl": "https://test.com/success",
+    "errorUrl": "https://test.com/fail",
+    "awaitingUrl": "https://test.com/await",
+    "cancelUrl": "https://test.com/cancel"
+}
+
+fixed_iv = bytes([0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10])
+
+
+@pytest.fixture(autouse=True)
+def setup_mock_security_utils(mocker):
+    mocker.patch('sdk.utils.security_utils.SecurityUtils.generate_iv', return_value=fixed_iv)
+    return mocker
+
+
+@pytest.fixture
+def setup_credentials():
+    credentials = Credentials()
+    credentials.set_merchant_id(mock_configurations["merchantId"])
+    credentials.set_merchant_pass(mock_configurations["merchantPassword"])
+    credentials.set_merchant_key(mock_configurations["merchantKey"])
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id(mock_configurations["productId"])
+    credentials.set_api_version(5)
+    return credentials
+
+
+def read_xml_content(file_name):
+    current_file_directory = os.path.dirname(os.path.abspath(__file__))
+    xml_file_path = os.path.join(current_file_directory, 'notifications', file_name)
+
+    if not os.path.exists(xml_file_path):
+        raise FileNotFoundError(f"The file {xml_file_path} was not found.")
+
+    with open(xml_file_path, 'r') as file:
+        return file.read()
+
+
+def create_h2h_redirection(merchant_transaction_id="33312"):
+    h2h_redirection = H2HRedirection()
+    h2h_redirection.set_amount("50.4321222")
+    h2h_redirection.set_currency(Currency.EUR)
+    h2h_redirection.set_country(CountryCodeAlpha2.ES)
+    h2h_redirection.set_card_number("4907270002222227")
+    h2h_redirection.set_customer_id("903")
+    h2h_redirection.set_merchant_transaction_id(merchant_transaction_id)
+    h2h_redirection.set_ch_name("First name Last name")
+    h2h_redirection.set_cvn_number("123")
+    h2h_redirection.set_exp_date("0625")
+    h2h_redirection.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_redirection.set_status_url(mock_configurations["statusUrl"])
+    h2h_redirection.set_success_url(mock_configurations["successUrl"])
+    h2h_redirection.set_error_url(mock_configurations["errorUrl"])
+    h2h_redirection.set_awaiting_url(mock_configurations["awaitingUrl"])
+    h2h_redirection.set_cancel_url(mock_configurations["cancelUrl"])
+    return h2h_redirection
+
+
+def test_async_h2h_request_matches_sync_request(setup_credentials, mocker):
+    response = (200, read_xml_content('h2h_response.xml'))
+    mock_sync_send = mocker.patch.object(NetworkAdapter, 'send_request', return_value=response)
+    mock_async_send = mocker.patch.object(AsyncNetworkAdapter, 'send_request', return_value=response)
+
+    sync_result = H2HPaymentAdapter(setup_credentials).send_h2h_payment_request(create_h2h_redirection())
+    async_result = asyncio.run(
+        AsyncH2HPaymentAdapter(setup_credentials).send_h2h_payment_request(create_h2h_redirection())
+    )
+
+    assert mock_async_send.call_args[1] == mock_sync_send.call_args[1]
+    assert async_result.get_is_error() is False
+    assert async_result.get_notification().get_redirect_url() == sync_result.get_notification().get_redirect_url()
+
+
+def test_async_h2h_refund_maps_server_error(setup_credentials, mocker):
+    mocker.patch.object(AsyncNetworkAdapter, 'send_request', return_value=(503, ""))
+
+    h2h_refund = H2HRefund()
+    h2h_refund.set_amount("10")
+    h2h_refund.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_refund.set_transaction_id("7817740")
+    h2h_refund.set_merchant_transaction_id("12345")
+
+    result = asyncio.run(AsyncH2HPaymentAdapter(setup_credentials).send_h2h_refund_request(h2h_refund))
+
+    assert result.get_is_error() is True
+    assert result.get_error() == Error.SERVER_ERROR
+
+
+def test_async_hosted_returns_redirect_url(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(AsyncNetworkAdapter, 'send_request',
+                                            return_value=(200, "http://redirect.url"))
+
+    hosted_payment_redirection = HostedPaymentRedirection()
+    hosted_payment_redirection.set_amount("50")
+    hosted_payment_redirection.set_currency(Currency.EUR)
+    hosted_payment_redirection.set_country(CountryCodeAlpha2.ES)
+    hosted_payment_redirection.set_customer_id("903")
+    hosted_payment_redirection.set_merchant_transaction_id("3123123")
+    hosted_payment_redirection.set_payment_solution(PaymentSolutions.creditcards)
+    hosted_payment_redirection.set_status_url(mock_configurations["statusUrl"])
+    hosted_payment_redirection.set_success_url(mock_configurations["successUrl"])
+    hosted_payment_redirection.set_error_url(mock_configurations["errorUrl"])
+    hosted_payment_redirection.set_awaiting_url(mock_configurations["awaitingUrl"])
+    hosted_payment_redirection.set_cancel_url(mock_configurations["cancelUrl"])
+
+    result = asyncio.run(AsyncHostedPaymentAdapter(setup_credentials).send_hosted_payment_request(
+        hosted_payment_redirection
+    ))
+
+    assert result.get_redirect_url() == "http://redirect.url"
+    assert mock_send_request.call_args[1]['url'] == Endpoints.HOSTED_ENDPOINT_STG.value
+
+
+def test_async_js_charge_raises_on_missing_field(setup_credentials):
+    js_charge = JSCharge()
+    js_charge.set_amount("30")
+    js_charge.set_country(CountryCodeAlpha2.ES)
+    js_charge.set_customer_id("55")
+    js_charge.set_currency(Currency.EUR)
+    js_charge.set_operation_type(OperationTypes.DEBIT)
+    js_charge.set_payment_solution(PaymentSolutions.creditcards)
+
+    with pytest.raises(MissingFieldException):
+        asyncio.run(AsyncJSPaymentAdapter(setup_credentials).send_js_charge_request(js_charge))
+
+
+def test_async_requests_run_concurrently_on_one_event_loop(setup_credentials):
+    class SlowNetworkAdapter(AsyncNetworkAdapter):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def send_request(self, headers, query_parameters, json, url, deadline=None):
+            SlowNetworkAdapter.in_flight += 1
+            SlowNetworkAdapter.max_in_flight = max(SlowNetworkAdapter.max_in_flight, SlowNetworkAdapter.in_flight)
+            await asyncio.sleep(0.05)
+            SlowNetworkAdapter.in_flight -= 1
+            return 200, "http://redirect.url"
+
+    adapter = AsyncH2HPaymentAdapter(setup_credentials, SlowNetworkAdapter())
+
+    async def run():
+        return await asyncio.gather(*[
+            adapter.send_h2h_payment_request(create_h2h_redirection(str(index))) for index in range(500)
+        ])
+
+    results = asyncio.run(run())
+
+    assert len(results) == 500
+    assert SlowNetworkAdapter.max_in_flight == 500
+
+
+def test_async_refused_connection_is_a_connection_error():
+    network_adapter = AsyncNetworkAdapter()
+
+    async def send():
+        try:
+            return await network_adapter.send_request(headers=None, query_parameters=None, json={},
+                                                      url="http://127.0.0.1:1/")
+        finally:
+            await network_adapter.close()
+
+    assert asyncio.run(send())[0] == Error.CONNECTION_ERROR
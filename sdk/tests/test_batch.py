@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+
+from sdk.adapters.h2h_batch_adapter import H2HBatchAdapter
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.enums.environment import Environment
+from sdk.enums.error import Error
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.requests.h2h.h2h_refund import H2HRefund
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+
+
+@pytest.fixture
+def setup_credentials():
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id("1168190001")
+    credentials.set_api_version(5)
+    return credentials
+
+
+def create_h2h_void(transaction_id):
+    h2h_void = H2HVoid()
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_void.set_transaction_id(str(transaction_id))
+    h2h_void.set_merchant_transaction_id(str(transaction_id))
+    return h2h_void
+
+
+def create_h2h_refund(transaction_id):
+    h2h_refund = H2HRefund()
+    h2h_refund.set_amount("10")
+    h2h_refund.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_refund.set_transaction_id(str(transaction_id))
+    h2h_refund.set_merchant_transaction_id(str(transaction_id))
+    return h2h_refund
+
+
+def test_batch_streams_every_result_with_summary(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request', side_effect=lambda **kwargs: (
+        (503, "") if kwargs['url'].endswith("rebate") else (200, "http://redirect.url")
+    ))
+    mocker.patch('sdk.utils.request_utils.parse_notification', return_value=None)
+    requests = [create_h2h_void(index) if index % 2 else create_h2h_refund(index) for index in range(100)]
+
+    batch = H2HBatchAdapter(H2HPaymentAdapter(setup_credentials), max_workers=8).send_batch(requests)
+    results = list(batch)
+    summary = batch.get_summary()
+
+    assert len(results) == 100
+    assert {id(request) for request, _ in results} == {id(request) for request in requests}
+    assert mock_send_request.call_count == 100
+    assert summary.is_finished() is True
+    assert summary.get_total() == 100
+    assert summary.get_succeeded() == 50
+    assert summary.get_failed() == 50
+    assert summary.get_errors() == {Error.SERVER_ERROR: 50}
+    assert summary.get_throughput() > 0
+
+
+def test_batch_bounds_concurrency_and_read_ahead(setup_credentials, mocker):
+    lock = threading.Lock()
+    state = {"in_flight": 0, "max_in_flight": 0, "read": 0}
+
+    def send_request(**kwargs):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(0.005)
+        with lock:
+            state["in_flight"] -= 1
+        return 503, ""
+
+    def generate_requests():
+        for index in range(200):
+            state["read"] += 1
+            yield create_h2h_void(index)
+
+    mocker.patch.object(NetworkAdapter, 'send_request', side_effect=send_request)
+
+    batch = H2HBatchAdapter(H2HPaymentAdapter(setup_credentials), max_workers=4, max_pending=10)
+    consumed = 0
+    for _ in batch.send_batch(generate_requests()):
+        consumed += 1
+        assert state["read"] - consumed <= 10
+
+    assert consumed == 200
+    assert state["max_in_flight"] <= 4
+
+
+def test_batch_reports_invalid_requestswithout_stopping(setup_credentials, mocker):
+    mocker.patch.object(NetworkAdapter, 'send_request', return_value=(503, ""))
+    invalid_void = H2HVoid()
+
+    batch = H2HBatchAdapter(H2HPaymentAdapter(setup_credentials)).send_batch([invalid_void, create_h2h_void(1)])
+    results = dict((id(request), response) for request, response in batch)
+
+    assert results[id(invalid_void)].get_error() == Error.MISSING_PARAMETER
+    assert batch.get_summary().get_total() == 2
+
+
+def test_invalid_max_pending_raises_exception(setup_credentials):
+    with pytest.raises(InvalidFieldException):
+        H2HBatchAdapter(H2HPaymentAdapter(setup_credentials), max_workers=8, max_pending=4)
+
+
+def test_batch_reports_unexpected_exceptions_without_stopping(setup_credentials, mocker):
+    broken_response = ValueError("broken response")
+
+    def send_request(**kwargs):
+        if kwargs['url'].endswith("rebate"):
+            raise ConnectionError("connection refused")
+        return 200, "<response/>" if kwargs['url'].endswith("void") else "http://redirect.url"
+
+    def parse(content):
+        if content == "<response/>":
+            raise broken_response
+
+    mocker.patch.object(NetworkAdapter, 'send_request', side_effect=send_request)
+    mocker.patch('sdk.utils.request_utils.parse_notification', side_effect=parse)
+    requests = [create_h2h_void(index) if index % 2 else create_h2h_refund(index) for index in range(10)]
+
+    batch = H2HBatchAdapter(H2HPaymentAdapter(setup_credentials), max_workers=2).send_batch(requests)
+    results = dict((id(request), response) for request, response in batch)
+
+    assert len(results) == 10
+    assert results[id(requests[0])].get_error() == Error.NETWORK_ERROR
+    assert results[id(requests[0])].get_error_message() == "ConnectionError: connection refused"
+    # The void was sent before its response failed to parse: it must not look like a network error.
+    assert results[id(requests[1])].get_error() == Error.INVALID_RESPONSE_RECEIVED
+    assert results[id(requests[1])].get_exception() is broken_response
+    assert batch.get_summary().get_errors() == {Error.NETWORK_ERROR: 5, Error.INVALID_RESPONSE_RECEIVED: 5}
\ No newline at end of file
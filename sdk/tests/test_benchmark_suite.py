@@ -0,0 +1,57 @@
+import json
+
+from sdk.benchmarks import benchmark_suite
+
+
+def create_results(benchmarks):
+    return {"format": benchmark_suite.RESULTS_FORMAT, "benchmarks": {
+        name: {"number": 1, "best_us": best, "median_us": best, "stdev_us": 0.0} for name, best in benchmarks.items()
+    }}
+
+
+def test_workloads_cover_stages_carts_and_notifications():
+    benchmarks = benchmark_suite.create_benchmarks()
+
+    for item_count in benchmark_suite.CART_SIZES:
+        assert f"micro.encrypt_query.quix_cart_{item_count}" in benchmarks
+        assert f"macro.send_hosted_quix_item_request.quix_cart_{item_count}" in benchmarks
+        assert f"macro.send_js_quix_item_request.quix_cart_{item_count}" in benchmarks
+    assert "micro.parse_notification.h2h_response.xml" in benchmarks
+    assert "micro.parse_notification.js_charge.json" in benchmarks
+    # The macro benchmarks go through the stubbed transport and get a successful response.
+    assert benchmarks["macro.send_h2h_void_request.h2h_void"]().get_is_error() is False
+    assert benchmarks["macro.send_js_quix_item_request.quix_cart_1000"]().get_is_error() is False
+    assert benchmarks["macro.send_hosted_quix_item_request.quix_cart_10"]().get_redirect_url() is not None
+
+
+def test_run_writes_machine_readable_results(tmp_path):
+    results = benchmark_suite.run("micro.query_serializer.h2h_redirection", repeat=2, min_time=0.001)
+
+    assert list(results["benchmarks"]) == ["micro.query_serializer.h2h_redirection"]
+    result = results["benchmarks"]["micro.query_serializer.h2h_redirection"]
+    assert 0 < result["best_us"] <= result["median_us"]
+    assert result["number"] >= 1
+
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(results))
+    assert benchmark_suite.load(str(path)) == results
+
+
+def test_compare_flags_regressions(tmp_path):
+    baseline = create_results({"a": 100.0, "b": 100.0, "c": 100.0, "d": 100.0})
+    current = create_results({"a": 105.0, "b": 125.0, "c": 80.0, "e": 10.0})
+
+    rows = benchmark_suite.compare(baseline, current, threshold=0.10)
+
+    assert [(name, verdict) for name, _, _, verdict in rows] == [
+        ("a", "unchanged"), ("b", "regression"), ("c", "improvement"), ("d", "missing"), ("e", "new")
+    ]
+    assert benchmark_suite.has_regressions(rows)
+    assert not benchmark_suite.has_regressions(benchmark_suite.compare(baseline, current, threshold=0.30))
+
+    baseline_path = tmp_path / "baseline.json"
+    current_path = tmp_path / "current.json"
+    baseline_path.write_text(json.dumps(baseline))
+    current_path.write_text(json.dumps(current))
+    assert benchmark_suite.main(["compare", str(baseline_path), str(current_path)]) == 1
+    assert benchmark_suite.main(["compare", str(baseline_path), str(baseline_path)]) == 0
@@ -0,0 +1,151 @@
+import asyncio
+import gzip
+import json
+import time
+
+import pytest
+
+from sdk.adapters.async_h2h_payment_adapter import AsyncH2HPaymentAdapter
+from sdk.adapters.async_replay_network_adapter import AsyncReplayNetworkAdapter
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.js_payment_adapter import JSPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.adapters.recording_network_adapter import RecordingNetworkAdapter
+from sdk.adapters.replay_network_adapter import ReplayNetworkAdapter
+from sdk.benchmarks.benchmark_suite import create_credentials, create_h2h_redirection, create_h2h_void
+from sdk.emulator.gateway_emulator import GatewayEmulator
+from sdk.enums.country_code import CountryCodeAlpha2
+from sdk.enums.currency import Currency
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.error import Error
+from sdk.enums.operation_types import OperationTypes
+from sdk.enums.transaction import TransactionResult
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.loadtest.__main__ import main
+from sdk.models.cassette import Cassette
+from sdk.models.deadline import Deadline
+from sdk.models.requests.js.js_authorization_request import JSAuthorizationRequest
+
+
+@pytest.fixture
+def recorded_cassette():
+    credentials = create_credentials()
+    cassette = Cassette()
+    with GatewayEmulator(credentials, latency=0.05) as emulator:
+        h2h_adapter = H2HPaymentAdapter(credentials, RecordingNetworkAdapter(cassette))
+        js_adapter = JSPaymentAdapter(credentials, RecordingNetworkAdapter(cassette))
+        emulator.install(h2h_adapter.get_pipeline())
+        emulator.install(js_adapter.get_pipeline())
+
+        authorization = JSAuthorizationRequest()
+        authorization.set_country(CountryCodeAlpha2.ES)
+        authorization.set_customer_id("55")
+        authorization.set_currency(Currency.EUR)
+        authorization.set_operation_type(OperationTypes.DEBIT)
+        assert js_adapter.send_js_authorization_request(authorization).get_is_error() is False
+        assert h2h_adapter.send_h2h_payment_request(create_h2h_redirection()).get_is_error() is False
+        emulator.fail_next(1, 503)
+        assert h2h_adapter.send_h2h_payment_request(create_h2h_redirection()).get_error() == Error.SERVER_ERROR
+    return cassette
+
+
+def test_sensitive_fields_are_redacted_when_recorded(recorded_cassette, tmp_path):
+    path = str(tmp_path / "cassette.json.gz")
+    recorded_cassette.save(path)
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        content = file.read()
+
+    assert recorded_cassette.get_size() == 3
+    assert "4907270002222227" not in content
+    assert "35354a8e-ce22-40e1-863a-e58a8e53488e" not in content
+    payment = recorded_cassette.get_interactions()[1]
+    assert payment["query_parameters"]["encrypted"] == Cassette.REDACTED
+    assert payment["query_parameters"]["integrityCheck"] == Cassette.REDACTED
+    assert payment["query_parameters"]["merchantId"] == "116819"
+    assert payment["elapsed"] >= 0.05
+
+    cassette = Cassette()
+    cassette.record(Endpoints.H2H_ENDPOINT_STG.value, None, None, {"card": {"cvnNumber": "123"}}, None,
+                    (200, "<response><cardNumber>4907270002222227</cardNumber></response>"), 0.01)
+    interaction = cassette.get_interactions()[0]
+    assert interaction["json"] == {"card": {"cvnNumber": Cassette.REDACTED}}
+    assert interaction["text"] == "<response><cardNumber>REDACTED</cardNumber></response>"
+
+
+def test_replay_serves_the_recorded_responses_in_order(recorded_cassette, tmp_path):
+    path = str(tmp_path / "cassette.json")
+    recorded_cassette.save(path)
+    replay = ReplayNetworkAdapter(Cassette.load(path), latency_scale=0)
+    adapter = H2HPaymentAdapter(create_credentials(), replay)
+
+    first = adapter.send_h2h_payment_request(create_h2h_redirection())
+    second = adapter.send_h2h_payment_request(create_h2h_redirection())
+    third = adapter.send_h2h_payment_request(create_h2h_redirection())
+
+    assert first.get_notification().get_transaction_result() == TransactionResult.SUCCESS
+    assert second.get_error() == Error.SERVER_ERROR
+    # The cassette loops, so a benchmark can replay it as many times as needed.
+    assert third.get_notification().get_operation(-1).transactionId == \
+        first.get_notification().get_operation(-1).transactionId
+    assert adapter.send_h2h_void_request(create_h2h_void()).get_error() == Error.NETWORK_ERROR
+
+    replay.get_cassette().rewind()
+    assert adapter.send_h2h_payment_request(create_h2h_redirection()).get_is_error() is False
+
+
+def test_replay_latency_is_scaled_and_bounded_by_the_deadline(recorded_cassette):
+    adapter = H2HPaymentAdapter(create_credentials(), ReplayNetworkAdapter(recorded_cassette, latency_scale=2))
+
+    started_at = time.perf_counter()
+    assert adapter.send_h2h_payment_request(create_h2h_redirection()).get_is_error() is False
+    assert time.perf_counter() - started_at >= 0.1
+
+    result = adapter.send_h2h_payment_request(create_h2h_redirection(), Deadline(0.02))
+    assert result.get_error() == Error.DEADLINE_EXCEEDED
+
+
+def test_wrapping_adapters_do_not_open_a_session(recorded_cassette, mocker):
+    session = mocker.patch("sdk.adapters.network_adapter.requests.Session")
+    network_adapter = NetworkAdapter()
+    recording = RecordingNetworkAdapter(Cassette(), network_adapter)
+    replay = ReplayNetworkAdapter(recorded_cassette, latency_scale=0)
+
+    assert H2HPaymentAdapter(create_credentials(), replay).send_h2h_payment_request(
+        create_h2h_redirection()).get_is_error() is False
+    recording.close()
+    replay.close()
+    assert session.call_count == 0
+    assert network_adapter.get_session() is network_adapter.get_session()
+    assert session.call_count == 1
+
+
+def test_async_replay(recorded_cassette):
+    adapter = AsyncH2HPaymentAdapter(create_credentials(), AsyncReplayNetworkAdapter(recorded_cassette, 0))
+
+    result = asyncio.run(adapter.send_h2h_payment_request(create_h2h_redirection()))
+
+    assert result.get_notification().get_transaction_result() == TransactionResult.SUCCESS
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text('{"format": 99, "interactions": []}')
+
+    with pytest.raises(InvalidFieldException):
+        Cassette.load(str(path))
+
+
+def test_load_test_records_and_replays_a_cassette(tmp_path, capsys):
+    cassette_path = str(tmp_path / "mix.json.gz")
+    report_path = tmp_path / "report.json"
+
+    mix = "h2h_debit=1,preauth_capture=1"
+
+    assert main(["--transport", "emulator", "--transactions", "20", "--mix", mix, "--record", cassette_path]) == 0
+    assert main(["--transport", "replay", "--cassette", cassette_path, "--latency-scale", "0", "--transactions",
+                 "60", "--mix", mix, "--json", str(report_path)]) == 0
+
+    report = json.loads(report_path.read_text())
+    assert report["transactions"] == 60
+    assert report["failed_transactions"] == 0
+    capsys.readouterr()
@@ -0,0 +1,170 @@
+import asyncio
+
+import pytest
+import requests
+
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.enums.circuit_state import CircuitState
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.environment import Environment
+from sdk.enums.error import Error
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.circuit_breaker import CircuitBreaker
+from sdk.models.credentials import Credentials
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.retry_policy import RetryPolicy
+
+
+class MockResponse:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+
+def send(network_adapter, endpoint=Endpoints.VOID_ENDPOINT_STG):
+    return network_adapter.send_request(headers=None, query_parameters=None, json={}, url=endpoint.value)
+
+
+def test_circuit_opens_on_failure_rate_and_fails_fast(mocker):
+    circuit_breaker = CircuitBreaker(window_size=4, minimum_calls=4, failure_rate_threshold=0.5)
+    network_adapter = NetworkAdapter(circuit_breaker=circuit_breaker)
+    mock_post = mocker.patch.object(requests.Session, 'post', side_effect=[
+        MockResponse(200, "OK"), MockResponse(503, ""), MockResponse(200, "OK"), MockResponse(500, "")
+    ])
+
+    for _ in range(4):
+        send(network_adapter)
+    response = send(network_adapter)
+
+    assert circuit_breaker.get_state(Endpoints.VOID_ENDPOINT_STG) == CircuitState.OPEN
+    assert response[0] == Error.CIRCUIT_OPEN
+    assert mock_post.call_count == 4
+    assert circuit_breaker.is_healthy() is False
+
+
+def test_circuit_is_kept_per_endpoint(mocker):
+    circuit_breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+    network_adapter = NetworkAdapter(circuit_breaker=circuit_breaker)
+    mocker.patch.object(requests.Session, 'post', side_effect=requests.exceptions.ConnectionError("refused"))
+
+    send(network_adapter)
+    send(network_adapter)
+
+    states = circuit_breaker.get_states()
+    assert states[Endpoints.VOID_ENDPOINT_STG] == CircuitState.OPEN
+    assert states[Endpoints.VOID_ENDPOINT_PROD] == CircuitState.CLOSED
+    assert states[Endpoints.REFUND_ENDPOINT_STG] == CircuitState.CLOSED
+
+
+def test_client_errors_do_not_open_the_circuit(mocker):
+    circuit_breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+    network_adapter = NetworkAdapter(circuit_breaker=circuit_breaker)
+    mocker.patch.object(requests.Session, 'post', return_value=MockResponse(400, ""))
+
+    for _ in range(5):
+        assert send(network_adapter)[0] == 400
+
+    assert circuit_breaker.get_state(Endpoints.VOID_ENDPOINT_STG) == CircuitState.CLOSED
+
+
+def test_slow_calls_open_the_circuit():
+    circuit_breaker = CircuitBreaker(window_size=2, minimum_calls=2, slow_call_duration=1,
+                                     slow_call_rate_threshold=1)
+
+    circuit_breaker.record_call(Endpoints.H2H_ENDPOINT_PROD, False, 1.5)
+    assert circuit_breaker.get_state(Endpoints.H2H_ENDPOINT_PROD) == CircuitState.CLOSED
+    circuit_breaker.record_call(Endpoints.H2H_ENDPOINT_PROD, False, 2)
+
+    assert circuit_breaker.get_state(Endpoints.H2H_ENDPOINT_PROD) == CircuitState.OPEN
+
+
+def test_half_open_probe_closes_the_circuit(mocker):
+    circuit_breaker = CircuitBreaker(window_size=1, minimum_calls=1, probe_interval=0)
+    network_adapter = NetworkAdapter(circuit_breaker=circuit_breaker)
+    mocker.patch.object(requests.Session, 'post', side_effect=[MockResponse(503, ""), MockResponse(200, "OK")])
+
+    send(network_adapter)
+    assert circuit_breaker.get_state(Endpoints.VOID_ENDPOINT_STG) == CircuitState.HALF_OPEN
+
+    assert send(network_adapter) == (200, "OK")
+    assert circuit_breaker.get_state(Endpoints.VOID_ENDPOINT_STG) == CircuitState.CLOSED
+
+
+def test_half_open_probe_cut_by_the_deadline_reopens_the_circuit():
+    circuit_breaker = CircuitBreaker(window_size=1, minimum_calls=1, probe_interval=0)
+    circuit_breaker.record_call(Endpoints.VOID_ENDPOINT_STG, True, 0.1)
+    assert circuit_breaker.allow_request(Endpoints.VOID_ENDPOINT_STG) is True
+
+    circuit_breaker.record_response(Endpoints.VOID_ENDPOINT_STG, (Error.DEADLINE_EXCEEDED, "Read timed out"), 0.2)
+
+    # The probe interval is 0, so the reopened circuit is half open again at once.
+    assert circuit_breaker.get_state(Endpoints.VOID_ENDPOINT_STG) == CircuitState.HALF_OPEN
+
+
+def test_half_open_allows_a_single_probe():
+    circuit_breaker = CircuitBreaker(window_size=1, minimum_calls=1, probe_interval=0)
+    circuit_breaker.record_call(Endpoints.AUTH_ENDPOINT_STG, True, 0.1)
+
+    assert circuit_breaker.allow_request(Endpoints.AUTH_ENDPOINT_STG) is True
+    assert circuit_breaker.allow_request(Endpoints.AUTH_ENDPOINT_STG) is False
+
+
+def test_open_circuit_waits_for_probe_interval_until_reset():
+    circuit_breaker = CircuitBreaker(window_size=1, minimum_calls=1, probe_interval=60)
+    circuit_breaker.record_call(Endpoints.AUTH_ENDPOINT_STG, True, 0.1)
+
+    assert circuit_breaker.get_state(Endpoints.AUTH_ENDPOINT_STG) == CircuitState.OPEN
+    assert circuit_breaker.allow_request(Endpoints.AUTH_ENDPOINT_STG) is False
+
+    circuit_breaker.reset()
+    assert circuit_breaker.get_state(Endpoints.AUTH_ENDPOINT_STG) == CircuitState.CLOSED
+
+
+def test_adapter_returns_circuit_open_response(mocker):
+    mock_post = mocker.patch.object(requests.Session, 'post', return_value=MockResponse(200, "OK"))
+    circuit_breaker = CircuitBreaker(window_size=1, minimum_calls=1)
+    circuit_breaker.record_call(Endpoints.VOID_ENDPOINT_STG, True, 0.1)
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id("1168190001")
+    credentials.set_api_version(5)
+
+    h2h_void = H2HVoid()
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_void.set_transaction_id("7817740")
+    h2h_void.set_merchant_transaction_id("12345")
+
+    result = H2HPaymentAdapter(
+        credentials, NetworkAdapter(circuit_breaker=circuit_breaker), RetryPolicy(base_delay=0, max_delay=0)
+    ).send_h2h_void_request(h2h_void)
+
+    assert result.get_is_error() is True
+    assert result.get_error() == Error.CIRCUIT_OPEN
+    mock_post.assert_not_called()
+
+
+def test_async_network_adapter_fails_fast_when_circuit_is_open():
+    circuit_breaker = CircuitBreaker(window_size=1, minimum_calls=1)
+    circuit_breaker.record_call(Endpoints.CHARGE_ENDPOINT_STG, True, 0.1)
+    network_adapter = AsyncNetworkAdapter(circuit_breaker=circuit_breaker)
+
+    async def run():
+        try:
+            return await network_adapter.send_request(headers=None, query_parameters=None, json={},
+                                                      url=Endpoints.CHARGE_ENDPOINT_STG.value)
+        finally:
+            await network_adapter.close()
+
+    response = asyncio.run(run())
+
+    assert response[0] == Error.CIRCUIT_OPEN
+
+
+def test_invalid_threshold_raises_exception():
+    with pytest.raises(InvalidFieldException):
+        CircuitBreaker(failure_rate_threshold=0)
@@ -0,0 +1,84 @@
+import pytest
+
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.credentials import Credentials
+from sdk.utils.crypto_context import CryptoContext
+from sdk.utils.general_utils import GeneralUtils
+from sdk.utils.hex_utils import HexUtils
+from sdk.utils.security_utils import SecurityUtils
+
+merchant_pass = "a193a2de8ed6140e848d5015620e8129"
+fixed_iv = bytes(range(1, 17))
+
+
+@pytest.mark.parametrize("payload", [b"", b"a", b"0123456789abcdef", b"amount=50&currency=EUR" * 100])
+def test_encrypt_and_sign_matches_security_utils(payload):
+    context = CryptoContext(merchant_pass)
+
+    encrypted, digest = context.encrypt_and_sign(fixed_iv, memoryview(payload))
+
+    key = bytearray(merchant_pass, 'utf-8')
+    assert bytes(encrypted) == SecurityUtils.cbc_encryption(data=bytearray(payload), key=key, iv=fixed_iv)
+    assert digest == SecurityUtils.hash256(payload)
+    assert SecurityUtils.cbc_encryption(data=bytes(encrypted), key=key, iv=fixed_iv, encrypt=False) == payload
+
+
+def test_credentials_build_the_context_once():
+    credentials = Credentials()
+    credentials.set_merchant_pass(merchant_pass)
+
+    context = credentials.get_crypto_context()
+
+    assert credentials.get_crypto_context() is context
+    assert context.get_key() == merchant_pass.encode('utf-8')
+
+
+def test_changing_merchant_pass_rebuilds_the_context():
+    credentials = Credentials()
+    credentials.set_merchant_pass(merchant_pass)
+    context = credentials.get_crypto_context()
+
+    credentials.set_merchant_pass("0123456789abcdef")
+
+    assert credentials.get_crypto_context() is not context
+    assert credentials.get_crypto_context().get_key() == b"0123456789abcdef"
+
+
+def test_invalid_key_size_raises_exception():
+    with pytest.raises(InvalidFieldException):
+        CryptoContext("short")
+
+
+def test_missing_merchant_pass_raises_exception():
+    with pytest.raises(InvalidFieldException):
+        Credentials().get_crypto_context()
+
+
+@pytest.mark.parametrize("payload_size", [0, 15, 4096, CryptoContext.MAX_REUSABLE_BUFFER_SIZE + 1])
+def test_encrypt_and_encode_matches_encrypt_and_sign(payload_size):
+    context = CryptoContext(merchant_pass)
+    payload = bytes(index % 251 for index in range(payload_size))
+
+    encrypted, signature = context.encrypt_and_encode(fixed_iv, payload)
+    expected_encrypted, expected_digest = context.encrypt_and_sign(fixed_iv, memoryview(payload))
+
+    assert encrypted == SecurityUtils.base64_encode(expected_encrypted)
+    assert signature == HexUtils.bytes_to_hex(expected_digest)
+
+
+def test_reused_buffer_does_not_leak_previous_payload():
+    context = CryptoContext(merchant_pass)
+    context.encrypt_and_encode(fixed_iv, b"x" * 10000)
+
+    encrypted, _ = context.encrypt_and_encode(fixed_iv, b"amount=10")
+
+    key = bytearray(merchant_pass, 'utf-8')
+    assert encrypted == SecurityUtils.base64_encode(
+        SecurityUtils.cbc_encryption(data=bytearray(b"amount=10"), key=key, iv=fixed_iv)
+    )
+
+
+def test_encode_url_bytes_matches_encode_url():
+    http_query = "amount=10&statusUrl=https://test.com/status?a=b c&description=caña&merchantParams=a:b;c:d"
+
+    assert GeneralUtils.encode_url_bytes(http_query) == GeneralUtils.encode_url(http_query).encode('utf-8')
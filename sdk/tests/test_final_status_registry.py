@@ -0,0 +1,149 @@
+import asyncio
+import os
+import re
+import threading
+import time
+
+import pytest
+
+from sdk.adapters.notification_adapter import parse_notification
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.final_status_registry import FinalStatusRegistry
+
+
+def read_notification(file_name, operations=None):
+    # operations keeps the first operations only, to rebuild the earlier notifications of a payment.
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'notifications', file_name), 'r') as file:
+        content = file.read()
+    if operations is not None:
+        content = re.sub(r'<operation sorted-order="(\d+)">.*?</operation>',
+                         lambda match: match.group(0) if int(match.group(1)) <= operations else "", content,
+                         flags=re.S)
+    return parse_notification(content)
+
+
+def test_final_notification_resolves_waiters():
+    registry = FinalStatusRegistry()
+    notification = read_notification("4907270002222227.xml")
+    futures = [registry.wait_for_final_status("756974", timeout=5) for _ in range(3)]
+
+    threading.Thread(target=registry.resolve, args=(notification,)).start()
+
+    assert all(future.result(timeout=5) is notification for future in futures)
+    assert registry.get_waiter_count() == 0
+    registry.close()
+
+
+def test_intermediate_notification_does_not_resolve():
+    registry = FinalStatusRegistry()
+    notification = read_notification("js_charge.json")
+    future = registry.wait_for_final_status(notification.get_merchant_transaction_id())
+
+    registry.resolve(notification)
+
+    assert not future.done()
+    registry.close()
+    assert future.cancelled()
+
+
+def test_authentication_operations_do_not_resolve():
+    registry = FinalStatusRegistry()
+    future = registry.wait_for_final_status("756974")
+
+    # The TRA SUCCESS and 3DS SUCCESS3DS steps of a payment that is then declined.
+    for operations in (1, 2):
+        registry.resolve(read_notification("4907271141151707.xml", operations))
+    assert not future.done()
+    registry.resolve(read_notification("4907271141151707.xml"))
+
+    assert future.result(timeout=0).get_operation(-1).status == "ERROR"
+    registry.close()
+
+
+def test_resolved_waiters_release_their_deadlines():
+    registry = FinalStatusRegistry()
+    notification = read_notification("h2h_void.xml")
+    futures = [registry.wait_for_final_status(notification.get_merchant_transaction_id(), timeout=60)
+               for _ in range(100)]
+    cancelled = registry.wait_for_final_status("1001", timeout=60)
+
+    registry.resolve(notification)
+    cancelled.cancel()
+
+    assert all(future.done() for future in futures)
+    assert registry.get_deadline_count() == 0
+    registry.close()
+
+
+def test_waiter_registered_after_the_final_notification():
+    registry = FinalStatusRegistry()
+    notification = read_notification("h2h_void.xml")
+    registry.resolve(notification)
+
+    assert registry.wait_for_final_status(notification.get_merchant_transaction_id()).result(timeout=0) is notification
+    registry.close()
+
+
+def test_waiter_times_out():
+    registry = FinalStatusRegistry()
+    futures = [registry.wait_for_final_status(str(index), timeout=0.05) for index in range(1000)]
+
+    for future in futures:
+        with pytest.raises(TimeoutError):
+            future.result(timeout=5)
+    assert registry.get_waiter_count() == 0
+    registry.close()
+
+
+def test_timed_out_deadlines_are_not_counted_as_stale():
+    registry = FinalStatusRegistry()
+    futures = [registry.wait_for_final_status(str(index), timeout=60) for index in range(4)]
+    for future in [registry.wait_for_final_status("timed out", timeout=0.01) for _ in range(2)]:
+        with pytest.raises(TimeoutError):
+            future.result(timeout=5)
+    # The done callbacks run after result() returns.
+    deadline = time.monotonic() + 5
+    while registry.get_waiter_count() > 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    futures[0].cancel()
+
+    # The timer already popped the timed out deadlines, the cancelled one is kept until the stale ones are half
+    # of the heap.
+    assert registry.get_deadline_count() == 4
+    futures[1].cancel()
+    futures[2].cancel()
+    assert registry.get_deadline_count() == 1
+    registry.close()
+
+
+def test_cancelled_waiter_is_cleaned_up():
+    registry = FinalStatusRegistry()
+    future = registry.wait_for_final_status("1001", timeout=60)
+
+    future.cancel()
+
+    assert registry.get_waiter_count() == 0
+    registry.close()
+
+
+def test_async_waiter():
+    registry = FinalStatusRegistry()
+    notification = read_notification("h2h_refund.xml")
+
+    async def wait():
+        waiter = asyncio.ensure_future(
+            registry.wait_for_final_status_async(notification.get_merchant_transaction_id(), timeout=5))
+        await asyncio.sleep(0)
+        registry.resolve(notification)
+        return await waiter
+
+    assert asyncio.run(wait()) is notification
+    registry.close()
+
+
+def test_registry_validation():
+    with pytest.raises(InvalidFieldException):
+        FinalStatusRegistry(result_ttl=-1)
+    with pytest.raises(InvalidFieldException):
+        FinalStatusRegistry(max_results=-1)
@@ -0,0 +1,239 @@
+import asyncio
+import base64
+
+import pytest
+
+from sdk.adapters.async_h2h_payment_adapter import AsyncH2HPaymentAdapter
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.hosted_payment_adapter import HostedPaymentAdapter
+from sdk.adapters.js_payment_adapter import JSPaymentAdapter
+from sdk.emulator.gateway_emulator import GatewayEmulator
+from sdk.enums.country_code import CountryCodeAlpha2
+from sdk.enums.currency import Currency
+from sdk.enums.endpoint_family import EndpointFamily
+from sdk.enums.environment import Environment
+from sdk.enums.error import Error
+from sdk.enums.operation_types import OperationTypes
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.enums.transaction import TransactionResult
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.final_status_registry import FinalStatusRegistry
+from sdk.models.requests.h2h.h2h_pre_authorization_capture import H2HPreAuthorizationCapture
+from sdk.models.requests.h2h.h2h_redirection import H2HRedirection
+from sdk.models.requests.h2h.h2h_refund import H2HRefund
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.requests.hosted.hosted_payment_redirection import HostedPaymentRedirection
+from sdk.models.requests.js.js_authorization_request import JSAuthorizationRequest
+from sdk.models.requests.js.js_charge import JSCharge
+from sdk.models.transaction_tracker import TransactionTracker
+from sdk.utils.request_utils import RequestUtils
+from sdk.utils.security_utils import SecurityUtils
+
+
+def create_credentials(merchant_key="35354a8e-ce22-40e1-863a-e58a8e53488e"):
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_merchant_key(merchant_key)
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id("1168190001")
+    credentials.set_api_version(5)
+    return credentials
+
+
+@pytest.fixture
+def setup_credentials():
+    return create_credentials()
+
+
+@pytest.fixture
+def emulator(setup_credentials):
+    with GatewayEmulator(setup_credentials) as gateway_emulator:
+        yield gateway_emulator
+
+
+def create_h2h_redirection():
+    h2h_redirection = H2HRedirection()
+    h2h_redirection.set_amount("50")
+    h2h_redirection.set_currency(Currency.EUR)
+    h2h_redirection.set_country(CountryCodeAlpha2.ES)
+    h2h_redirection.set_card_number("4907270002222227")
+    h2h_redirection.set_customer_id("903")
+    h2h_redirection.set_merchant_transaction_id("33312")
+    h2h_redirection.set_ch_name("First name Last name")
+    h2h_redirection.set_cvn_number("123")
+    h2h_redirection.set_exp_date("0625")
+    h2h_redirection.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_redirection.set_status_url("https://test.com/status")
+    h2h_redirection.set_success_url("https://test.com/success")
+    h2h_redirection.set_error_url("https://test.com/fail")
+    h2h_redirection.set_awaiting_url("https://test.com/await")
+    h2h_redirection.set_cancel_url("https://test.com/cancel")
+    return h2h_redirection
+
+
+def create_h2h_void():
+    h2h_void = H2HVoid()
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_void.set_transaction_id("7817740")
+    h2h_void.set_merchant_transaction_id("12345")
+    return h2h_void
+
+
+def test_h2h_operations_are_decrypted_and_answered(setup_credentials, emulator):
+    adapter = H2HPaymentAdapter(setup_credentials)
+    emulator.install(adapter.get_pipeline())
+
+    payment = adapter.send_h2h_payment_request(create_h2h_redirection())
+
+    capture = H2HPreAuthorizationCapture()
+    capture.set_payment_solution(PaymentSolutions.creditcards)
+    capture.set_transaction_id(payment.get_notification().get_operation(-1).transactionId)
+    capture.set_merchant_transaction_id("33312")
+    refund = H2HRefund()
+    refund.set_amount("20")
+    refund.set_payment_solution(PaymentSolutions.creditcards)
+    refund.set_transaction_id(payment.get_notification().get_operation(-1).transactionId)
+    refund.set_merchant_transaction_id("33312")
+
+    results = [payment, adapter.send_h2h_pre_authorization_capture(capture), adapter.send_h2h_refund_request(refund),
+               adapter.send_h2h_void_request(create_h2h_void())]
+
+    assert [result.get_is_error() for result in results] == [False] * 4
+    assert [result.get_notification().get_operation(-1).operationType.value for result in results] == \
+        ["DEBIT", "CAPTURE", "REBATE", "VOID"]
+    assert payment.get_notification().get_transaction_result() == TransactionResult.SUCCESS
+    assert payment.get_notification().get_merchant_transaction_id() == "33312"
+    assert emulator.get_request_count(EndpointFamily.H2H_PAY) == 1
+    assert emulator.get_request_count() == 4
+    assert emulator.get_rejected_count() == 0
+
+
+
+def test_emulated_responses_reach_a_final_status(setup_credentials, emulator):
+    adapter = H2HPaymentAdapter(setup_credentials)
+    emulator.install(adapter.get_pipeline())
+    registry = FinalStatusRegistry()
+    tracker = TransactionTracker()
+    payment_waiter = registry.wait_for_final_status("33312", timeout=5)
+    void_waiter = registry.wait_for_final_status("12345", timeout=5)
+
+    payment = adapter.send_h2h_payment_request(create_h2h_redirection())
+    void = adapter.send_h2h_void_request(create_h2h_void())
+    for result in (payment, void):
+        registry.resolve(result.get_notification())
+
+    # The payment passes its TRA check first, like the gateway answers it.
+    assert [operation.service for operation in payment.get_notification().operations] == ["TRA", None]
+    assert payment_waiter.result(timeout=5) is payment.get_notification()
+    assert void_waiter.result(timeout=5) is void.get_notification()
+    assert tracker.update(payment.get_notification()).get_result() == TransactionResult.SUCCESS
+    assert tracker.update(void.get_notification()).is_final()
+    registry.close()
+
+def test_tampered_requests_are_rejected(setup_credentials, emulator):
+    headers, query_parameters = RequestUtils.encrypt_query("merchantId=116819&amount=50", "116819", setup_credentials)
+    headers = {key.lower(): value for key, value in headers.items()}
+    path = "/EPGCheckout/rest/online/pay"
+
+    assert emulator.handle("POST", path, headers, query_parameters, b"")[0] == 200
+    assert emulator.handle("POST", path, headers, dict(query_parameters, integrityCheck="00"), b"")[:3:2] == \
+        (400, "Invalid integrityCheck")
+    assert emulator.handle("POST", path, headers, dict(query_parameters, merchantId="1"), b"")[0] == 400
+    other_iv = dict(headers, iv=base64.b64encode(SecurityUtils.generate_iv()).decode())
+    assert emulator.handle("POST", path, other_iv, query_parameters, b"")[0] == 400
+    assert emulator.handle("GET", path, headers, query_parameters, b"")[0] == 405
+    assert emulator.handle("POST", "/unknown", headers, query_parameters, b"")[0] == 404
+    assert emulator.get_rejected_count() == 5
+
+
+def test_js_and_hosted_endpoints(setup_credentials, emulator):
+    js_adapter = JSPaymentAdapter(setup_credentials)
+    hosted_adapter = HostedPaymentAdapter(setup_credentials)
+    emulator.install(js_adapter.get_pipeline())
+    emulator.install(hosted_adapter.get_pipeline())
+
+    authorization = JSAuthorizationRequest()
+    authorization.set_country(CountryCodeAlpha2.ES)
+    authorization.set_customer_id("55")
+    authorization.set_currency(Currency.EUR)
+    authorization.set_operation_type(OperationTypes.DEBIT)
+    auth_token = js_adapter.send_js_authorization_request(authorization).get_auth_token()
+
+    charge = JSCharge()
+    charge.set_amount("30")
+    charge.set_prepay_token(auth_token)
+    charge.set_country(CountryCodeAlpha2.ES)
+    charge.set_customer_id("55")
+    charge.set_currency(Currency.EUR)
+    charge.set_operation_type(OperationTypes.DEBIT)
+    charge.set_payment_solution(PaymentSolutions.creditcards)
+    charge.set_status_url("https://test.com/status")
+    charge.set_success_url("https://test.com/success")
+    charge.set_error_url("https://test.com/fail")
+    charge.set_awaiting_url("https://test.com/await")
+    charge.set_cancel_url("https://test.com/cancel")
+    charge_result = js_adapter.send_js_charge_request(charge)
+
+    hosted = HostedPaymentRedirection()
+    hosted.set_amount("50")
+    hosted.set_currency(Currency.EUR)
+    hosted.set_country(CountryCodeAlpha2.ES)
+    hosted.set_customer_id("903")
+    hosted.set_merchant_transaction_id("3123123")
+    hosted.set_payment_solution(PaymentSolutions.creditcards)
+    hosted.set_status_url("https://test.com/status")
+    hosted.set_success_url("https://test.com/success")
+    hosted.set_error_url("https://test.com/fail")
+    hosted.set_awaiting_url("https://test.com/await")
+    hosted.set_cancel_url("https://test.com/cancel")
+    redirect_url = hosted_adapter.send_hosted_payment_request(hosted).get_redirect_url()
+
+    assert auth_token
+    assert charge_result.get_is_error() is False
+    assert charge_result.get_notification().get_transaction_result() == TransactionResult.SUCCESS
+    assert charge_result.get_notification().get_operation(-1).amount == 30.0
+    assert redirect_url.startswith(emulator.get_base_url())
+    assert emulator.get_request_count(EndpointFamily.TOKENIZE) == 1
+
+    other_adapter = JSPaymentAdapter(create_credentials("00000000-0000-0000-0000-000000000000"))
+    emulator.install(other_adapter.get_pipeline())
+    assert other_adapter.send_js_authorization_request(authorization).get_error() == Error.CLIENT_ERROR
+
+
+def test_errors_and_latency_are_injected(setup_credentials, emulator):
+    adapter = H2HPaymentAdapter(setup_credentials)
+    emulator.install(adapter.get_pipeline())
+
+    emulator.fail_next(2, 502)
+    assert adapter.send_h2h_void_request(create_h2h_void()).get_error() == Error.SERVER_ERROR
+    assert adapter.send_h2h_void_request(create_h2h_void()).get_error() == Error.SERVER_ERROR
+    assert adapter.send_h2h_void_request(create_h2h_void()).get_is_error() is False
+
+    emulator.set_error_rate(1.0, 429)
+    assert adapter.send_h2h_void_request(create_h2h_void()).get_error() == Error.CLIENT_ERROR
+    assert emulator.get_injected_error_count() == 3
+
+    emulator.set_error_rate(0.0)
+    emulator.set_latency(0.3)
+    result = adapter.send_h2h_void_request(create_h2h_void(), Deadline(0.05))
+    assert result.get_error() == Error.DEADLINE_EXCEEDED
+
+    with pytest.raises(InvalidFieldException):
+        emulator.set_error_rate(2)
+
+
+def test_async_adapters_use_the_emulator(setup_credentials, emulator):
+    adapter = AsyncH2HPaymentAdapter(setup_credentials)
+    emulator.install(adapter.get_pipeline())
+
+    async def run():
+        return await asyncio.gather(*[adapter.send_h2h_void_request(create_h2h_void()) for _ in range(10)])
+
+    results = asyncio.run(run())
+
+    assert all(result.get_is_error() is False for result in results)
+    assert len({result.get_notification().get_operation(-1).transactionId for result in results}) == 10
+    assert emulator.get_request_count(EndpointFamily.VOID) == 10
@@ -1,3 +1,4 @@
+import json
 import os
 
 import pytest
@@ -16,6 +17,7 @@ from sdk.models.credentials import Credentials
 from sdk.models.requests.js.js_authorization_request import JSAuthorizationRequest
 from sdk.models.requests.js.js_charge import JSCharge
 from sdk.models.requests.js.js_payment_recurrent_initial import JSPaymentRecurrentInitial
+from sdk.utils.custom_encoder import CustomEncoder
 
 # Mock configurations
 mock_configurations = {
@@ -76,6 +78,7 @@ def test_send_charge_request_success(setup_credentials, mocker):
     request.set_error_url("https://test.com/fail")
     request.set_awaiting_url("https://test.com/await")
     request.set_cancel_url("https://test.com/cancel")
+    request.set_merchant_params([("name", "pablo"), ("surname", "ferrer")])
 
     # Create the adapter and call the method
     adapter = JSPaymentAdapter(setup_credentials)
@@ -100,12 +103,18 @@ def test_send_charge_request_success(setup_credentials, mocker):
     # Capture the network call arguments
     mock_send_request.assert_called_once()
     call_args = mock_send_request.call_args
-    json = call_args[1]['json']
+    body = json.loads(call_args[1]['body'])
     url = call_args[1]['url']
     # Verify the network call arguments
-    assert json["merchantId"] == "111222"
+    assert body["merchantId"] == "111222"
     assert url == Endpoints.CHARGE_ENDPOINT_STG.value  # Change this to the correct endpoint
 
+    # The body is serialized once and matches the former dumps/loads round trip
+    legacy_body = json.loads(json.dumps(request, cls=CustomEncoder))
+    legacy_body["merchantParams"] = "name:pablo;surname:ferrer"
+    assert call_args[1]['body'] == json.dumps(legacy_body).encode('utf-8')
+    assert call_args[1]['headers']["Content-Type"] == "application/json"
+
 
 @pytest.mark.parametrize("missing_field", [
     "amount",
@@ -194,10 +203,10 @@ def test_send_charge_recurring_request_success(setup_credentials, mocker):
     # Capture the network call arguments
     mock_send_request.assert_called_once()
     call_args = mock_send_request.call_args
-    json = call_args[1]['json']
+    body = json.loads(call_args[1]['body'])
     url = call_args[1]['url']
     # Verify the network call arguments
-    assert json["merchantId"] == "111222"
+    assert body["merchantId"] == "111222"
     assert url == Endpoints.CHARGE_ENDPOINT_STG.value  # Change this to the correct endpoint
 
 
@@ -223,10 +232,10 @@ def test_send_auth_request_success(setup_credentials, mocker):
     # Capture the network call arguments
     mock_send_request.assert_called_once()
     call_args = mock_send_request.call_args
-    json = call_args[1]['json']
+    body = json.loads(call_args[1]['body'])
     url = call_args[1]['url']
     # Verify the network call arguments
-    assert json["merchantId"] == "111222"
+    assert body["merchantId"] == "111222"
     assert url == Endpoints.AUTH_ENDPOINT_STG.value  # Change this to the correct endpoint
 
 
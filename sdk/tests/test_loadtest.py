@@ -0,0 +1,88 @@
+import json
+import random
+
+import pytest
+
+from sdk.benchmarks.benchmark_suite import create_credentials
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.loadtest.__main__ import main
+from sdk.loadtest.load_generator import LoadGenerator
+from sdk.loadtest.load_report import LoadReport
+from sdk.loadtest.stub_network_adapter import StubNetworkAdapter
+from sdk.loadtest.transaction_mix import TransactionMix
+
+
+def test_every_transaction_of_the_mix_succeeds_on_the_stub():
+    mix = TransactionMix(create_credentials(), StubNetworkAdapter(), cart_items=3)
+
+    for name in mix.get_names():
+        responses = mix.run(name)
+        assert all(response.get_is_error() is False for response in responses), name
+    assert len(mix.run(TransactionMix.PRE_AUTHORIZATION_CAPTURE)) == 2
+    assert len(mix.run(TransactionMix.JS_CHARGE)) == 2
+
+
+def test_mix_weights():
+    mix = TransactionMix(create_credentials(), StubNetworkAdapter(),
+                         TransactionMix.parse_weights("h2h_debit=3, refund=1,js_charge=0"))
+    generator = random.Random(7)
+    choices = [mix.choose(generator) for _ in range(4000)]
+
+    assert mix.get_names() == ["h2h_debit", "refund"]
+    assert 0.7 < choices.count("h2h_debit") / len(choices) < 0.8
+    with pytest.raises(InvalidFieldException):
+        TransactionMix(create_credentials(), StubNetworkAdapter(), {"unknown": 1})
+    with pytest.raises(InvalidFieldException):
+        TransactionMix.parse_weights("h2h_debit")
+
+
+def test_closed_loop_stops_after_the_transactions():
+    mix = TransactionMix(create_credentials(), StubNetworkAdapter())
+
+    report = LoadGenerator(mix, concurrency=4, duration=None, transactions=60, seed=1).run()
+
+    assert report.get_transactions() == 60
+    assert report.get_requests() >= 60
+    assert report.get_failed_transactions() == 0
+    assert report.get_errors() == {}
+    assert report.get_cpu_per_request() > 0
+    assert 0 < report.get_percentile(50) <= report.get_percentile(99)
+
+
+def test_open_loop_follows_the_schedule_and_counts_errors():
+    mix = TransactionMix(create_credentials(), StubNetworkAdapter(error_rate=1.0), {TransactionMix.REFUND: 1})
+
+    report = LoadGenerator(mix, LoadGenerator.OPEN_LOOP, concurrency=2, rps=200, duration=0.25).run()
+
+    assert report.get_transactions() == 50
+    assert report.get_failed_transactions() == 50
+    assert report.get_errors() == {"SERVER_ERROR": 50}
+    assert report.get_wall_time() >= 0.245
+    with pytest.raises(InvalidFieldException):
+        LoadGenerator(mix, LoadGenerator.OPEN_LOOP)
+
+
+def test_report_percentiles_and_exceptions():
+    report = LoadReport()
+    for latency in range(1, 101):
+        report.record("h2h_debit", latency / 1000, [])
+    report.record("refund", 0.5, exception=ValueError("broken"))
+
+    assert LoadReport.percentile([0.3, 0.1, 0.2], 50) == 0.2
+    assert report.get_percentile(50, "h2h_debit") == 0.05
+    assert report.get_percentile(99, "h2h_debit") == 0.099
+    assert report.get_percentile(100) == 0.5
+    assert report.get_errors() == {"ValueError": 1}
+    assert report.to_dict()["by_transaction"]["h2h_debit"]["p99_ms"] == 99.0
+
+
+def test_command_line_writes_the_report(tmp_path, capsys):
+    path = tmp_path / "report.json"
+
+    assert main(["--transactions", "20", "--concurrency", "2", "--seed", "3", "--json", str(path)]) == 0
+
+    report = json.loads(path.read_text())
+    assert report["transactions"] == 20
+    assert report["mode"] == "closed"
+    assert "p99_ms" in report["latency"]
+    assert "throughput" in capsys.readouterr().out
@@ -0,0 +1,151 @@
+import os
+
+import pytest
+
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.adapters.notification_adapter import parse_notification
+from sdk.adapters.notification_receiver import NotificationReceiver
+from sdk.enums.environment import Environment
+from sdk.enums.error import Error
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.exceptions.field_exception import InvalidFieldException, MissingFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.metrics_registry import MetricsRegistry
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.sdk_metrics import SdkMetrics
+
+
+@pytest.fixture
+def setup_credentials():
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id("1168190001")
+    credentials.set_api_version(5)
+    return credentials
+
+
+def read_xml_content(file_name):
+    current_file_directory = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(current_file_directory, 'notifications', file_name), 'r') as file:
+        return file.read()
+
+
+def create_h2h_void():
+    h2h_void = H2HVoid()
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_void.set_transaction_id("7817740")
+    h2h_void.set_merchant_transaction_id("12345")
+    return h2h_void
+
+
+def test_registry_exports_prometheus_text():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ("endpoint",))
+    histogram = registry.histogram("latency_seconds", "Latency.", ("endpoint",), (0.1, 1.0))
+    counter.inc(('VOID "stg"',))
+    counter.inc(('VOID "stg"',), 2)
+    histogram.observe(0.05, ("VOID",))
+    histogram.observe(0.5, ("VOID",))
+    histogram.observe(5, ("VOID",))
+
+    assert registry.export() == (
+        '# HELP latency_seconds Latency.\n'
+        '# TYPE latency_seconds histogram\n'
+        'latency_seconds_bucket{endpoint="VOID",le="0.1"} 1\n'
+        'latency_seconds_bucket{endpoint="VOID",le="1.0"} 2\n'
+        'latency_seconds_bucket{endpoint="VOID",le="+Inf"} 3\n'
+        'latency_seconds_sum{endpoint="VOID"} 5.55\n'
+        'latency_seconds_count{endpoint="VOID"} 3\n'
+        '# HELP requests_total Requests.\n'
+        '# TYPE requests_total counter\n'
+        'requests_total{endpoint="VOID \\"stg\\""} 3.0\n'
+    )
+    assert registry.counter("requests_total", "Requests.", ("endpoint",)) is counter
+    with pytest.raises(InvalidFieldException):
+        registry.histogram("requests_total", "Requests.", ("endpoint",))
+
+
+def test_registry_serves_metrics_over_wsgi():
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests.").inc()
+    statuses = []
+
+    body = registry.wsgi_app({"REQUEST_METHOD": "GET"}, lambda status, headers: statuses.append((status, headers)))
+
+    assert statuses == [("200 OK", [("Content-Type", MetricsRegistry.CONTENT_TYPE)])]
+    assert b"requests_total 1.0" in body[0]
+
+
+def test_successful_request_is_measured(setup_credentials, mocker):
+    mocker.patch.object(NetworkAdapter, 'send_request', return_value=(200, read_xml_content('h2h_response.xml')))
+    metrics = SdkMetrics()
+    adapter = H2HPaymentAdapter(setup_credentials)
+    metrics.install(adapter.get_pipeline())
+
+    adapter.send_h2h_void_request(create_h2h_void())
+
+    registry = metrics.get_registry()
+    stage_seconds = registry.get_metric("addonpayments_request_stage_seconds")
+    for stage in PipelineStage:
+        assert stage_seconds.get_count(("VOID_ENDPOINT_STG", stage.value)) == 1
+    assert registry.get_metric("addonpayments_request_seconds").get_count(("VOID_ENDPOINT_STG",)) == 1
+    assert registry.get_metric("addonpayments_responses_total").get(("VOID_ENDPOINT_STG", "success")) == 1
+    assert registry.get_metric("addonpayments_request_payload_bytes").get_sum(("VOID_ENDPOINT_STG",)) > 0
+    assert registry.get_metric("addonpayments_response_payload_bytes").get_sum(("VOID_ENDPOINT_STG",)) == \
+        len(read_xml_content('h2h_response.xml'))
+    assert registry.get_metric("addonpayments_errors_total").get(("VOID_ENDPOINT_STG", "SERVER_ERROR")) == 0
+    assert registry.get_metric("addonpayments_notification_parse_seconds").get_count(("xml",)) == 1
+
+    metrics.uninstall(adapter.get_pipeline())
+    adapter.send_h2h_void_request(create_h2h_void())
+    assert registry.get_metric("addonpayments_request_seconds").get_count(("VOID_ENDPOINT_STG",)) == 1
+
+
+def test_errors_are_counted(setup_credentials, mocker):
+    mocker.patch.object(NetworkAdapter, 'send_request', side_effect=[
+        (503, "Service Unavailable"),
+        (Error.NETWORK_ERROR, "connection reset")
+    ])
+    metrics = SdkMetrics()
+    adapter = H2HPaymentAdapter(setup_credentials)
+    metrics.install(adapter.get_pipeline())
+
+    adapter.send_h2h_void_request(create_h2h_void())
+    adapter.send_h2h_void_request(create_h2h_void())
+    with pytest.raises(MissingFieldException):
+        adapter.send_h2h_void_request(H2HVoid())
+
+    errors = metrics.get_registry().get_metric("addonpayments_errors_total")
+    assert errors.get(("VOID_ENDPOINT_STG", "SERVER_ERROR")) == 1
+    assert errors.get(("VOID_ENDPOINT_STG", "NETWORK_ERROR")) == 1
+    assert errors.get(("VOID_ENDPOINT_STG", "MISSING_PARAMETER")) == 1
+    responses = metrics.get_registry().get_metric("addonpayments_responses_total")
+    assert responses.get(("VOID_ENDPOINT_STG", "server_error")) == 1
+    assert metrics.get_registry().get_metric("addonpayments_request_seconds").get_count(("VOID_ENDPOINT_STG",)) == 3
+
+
+def test_notification_parsing_is_measured():
+    metrics = SdkMetrics()
+    receiver = NotificationReceiver(lambda notification: None)
+    metrics.install_notifications(receiver)
+    try:
+        assert receiver.submit(read_xml_content('h2h_response.xml')) is True
+        assert receiver.submit("<response>") is True
+        assert receiver.submit('{"response": ') is True
+        receiver.join()
+        SdkMetrics.uninstall_notifications(receiver)
+        receiver.submit(read_xml_content('h2h_response.xml'))
+        receiver.join()
+    finally:
+        receiver.stop()
+    assert parse_notification(read_xml_content('h2h_response.xml')) is not None
+
+    registry = metrics.get_registry()
+    assert registry.get_metric("addonpayments_notification_parse_seconds").get_count(("xml",)) == 2
+    assert registry.get_metric("addonpayments_notification_parse_seconds").get_count(("json",)) == 1
+    assert registry.get_metric("addonpayments_notification_parse_failures_total").get(("xml",)) == 1
+    assert registry.get_metric("addonpayments_notification_parse_failures_total").get(("json",)) == 1
@@ -0,0 +1,196 @@
+import time
+
+import pytest
+import requests
+
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.hosted_payment_adapter import HostedPaymentAdapter
+from sdk.adapters.hosted_quix_payment_adapter import HostedQuixPaymentAdapter
+from sdk.adapters.js_payment_adapter import JSPaymentAdapter
+from sdk.adapters.js_quix_payment_adapter import JSQuixPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.enums.endpoint_family import EndpointFamily
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.environment import Environment
+from sdk.enums.error import Error
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.timeout_config import TimeoutConfig
+
+
+class MockResponse:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+
+def test_adapters_share_the_same_network_adapter_by_default():
+    adapters = [
+        H2HPaymentAdapter(),
+        HostedPaymentAdapter(),
+        JSPaymentAdapter(),
+        HostedQuixPaymentAdapter(),
+        JSQuixPaymentAdapter()
+    ]
+
+    shared = NetworkAdapter.get_shared_instance()
+    for adapter in adapters:
+        assert adapter.get_network_adapter() is shared
+
+
+def test_adapter_uses_injected_network_adapter():
+    network_adapter = NetworkAdapter(pool_connections=2, pool_maxsize=4, pool_block=True)
+    adapter = H2HPaymentAdapter(network_adapter=network_adapter)
+
+    assert adapter.get_network_adapter() is network_adapter
+    http_adapter = network_adapter.get_session().get_adapter(Endpoints.H2H_ENDPOINT_STG.value)
+    assert http_adapter._pool_connections == 2
+    assert http_adapter._pool_maxsize == 4
+    assert http_adapter._pool_block is True
+
+
+def test_send_request_reuses_session(mocker):
+    network_adapter = NetworkAdapter()
+    mock_post = mocker.patch.object(requests.Session, 'post', return_value=MockResponse(200, "OK"))
+
+    first = network_adapter.send_request(headers=None, query_parameters=None, json={}, url=Endpoints.AUTH_ENDPOINT_STG.value)
+    second = network_adapter.send_request(headers=None, query_parameters=None, json={}, url=Endpoints.AUTH_ENDPOINT_STG.value)
+
+    assert first == (200, "OK")
+    assert second == (200, "OK")
+    assert mock_post.call_count == 2
+
+
+def test_send_request_returns_network_error_on_exception(mocker):
+    network_adapter = NetworkAdapter()
+    mocker.patch.object(requests.Session, 'post', side_effect=requests.exceptions.ConnectionError("refused"))
+
+    response = network_adapter.send_request(headers=None, query_parameters=None, json={}, url=Endpoints.AUTH_ENDPOINT_STG.value)
+
+    assert response[0] == Error.NETWORK_ERROR
+    assert response[1] == "refused"
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_instance():
+    yield
+    NetworkAdapter.set_shared_instance(None)
+
+
+@pytest.mark.parametrize("endpoint, family", [
+    (Endpoints.H2H_ENDPOINT_PROD, EndpointFamily.H2H_PAY),
+    (Endpoints.CAPTURE_ENDPOINT_STG, EndpointFamily.CAPTURE),
+    (Endpoints.VOID_ENDPOINT_PROD, EndpointFamily.VOID),
+    (Endpoints.REFUND_ENDPOINT_STG, EndpointFamily.REBATE),
+    (Endpoints.AUTH_ENDPOINT_PROD, EndpointFamily.JS_AUTH),
+    (Endpoints.CHARGE_ENDPOINT_STG, EndpointFamily.JS_CHARGE),
+    (Endpoints.HOSTED_ENDPOINT_PROD, EndpointFamily.TOKENIZE),
+])
+def test_send_request_uses_timeout_of_endpoint_family(mocker, endpoint, family):
+    timeout_config = TimeoutConfig()
+    timeout_config.set_timeout(family, 1.5, 7.0)
+    network_adapter = NetworkAdapter(timeout_config=timeout_config)
+    mock_post = mocker.patch.object(requests.Session, 'post', return_value=MockResponse(200, "OK"))
+
+    network_adapter.send_request(headers=None, query_parameters=None, json={}, url=endpoint.value)
+
+    assert mock_post.call_args[1]['timeout'] == (1.5, 7.0)
+
+
+def test_send_request_caps_timeouts_with_deadline(mocker):
+    network_adapter = NetworkAdapter()
+    mock_post = mocker.patch.object(requests.Session, 'post', return_value=MockResponse(200, "OK"))
+
+    network_adapter.send_request(headers=None, query_parameters=None, json={}, url=Endpoints.H2H_ENDPOINT_STG.value,
+                                 deadline=Deadline(2))
+
+    connect_timeout, read_timeout = mock_post.call_args[1]['timeout']
+    assert 0 < connect_timeout <= 2
+    assert 0 < read_timeout <= 2
+
+
+def test_send_request_returns_deadline_exceeded_without_sending(mocker):
+    network_adapter = NetworkAdapter()
+    mock_post = mocker.patch.object(requests.Session, 'post', return_value=MockResponse(200, "OK"))
+
+    response = network_adapter.send_request(headers=None, query_parameters=None, json={},
+                                            url=Endpoints.H2H_ENDPOINT_STG.value, deadline=Deadline(0))
+
+    assert response[0] == Error.DEADLINE_EXCEEDED
+    mock_post.assert_not_called()
+
+
+def test_send_request_maps_timeout_after_deadline_to_deadline_exceeded(mocker):
+    network_adapter = NetworkAdapter()
+    deadline = Deadline(0.01)
+
+    def post(*args, **kwargs):
+        time.sleep(0.02)
+        raise requests.exceptions.ReadTimeout("read timed out")
+
+    mocker.patch.object(requests.Session, 'post', side_effect=post)
+
+    response = network_adapter.send_request(headers=None, query_parameters=None, json={},
+                                            url=Endpoints.H2H_ENDPOINT_STG.value, deadline=deadline)
+
+    assert response[0] == Error.DEADLINE_EXCEEDED
+
+
+def test_send_request_maps_timeout_without_deadline_to_network_error(mocker):
+    network_adapter = NetworkAdapter()
+    mocker.patch.object(requests.Session, 'post', side_effect=[requests.exceptions.ReadTimeout("read timed out"),
+                                                               requests.exceptions.ConnectTimeout("connect timed out")])
+
+    responses = [network_adapter.send_request(headers=None, query_parameters=None, json={},
+                                              url=Endpoints.H2H_ENDPOINT_STG.value) for _ in range(2)]
+
+    # Only the connect timeout is sure not to have reached the gateway.
+    assert [response[0] for response in responses] == [Error.NETWORK_ERROR, Error.CONNECTION_ERROR]
+
+
+def test_refused_connection_is_a_connection_error():
+    network_adapter = NetworkAdapter()
+
+    response = network_adapter.send_request(headers=None, query_parameters=None, json={}, url="http://127.0.0.1:1/")
+
+    assert response[0] == Error.CONNECTION_ERROR
+
+
+def test_invalid_timeout_raises_exception():
+    with pytest.raises(InvalidFieldException):
+        TimeoutConfig().set_timeout(EndpointFamily.VOID, 0, 10)
+
+
+def test_adapter_returns_deadline_exceeded_response(mocker):
+    mock_post = mocker.patch.object(requests.Session, 'post', return_value=MockResponse(200, "OK"))
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id("1168190001")
+    credentials.set_api_version(5)
+
+    h2h_void = H2HVoid()
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_void.set_transaction_id("7817740")
+    h2h_void.set_merchant_transaction_id("12345")
+
+    result = H2HPaymentAdapter(credentials, NetworkAdapter()).send_h2h_void_request(h2h_void, Deadline(0))
+
+    assert result.get_is_error() is True
+    assert result.get_error() == Error.DEADLINE_EXCEEDED
+    mock_post.assert_not_called()
+
+
+def test_send_request_sends_encoded_body_as_is(mocker):
+    network_adapter = NetworkAdapter()
+    mock_post = mocker.patch.object(requests.Session, 'post', return_value=MockResponse(200, "OK"))
+
+    network_adapter.send_request(headers={"Content-Type": "application/json"}, query_parameters=None, json=None,
+                                 url=Endpoints.CHARGE_ENDPOINT_STG.value, body=b'{"amount": "10"}')
+
+    assert mock_post.call_args[1]['data'] == b'{"amount": "10"}'
+    assert mock_post.call_args[1]['json'] is None
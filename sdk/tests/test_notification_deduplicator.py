@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+from sdk.adapters.notification_adapter import parse_notification
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.memory_dedup_store import MemoryDedupStore
+from sdk.models.notification_deduplicator import NotificationDeduplicator
+from sdk.models.sqlite_dedup_store import SqliteDedupStore
+
+
+def read_notification(file_name):
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'notifications', file_name), 'r') as file:
+        return parse_notification(file.read())
+
+
+def test_repeated_notification_is_duplicate():
+    deduplicator = NotificationDeduplicator()
+
+    assert not deduplicator.is_duplicate(read_notification("4907270002222227.xml"))
+    assert deduplicator.is_duplicate(read_notification("4907270002222227.xml"))
+    assert not deduplicator.is_duplicate(read_notification("4907271141151707.xml"))
+    assert deduplicator.get_hits() == 1
+    assert deduplicator.get_misses() == 2
+
+
+def test_wrapped_handler_skips_duplicates_and_retries_failures():
+    handled = []
+    failures = [True]
+
+    def handler(notification):
+        if failures.pop() if failures else False:
+            raise ValueError("downstream failure")
+        handled.append(notification)
+
+    wrapped = NotificationDeduplicator().wrap(handler)
+    with pytest.raises(ValueError):
+        wrapped(read_notification("h2h_void.xml"))
+    wrapped(read_notification("h2h_void.xml"))
+    wrapped(read_notification("h2h_void.xml"))
+
+    assert len(handled) == 1
+
+
+def test_memory_store_is_bounded(mocker):
+    store = MemoryDedupStore(max_entries=2, ttl=10)
+    clock = mocker.patch("sdk.models.memory_dedup_store.time.monotonic", return_value=100.0)
+
+    assert store.add("a") and store.add("b") and store.add("c")
+    assert len(store) == 2
+    assert not store.contains("a")
+    assert not store.add("c")
+
+    clock.return_value = 111.0
+    assert store.add("c")
+    assert len(store) == 1
+
+
+def test_memory_store_expires_keys_behind_a_recent_hit(mocker):
+    store = MemoryDedupStore(max_entries=10, ttl=10)
+    clock = mocker.patch("sdk.models.memory_dedup_store.time.monotonic", return_value=100.0)
+    store.add("old")
+    clock.return_value = 105.0
+    store.add("young")
+
+    clock.return_value = 106.0
+    # The hit moves "old" behind "young" in the LRU order but keeps its first seen time.
+    assert not store.add("old")
+    clock.return_value = 111.0
+    assert store.add("new")
+
+    assert len(store) == 2
+    assert store.contains("young")
+    assert not store.add("young")
+
+
+def test_memory_store_validation():
+    with pytest.raises(InvalidFieldException):
+        MemoryDedupStore(max_entries=0)
+    with pytest.raises(InvalidFieldException):
+        MemoryDedupStore(ttl=0)
+
+
+def test_sqlite_store_survives_restarts(tmp_path):
+    path = str(tmp_path / "dedup.db")
+    notification = read_notification("h2h_refund.xml")
+
+    store = SqliteDedupStore(path)
+    assert not NotificationDeduplicator(persistent_store=store).is_duplicate(notification)
+    store.close()
+
+    store = SqliteDedupStore(path)
+    deduplicator = NotificationDeduplicator(persistent_store=store)
+    assert deduplicator.is_duplicate(notification)
+    assert deduplicator.get_hits() == 1
+    assert len(store) == 1
+    store.close()
+
+
+def test_sqlite_store_expiry(tmp_path, mocker):
+    store = SqliteDedupStore(str(tmp_path / "dedup.db"), ttl=10)
+    clock = mocker.patch("sdk.models.sqlite_dedup_store.time.time", return_value=1000.0)
+
+    assert store.add(b"key")
+    assert not store.add(b"key")
+    clock.return_value = 1011.0
+    assert not store.contains(b"key")
+    assert store.purge() == 1
+    assert store.add(b"key")
+    store.close()
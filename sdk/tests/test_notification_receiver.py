@@ -0,0 +1,149 @@
+import asyncio
+import io
+import os
+import threading
+import time
+
+from sdk.adapters.notification_receiver import NotificationReceiver
+
+
+def read_notification(file_name):
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'notifications', file_name), 'r') as file:
+        return file.read()
+
+
+def call_wsgi(receiver, body: bytes, method="POST"):
+    responses = []
+    environ = {
+        "REQUEST_METHOD": method,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    result = receiver.wsgi_app(environ, lambda status, headers: responses.append((status, dict(headers))))
+    return responses[0][0], responses[0][1], b"".join(result)
+
+
+def call_asgi(receiver, body: bytes, method="POST"):
+    sent = []
+    chunks = [{"type": "http.request", "body": body[:10], "more_body": True},
+              {"type": "http.request", "body": body[10:], "more_body": False}]
+
+    async def receive():
+        return chunks.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(receiver.asgi_app({"type": "http", "method": method}, receive, send))
+    return sent[0]["status"], sent[1]["body"]
+
+
+def test_wsgi_notification_is_processed():
+    notifications = []
+    receiver = NotificationReceiver(notifications.append, workers=2)
+    content = read_notification("4907270002222227.xml").encode("utf-8")
+
+    status, _, body = call_wsgi(receiver, content)
+    receiver.join()
+    receiver.stop()
+
+    assert status == "200 OK"
+    assert body == b"OK"
+    assert len(notifications) == 1
+    assert notifications[0].get_merchant_transaction_id() == "756974"
+    assert receiver.get_received() == 1
+    assert receiver.get_processed() == 1
+    assert receiver.get_failed() == 0
+
+
+def test_asgi_notification_is_processed():
+    notifications = []
+    receiver = NotificationReceiver(notifications.append, lazy=True)
+
+    status, body = call_asgi(receiver, read_notification("js_quix.json").encode("utf-8"))
+    receiver.join()
+    receiver.stop()
+
+    assert status == 200
+    assert body == b"OK"
+    assert notifications[0].get_nemuru_txn_id() == "7833008"
+
+
+def test_full_queue_answers_service_unavailable():
+    release = threading.Event()
+    receiver = NotificationReceiver(lambda notification: release.wait(5), workers=1, queue_size=1, retry_after=3)
+    content = read_notification("h2h_void.xml").encode("utf-8")
+
+    statuses = [call_wsgi(receiver, content) for _ in range(4)]
+    release.set()
+    receiver.join()
+    receiver.stop()
+
+    assert statuses[-1][0] == "503 Service Unavailable"
+    assert statuses[-1][1]["Retry-After"] == "3"
+    assert receiver.get_rejected() >= 1
+    assert receiver.get_received() + receiver.get_rejected() == 4
+    assert receiver.get_processed() == receiver.get_received()
+
+
+def test_invalid_requests():
+    receiver = NotificationReceiver(lambda notification: None)
+
+    assert call_wsgi(receiver, b"", method="GET")[0] == "405 Method Not Allowed"
+    assert call_wsgi(receiver, b"  ")[0] == "400 Bad Request"
+    assert call_wsgi(receiver, b"not a notification")[0] == "200 OK"
+    receiver.join()
+    receiver.stop()
+
+    assert receiver.get_failed() == 1
+
+
+def test_lifespan_shutdown_does_not_block_the_event_loop():
+    release = threading.Event()
+    receiver = NotificationReceiver(lambda notification: release.wait(5), workers=1, stop_timeout=0.2)
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    async def serve():
+        await receiver.asgi_app({"type": "lifespan"}, receive, send)
+
+    async def shutdown():
+        ticks = 0
+        lifespan = asyncio.ensure_future(serve())
+        while not lifespan.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        return ticks
+
+    receiver.start()
+    receiver.submit(read_notification("h2h_void.xml"))
+    started_at = time.monotonic()
+    ticks = asyncio.run(shutdown())
+    release.set()
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert time.monotonic() - started_at < 2
+    assert ticks > 5
+
+
+def test_stopped_receiver_rejects_notifications():
+    receiver = NotificationReceiver(lambda notification: None)
+    receiver.start()
+    receiver.stop()
+
+    status, headers, _ = call_wsgi(receiver, read_notification("h2h_void.xml").encode("utf-8"))
+
+    assert status == "503 Service Unavailable"
+    assert "Retry-After" in headers
+    assert receiver.is_running() is False
+    assert receiver.get_rejected() == 1
+    receiver.start()
+    assert receiver.submit(read_notification("h2h_void.xml")) is True
+    receiver.join()
+    receiver.stop()
@@ -1,8 +1,10 @@
 import os
+import pickle
 import unittest
 
 from ..adapters import notification_adapter
 from ..enums.currency import Currency
+from ..models.responses.notification import Entry, ExtraDetails, Notification, OptionalTransactionParams
 
 
 def read_file_content(file_name):
@@ -246,3 +248,117 @@ class TestXMLNotification(unittest.TestCase):
 
 
 
+
+    def test_xml_notification_single_pass_parsing(self):
+        xml_content = ("<response><status>SUCCESS</status><operations><operation>"
+                       "<amount>1.50</amount><amount>2.00</amount><currency>XXX</currency>"
+                       "<operationType>DEBIT</operationType><paymentDetails><extraDetails/></paymentDetails>"
+                       "<optionalTransactionParams>\n</optionalTransactionParams>"
+                       "</operation></operations></response>")
+        notification = notification_adapter.parse_notification(xml_content)
+
+        self.assertEqual(1.5, notification.operations[0].amount)
+        self.assertIsNone(notification.operations[0].currency)
+        self.assertEqual("DEBIT", notification.operations[0].operationType.name)
+        self.assertIsNone(notification.operations[0].paymentDetails.extraDetails.entry)
+        self.assertEqual([], notification.operations[0].optionalTransactionParams.entry)
+        self.assertIsNone(notification.operations[0].mpi)
+        self.assertIsNone(notification.message)
+
+    def test_xml_notification_without_operations(self):
+        self.assertIsNone(notification_adapter.parse_notification("<response><status>SUCCESS</status></response>"))
+
+    def test_json_notification_matches_dataclasses_json(self):
+        for file_name in ("js_charge.json", "js_quix.json", "sample_response/notification.json"):
+            json_content = read_file_content(file_name)
+            self.assertEqual(notification_adapter.Response.from_json(json_content).response,
+                             notification_adapter.parse_notification(json_content), file_name)
+
+    def test_json_notification_conversions(self):
+        json_content = ('{"response": {"status": "SUCCESS", "workFlowResponse": {"id": 48787, "version": 0}, '
+                        '"optionalTransactionParams": {}, "operationsArray": [{"amount": "12.5", "currency": "EUR", '
+                        '"paymentSolution": null, "unknownField": 1, "paymentDetails": {"extraDetails": '
+                        '{"rememberMe": false}}}]}}')
+        notification = notification_adapter.parse_notification(json_content)
+
+        self.assertEqual(notification_adapter.Response.from_json(json_content).response, notification)
+        self.assertEqual("48787", notification.workFlowResponse.id)
+        self.assertEqual(12.5, notification.operations[0].amount)
+        self.assertEqual("EUR", notification.operations[0].currency.value)
+        self.assertIsNone(notification.operations[0].paymentSolution)
+        self.assertEqual([], notification.optionalTransactionParams.entry)
+        self.assertEqual(False, notification.operations[0].paymentDetails.extraDetails.entry[0].value)
+
+    def test_json_notification_with_unknown_enum_value(self):
+        json_content = '{"response": {"operationsArray": [{"currency": "XXX"}]}}'
+        self.assertIsNone(notification_adapter.parse_notification(json_content))
+
+    def test_lazy_notification(self):
+        for file_name in ("4907270002222227.xml", "xml_inside_json.json", "js_quix.json"):
+            content = read_file_content(file_name)
+            notification = notification_adapter.parse_notification(content)
+            lazy_notification = notification_adapter.parse_notification(content, lazy=True)
+
+            self.assertEqual(notification.status, lazy_notification.status)
+            self.assertEqual(notification.get_transaction_result(), lazy_notification.get_transaction_result())
+            self.assertEqual(notification.get_merchant_transaction_id(),
+                             lazy_notification.get_merchant_transaction_id())
+            self.assertEqual(notification.get_nemuru_cart_hash(), lazy_notification.get_nemuru_cart_hash())
+            self.assertFalse(lazy_notification.is_materialized())
+
+            self.assertEqual(notification.operations, lazy_notification.operations)
+            self.assertEqual(notification.workFlowResponse, lazy_notification.workFlowResponse)
+            self.assertEqual(notification.optionalTransactionParams, lazy_notification.optionalTransactionParams)
+            self.assertTrue(lazy_notification.is_materialized())
+            self.assertEqual(notification, lazy_notification.to_notification())
+
+    def test_lazy_notification_without_operations(self):
+        notification = notification_adapter.parse_notification('{"response": {"status": "SUCCESS"}}', lazy=True)
+
+        self.assertEqual("SUCCESS", notification.status)
+        self.assertIsNone(notification.operations)
+        self.assertIsNone(notification.get_transaction_result())
+        self.assertFalse(notification.is_last_notification())
+
+        notification.operations = []
+        self.assertEqual([], notification.operations)
+
+    def test_entry_index(self):
+        json_content = read_file_content("js_quix.json")
+        for lazy in (False, True):
+            notification = notification_adapter.parse_notification(json_content, lazy=lazy)
+
+            self.assertEqual("7833008", notification.get_entry("NEMURUTXNID"))
+            self.assertEqual({"nemuruCartHash": "af24252b-e8c9-4fb2-9da2-7a476b2d8cd4", "missing": None},
+                             notification.get_entries("nemuruCartHash", "missing"))
+            self.assertEqual("REDIRECTED", notification.get_status())
+
+    def test_entry_index_across_operations(self):
+        xml_content = ("<response><operations>"
+                       "<operation><paymentDetails><extraDetails><entry><key>first</key><value>1</value></entry>"
+                       "</extraDetails></paymentDetails></operation>"
+                       "<operation><paymentDetails><extraDetails><entry><key>FIRST</key><value>2</value></entry>"
+                       "<entry><key>second</key><value>3</value></entry></extraDetails></paymentDetails></operation>"
+                       "</operations></response>")
+        for lazy in (False, True):
+            notification = notification_adapter.parse_notification(xml_content, lazy=lazy)
+            self.assertEqual({"first": "1", "Second": "3"}, notification.get_entries("first", "Second"))
+
+        extra_details = notification.operations[1].paymentDetails.extraDetails
+        self.assertEqual({"first": "2", "third": None}, extra_details.get_values("first", "third"))
+
+    def test_entry_indexes_are_per_instance_and_read_only(self):
+        index = ExtraDetails().get_index()
+
+        with self.assertRaises(TypeError):
+            index["key"] = "value"
+        with self.assertRaises(TypeError):
+            Notification().get_entry_index()["key"] = "value"
+        self.assertEqual({}, dict(OptionalTransactionParams().get_index()))
+
+        extra_details = ExtraDetails(entry=[Entry(key="key", value="value")])
+        self.assertEqual("value", extra_details.get_value("KEY"))
+        copy = pickle.loads(pickle.dumps(extra_details))
+        self.assertEqual(extra_details, copy)
+        self.assertEqual("value", copy.get_value("key"))
+        self.assertIsNone(ExtraDetails(entry=[Entry(key="other", value="value")]).get_value("key"))
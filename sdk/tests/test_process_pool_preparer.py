@@ -0,0 +1,170 @@
+import asyncio
+import os
+
+import pytest
+
+from sdk.adapters.async_h2h_payment_adapter import AsyncH2HPaymentAdapter
+from sdk.adapters.async_replay_network_adapter import AsyncReplayNetworkAdapter
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.hosted_quix_payment_adapter import HostedQuixPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.adapters.process_pool_preparer import ProcessPoolPreparer
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.benchmarks.benchmark_suite import create_credentials, create_h2h_redirection, create_quix_item
+from sdk.emulator.gateway_emulator import GatewayEmulator
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.error import Error
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.enums.transaction import TransactionResult
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.loadtest.stub_network_adapter import StubNetworkAdapter
+from sdk.models.cassette import Cassette
+from sdk.models.deadline import Deadline
+from sdk.models.request_context import RequestContext
+from sdk.models.request_route import RequestRoute
+from sdk.models.requests.quix_hosted.hosted_quix_item import HostedQuixItem
+from sdk.utils.request_utils import RequestUtils
+
+
+@pytest.fixture(scope="module")
+def preparer():
+    with ProcessPoolPreparer(2) as process_pool_preparer:
+        process_pool_preparer.warm_up()
+        yield process_pool_preparer
+
+
+def test_offloaded_requests_are_accepted_by_the_emulator(preparer):
+    credentials = create_credentials()
+    with GatewayEmulator(credentials) as emulator:
+        adapter = H2HPaymentAdapter(credentials)
+        emulator.install(adapter.get_pipeline())
+        preparer.install(adapter.get_pipeline())
+        offloaded = preparer.get_offloaded_count()
+
+        # The emulator decrypts the query and checks its integrityCheck.
+        for _ in range(3):
+            response = adapter.send_h2h_payment_request(create_h2h_redirection())
+            assert response.get_notification().get_transaction_result() == TransactionResult.SUCCESS
+
+    assert preparer.get_offloaded_count() == offloaded + 3
+    assert emulator.get_rejected_count() == 0
+
+
+def test_async_adapter_awaits_the_worker(preparer):
+    credentials = create_credentials()
+    with GatewayEmulator(credentials) as emulator:
+        adapter = AsyncH2HPaymentAdapter(credentials)
+        emulator.install(adapter.get_pipeline())
+        preparer.install(adapter.get_pipeline(), asynchronous=True)
+
+        async def send():
+            try:
+                return await asyncio.gather(*[adapter.send_h2h_payment_request(create_h2h_redirection())
+                                              for _ in range(4)])
+            finally:
+                await adapter.get_pipeline().get_network_adapter().close()
+
+        responses = asyncio.run(send())
+
+    assert all(response.get_notification().get_transaction_result() == TransactionResult.SUCCESS
+               for response in responses)
+
+
+def test_worker_output_matches_the_in_process_stages(preparer):
+    adapter = HostedQuixPaymentAdapter(create_credentials(), StubNetworkAdapter())
+    queries = []
+    preparer.install(adapter.get_pipeline())
+    adapter.get_pipeline().add_timing_hook(
+        lambda stage, context, seconds: queries.append(context.get_query()) if stage == PipelineStage.ENCRYPT else None
+    )
+    request = create_quix_item(HostedQuixItem, 3)
+
+    assert adapter.send_hosted_quix_item_request(request).get_is_error() is False
+    assert queries == [RequestUtils.hosted_quix_query(request)]
+
+
+def test_unpicklable_serializers_run_in_process(preparer):
+    credentials = create_credentials()
+    route = RequestRoute(Endpoints.H2H_ENDPOINT_PROD, Endpoints.H2H_ENDPOINT_STG,
+                         lambda request, request_credentials: RequestUtils.serialize_query(request, request_credentials),
+                         RequestUtils.to_payment_response)
+    with GatewayEmulator(credentials) as emulator:
+        pipeline = RequestPipeline(NetworkAdapter())
+        emulator.install(pipeline)
+        preparer.install(pipeline)
+        in_process = preparer.get_in_process_count()
+
+        response = pipeline.execute(RequestContext(create_h2h_redirection(), credentials, route))
+
+        assert response.get_notification().get_transaction_result() == TransactionResult.SUCCESS
+        assert preparer.get_in_process_count() == in_process + 1
+        ProcessPoolPreparer.uninstall(pipeline)
+        pipeline.execute(RequestContext(create_h2h_redirection(), credentials, route))
+        assert preparer.get_in_process_count() == in_process + 1
+
+
+def exit_worker(request, credentials):
+    os._exit(1)
+
+
+def test_expired_deadline_is_answered_without_sending(preparer):
+    network_adapter = StubNetworkAdapter()
+    adapter = H2HPaymentAdapter(create_credentials(), network_adapter)
+    preparer.install(adapter.get_pipeline())
+    send_request = network_adapter.send_request
+    sent = []
+    network_adapter.send_request = lambda **kwargs: (sent.append(kwargs), send_request(**kwargs))[1]
+    offloaded = preparer.get_offloaded_count()
+
+    response = adapter.send_h2h_payment_request(create_h2h_redirection(), Deadline(0))
+
+    assert response.get_error() == Error.DEADLINE_EXCEEDED
+    assert sent == []
+    assert preparer.get_offloaded_count() == offloaded
+    assert adapter.send_h2h_payment_request(create_h2h_redirection(), Deadline(30)).get_is_error() is False
+    assert len(sent) == 1
+
+
+def test_broken_pool_is_reported_and_replaced():
+    credentials = create_credentials()
+    route = RequestRoute(Endpoints.H2H_ENDPOINT_PROD, Endpoints.H2H_ENDPOINT_STG, exit_worker,
+                         RequestUtils.to_payment_response)
+    with ProcessPoolPreparer(1, timeout=30) as preparer:
+        pipeline = RequestPipeline(StubNetworkAdapter())
+        preparer.install(pipeline)
+
+        response = pipeline.execute(RequestContext(create_h2h_redirection(), credentials, route))
+
+        assert response.get_error() == Error.NETWORK_ERROR
+        assert response.get_error_message().startswith("BrokenProcessPool")
+        adapter = H2HPaymentAdapter(credentials, StubNetworkAdapter())
+        preparer.install(adapter.get_pipeline())
+        assert adapter.send_h2h_payment_request(create_h2h_redirection()).get_is_error() is False
+
+
+def test_requests_after_shutdown_are_prepared_in_process():
+    preparer = ProcessPoolPreparer(1)
+    adapter = H2HPaymentAdapter(create_credentials(), StubNetworkAdapter())
+    async_adapter = AsyncH2HPaymentAdapter(create_credentials(), AsyncReplayNetworkAdapter(Cassette()))
+    preparer.install(adapter.get_pipeline())
+    preparer.install(async_adapter.get_pipeline(), asynchronous=True)
+    preparer.shutdown()
+
+    assert adapter.send_h2h_payment_request(create_h2h_redirection()).get_is_error() is False
+    # The empty cassette answers NETWORK_ERROR once the request was prepared and sent.
+    response = asyncio.run(async_adapter.send_h2h_payment_request(create_h2h_redirection()))
+    assert response.get_error_message().startswith("No recorded response")
+    assert preparer.get_in_process_count() == 2
+    assert preparer.get_offloaded_count() == 0
+
+
+def test_async_deadline_and_timeout_validation(preparer):
+    adapter = AsyncH2HPaymentAdapter(create_credentials(), AsyncReplayNetworkAdapter(Cassette()))
+    preparer.install(adapter.get_pipeline(), asynchronous=True)
+
+    response = asyncio.run(adapter.send_h2h_payment_request(create_h2h_redirection(), Deadline(0)))
+
+    assert response.get_error() == Error.DEADLINE_EXCEEDED
+    assert response.get_error_message() == "Deadline exceeded while preparing the request"
+    with pytest.raises(InvalidFieldException):
+        ProcessPoolPreparer(1, timeout=0)
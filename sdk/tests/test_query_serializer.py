@@ -0,0 +1,88 @@
+from sdk.enums.challenge_ind import ChallengeInd
+from sdk.enums.country_code import CountryCodeAlpha2
+from sdk.enums.currency import Currency
+from sdk.enums.payment_recurring_type import PaymentRecurringType
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.models.credentials import Credentials
+from sdk.models.requests.h2h.h2h_payment_recurrent_initial import H2HPaymentRecurrentInitial
+from sdk.models.requests.h2h.h2h_redirection import H2HRedirection
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.requests.hosted.hosted_payment_recurrent_initial import HostedPaymentRecurrentInitial
+from sdk.utils.general_utils import GeneralUtils
+from sdk.utils.query_serializer import QuerySerializer
+
+
+def create_credentials():
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_product_id("1168190001")
+    return credentials
+
+
+def test_serializer_matches_reflection_for_h2h_redirection():
+    h2h_redirection = H2HRedirection()
+    h2h_redirection.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_redirection.set_amount("50.4321222")
+    h2h_redirection.set_merchant_params([("name", "pablo"), ("surname", "ferrer")])
+    h2h_redirection.set_currency(Currency.EUR)
+    h2h_redirection.set_country(CountryCodeAlpha2.ES)
+    h2h_redirection.set_card_number("4907270002222227")
+    h2h_redirection.set_customer_id("903")
+    h2h_redirection.set_credentials(create_credentials())
+
+    assert QuerySerializer.generate_query(h2h_redirection) == GeneralUtils.generate_query(h2h_redirection)
+    assert "merchantParams=name:pablo;surname:ferrer" in QuerySerializer.generate_query(h2h_redirection)
+
+
+def test_serializer_matches_reflection_for_subclasses():
+    h2h_recurrent_initial = H2HPaymentRecurrentInitial()
+    h2h_recurrent_initial.set_challenge_ind(ChallengeInd.CI_04)
+    h2h_recurrent_initial.set_amount("10")
+    h2h_recurrent_initial.set_payment_recurring_type(PaymentRecurringType.newCof)
+    h2h_recurrent_initial.set_credentials(create_credentials())
+
+    hosted_recurrent_initial = HostedPaymentRecurrentInitial()
+    hosted_recurrent_initial.set_amount("10")
+    hosted_recurrent_initial.set_challenge_ind(ChallengeInd.CI_04)
+    hosted_recurrent_initial.set_credentials(create_credentials())
+
+    for request in (h2h_recurrent_initial, hosted_recurrent_initial):
+        assert QuerySerializer.generate_query(request) == GeneralUtils.generate_query(request)
+
+
+def test_serializer_skips_unset_fields():
+    h2h_void = H2HVoid()
+    h2h_void.set_transaction_id("7817740")
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+
+    assert QuerySerializer.generate_query(h2h_void) == "transactionId=7817740&paymentSolution=creditcards"
+
+
+def test_serializer_is_built_once_per_class():
+    assert QuerySerializer.for_class(H2HVoid) is QuerySerializer.for_class(H2HVoid)
+    assert QuerySerializer.for_class(H2HVoid) is not QuerySerializer.for_class(H2HRedirection)
+
+
+def test_serializer_matches_reflection_for_duplicate_keys():
+    class BaseRequest:
+        __amount: str = None
+
+        def set_base_amount(self, amount):
+            self.__amount = amount
+
+    class DuplicateRequest(BaseRequest):
+        __amount: str = None
+        __currency: str = None
+
+        def set_amount(self, amount):
+            self.__amount = amount
+
+        def set_currency(self, currency):
+            self.__currency = currency
+
+    request = DuplicateRequest()
+    request.set_currency("EUR")
+    request.set_base_amount("20")
+    request.set_amount("10")
+
+    assert QuerySerializer.generate_query(request) == GeneralUtils.generate_query(request)
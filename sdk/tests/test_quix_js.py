@@ -1,3 +1,4 @@
+import json
 import os
 from decimal import Decimal
 from typing import List
@@ -38,6 +39,7 @@ from sdk.models.requests.quix_js.js_quix_accommodation import JSQuixAccommodatio
 from sdk.models.requests.quix_js.js_quix_flight import JSQuixFlight
 from sdk.models.requests.quix_js.js_quix_item import JSQuixItem
 from sdk.models.requests.quix_js.js_quix_service import JSQuixService
+from sdk.utils.custom_encoder import CustomEncoder
 from sdk.utils.security_utils import SecurityUtils
 
 # Mock configurations
@@ -165,12 +167,19 @@ def test_send_quix_js_items_on_success(setup_credentials, mocker):
     # Capture the network call arguments
     mock_send_request.assert_called_once()
     call_args = mock_send_request.call_args
-    json = call_args[1]['json']
+    body = json.loads(call_args[1]['body'])
     url = call_args[1]['url']
     # Verify the network call arguments
-    assert json["merchantId"] == "111222"
+    assert body["merchantId"] == "111222"
     assert url == Endpoints.CHARGE_ENDPOINT_STG.value  # Change this to the correct endpoint
 
+    # The body is serialized once and matches the former dumps/loads round trip
+    legacy_body = json.loads(json.dumps(request, cls=CustomEncoder))
+    del legacy_body["prepayToken"]
+    legacy_body["paysolExtendedData"] = json.dumps(request.get_pay_sol_extended_data(), cls=CustomEncoder)
+    assert call_args[1]['body'] == json.dumps(legacy_body).encode('utf-8')
+    assert call_args[1]['headers']["Content-Type"] == "application/json"
+
 
 def test_send_quix_js_service_on_success(setup_credentials, mocker):
     mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request',
@@ -244,10 +253,10 @@ def test_send_quix_js_service_on_success(setup_credentials, mocker):
     # Capture the network call arguments
     mock_send_request.assert_called_once()
     call_args = mock_send_request.call_args
-    json = call_args[1]['json']
+    body = json.loads(call_args[1]['body'])
     url = call_args[1]['url']
     # Verify the network call arguments
-    assert json["merchantId"] == "111222"
+    assert body["merchantId"] == "111222"
     assert url == Endpoints.CHARGE_ENDPOINT_STG.value  # Change this to the correct endpoint
 
 
@@ -327,10 +336,10 @@ def test_send_quix_hosted_accommodation_on_success(setup_credentials, mocker):
     # Capture the network call arguments
     mock_send_request.assert_called_once()
     call_args = mock_send_request.call_args
-    json = call_args[1]['json']
+    body = json.loads(call_args[1]['body'])
     url = call_args[1]['url']
     # Verify the network call arguments
-    assert json["merchantId"] == "111222"
+    assert body["merchantId"] == "111222"
     assert url == Endpoints.CHARGE_ENDPOINT_STG.value  # Change this to the correct endpoint
 
 
@@ -421,10 +430,10 @@ def test_send_quix_hosted_flights_on_success(setup_credentials, mocker):
     # Capture the network call arguments
     mock_send_request.assert_called_once()
     call_args = mock_send_request.call_args
-    json = call_args[1]['json']
+    body = json.loads(call_args[1]['body'])
     url = call_args[1]['url']
     # Verify the network call arguments
-    assert json["merchantId"] == "111222"
+    assert body["merchantId"] == "111222"
     assert url == Endpoints.CHARGE_ENDPOINT_STG.value  # Change this to the correct endpoint
 
 
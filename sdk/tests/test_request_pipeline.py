@@ -0,0 +1,153 @@
+import asyncio
+import os
+
+import pytest
+
+from sdk.adapters.async_h2h_payment_adapter import AsyncH2HPaymentAdapter
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.adapters.request_pipeline import RequestPipeline
+from sdk.enums.endpoint_family import EndpointFamily
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.environment import Environment
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.enums.pipeline_stage import PipelineStage
+from sdk.exceptions.field_exception import MissingFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.request_route import RequestRoute
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.utils.request_routes import RequestRoutes
+
+
+@pytest.fixture
+def setup_credentials():
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id("1168190001")
+    credentials.set_api_version(5)
+    return credentials
+
+
+def read_xml_content(file_name):
+    current_file_directory = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(current_file_directory, 'notifications', file_name), 'r') as file:
+        return file.read()
+
+
+def create_h2h_void():
+    h2h_void = H2HVoid()
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_void.set_transaction_id("7817740")
+    h2h_void.set_merchant_transaction_id("12345")
+    return h2h_void
+
+
+def test_every_stage_is_timed_in_order(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request',
+                                            return_value=(200, read_xml_content('h2h_response.xml')))
+    adapter = H2HPaymentAdapter(setup_credentials)
+    timings = []
+    adapter.get_pipeline().add_timing_hook(lambda stage, context, duration: timings.append((stage, context, duration)))
+
+    result = adapter.send_h2h_void_request(create_h2h_void())
+
+    assert result.get_is_error() is False
+    assert [stage for stage, _, _ in timings] == list(PipelineStage)
+    assert all(duration >= 0 for _, _, duration in timings)
+    context = timings[-1][1]
+    assert context.get_endpoint() == Endpoints.VOID_ENDPOINT_STG
+    assert context.get_result() is result
+    assert context.get_durations() == {stage: duration for stage, _, duration in timings}
+    assert mock_send_request.call_args[1]['url'] == Endpoints.VOID_ENDPOINT_STG.value
+    assert "encrypted" in mock_send_request.call_args[1]['query_parameters']
+
+
+def test_failed_stage_is_timed_and_raises(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request')
+    adapter = H2HPaymentAdapter(setup_credentials)
+    stages = []
+    adapter.get_pipeline().add_timing_hook(lambda stage, context, duration: stages.append(stage))
+    h2h_void = H2HVoid()
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_void.set_merchant_transaction_id("12345")
+
+    with pytest.raises(MissingFieldException):
+        adapter.send_h2h_void_request(h2h_void)
+
+    assert stages == [PipelineStage.CHECK_CREDENTIALS, PipelineStage.ENDPOINT, PipelineStage.SET_CREDENTIALS,
+                      PipelineStage.VALIDATE]
+    mock_send_request.assert_not_called()
+
+
+def test_middlewares_wrap_stages_and_can_skip_them(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request')
+    pipeline = RequestPipeline()
+    calls = []
+
+    def outer(stage, context, proceed):
+        calls.append(("outer", stage))
+        return proceed()
+
+    def cached_response(stage, context, proceed):
+        calls.append(("cache", stage))
+        context.set_response((200, read_xml_content('h2h_response.xml')))
+
+    pipeline.add_middleware(outer, [PipelineStage.SEND])
+    pipeline.add_middleware(cached_response, [PipelineStage.SEND])
+    # Both adapters share the pipeline and so its middlewares.
+    first = H2HPaymentAdapter(setup_credentials, pipeline=pipeline)
+    second = H2HPaymentAdapter(setup_credentials, pipeline=pipeline)
+
+    assert first.send_h2h_void_request(create_h2h_void()).get_is_error() is False
+    assert calls == [("outer", PipelineStage.SEND), ("cache", PipelineStage.SEND)]
+    mock_send_request.assert_not_called()
+
+    pipeline.remove_middleware(cached_response)
+    mock_send_request.return_value = (200, read_xml_content('h2h_response.xml'))
+    assert second.send_h2h_void_request(create_h2h_void()).get_is_error() is False
+    assert mock_send_request.call_count == 1
+
+
+def test_stage_can_be_replaced(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request',
+                                            return_value=(200, read_xml_content('h2h_response.xml')))
+    adapter = H2HPaymentAdapter(setup_credentials)
+    adapter.get_pipeline().set_stage(PipelineStage.ENDPOINT,
+                                     lambda context: context.set_endpoint(Endpoints.VOID_ENDPOINT_PROD))
+
+    adapter.send_h2h_void_request(create_h2h_void())
+    assert mock_send_request.call_args[1]['url'] == Endpoints.VOID_ENDPOINT_PROD.value
+
+    adapter.get_pipeline().set_stage(PipelineStage.ENDPOINT, None)
+    adapter.send_h2h_void_request(create_h2h_void())
+    assert mock_send_request.call_args[1]['url'] == Endpoints.VOID_ENDPOINT_STG.value
+
+
+def test_async_pipeline_awaits_send_middlewares(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(AsyncNetworkAdapter, 'send_request',
+                                            return_value=(200, read_xml_content('h2h_response.xml')))
+    adapter = AsyncH2HPaymentAdapter(setup_credentials)
+    seen = []
+
+    async def after_send(stage, context, proceed):
+        await proceed()
+        seen.append(context.get_response()[0])
+
+    adapter.get_pipeline().add_middleware(after_send, [PipelineStage.SEND])
+
+    result = asyncio.run(adapter.send_h2h_void_request(create_h2h_void()))
+
+    assert result.get_is_error() is False
+    assert seen == [200]
+    assert mock_send_request.call_count == 1
+
+
+def test_routes_use_the_same_endpoint_in_production_and_staging():
+    for route in vars(RequestRoutes).values():
+        if isinstance(route, RequestRoute):
+            assert EndpointFamily.get_by_endpoint(route.get_endpoint(Environment.PRODUCTION)) == \
+                EndpointFamily.get_by_endpoint(route.get_endpoint(Environment.STAGING))
+    assert RequestRoutes.JS_CHARGE.get_endpoint(Environment.PRODUCTION) == Endpoints.CHARGE_ENDPOINT_PROD
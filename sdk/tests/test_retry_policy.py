@@ -0,0 +1,203 @@
+import asyncio
+import os
+
+import pytest
+
+from sdk.adapters.async_h2h_payment_adapter import AsyncH2HPaymentAdapter
+from sdk.adapters.async_network_adapter import AsyncNetworkAdapter
+from sdk.adapters.h2h_payment_adapter import H2HPaymentAdapter
+from sdk.adapters.network_adapter import NetworkAdapter
+from sdk.enums.country_code import CountryCodeAlpha2
+from sdk.enums.currency import Currency
+from sdk.enums.environment import Environment
+from sdk.enums.error import Error
+from sdk.enums.idempotency import Idempotency
+from sdk.enums.payment_solutions import PaymentSolutions
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.requests.h2h.h2h_payment_recurrent_successive import H2HPaymentRecurrentSuccessive
+from sdk.models.requests.h2h.h2h_redirection import H2HRedirection
+from sdk.models.requests.h2h.h2h_refund import H2HRefund
+from sdk.models.requests.h2h.h2h_void import H2HVoid
+from sdk.models.retry_policy import RetryPolicy
+
+
+@pytest.fixture
+def setup_credentials():
+    credentials = Credentials()
+    credentials.set_merchant_id("116819")
+    credentials.set_merchant_pass("a193a2de8ed6140e848d5015620e8129")
+    credentials.set_environment(Environment.STAGING)
+    credentials.set_product_id("1168190001")
+    credentials.set_api_version(5)
+    return credentials
+
+
+def read_xml_content(file_name):
+    current_file_directory = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(current_file_directory, 'notifications', file_name), 'r') as file:
+        return file.read()
+
+
+def create_h2h_void():
+    h2h_void = H2HVoid()
+    h2h_void.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_void.set_transaction_id("7817740")
+    h2h_void.set_merchant_transaction_id("12345")
+    return h2h_void
+
+
+def create_h2h_redirection():
+    h2h_redirection = H2HRedirection()
+    h2h_redirection.set_amount("50")
+    h2h_redirection.set_currency(Currency.EUR)
+    h2h_redirection.set_country(CountryCodeAlpha2.ES)
+    h2h_redirection.set_card_number("4907270002222227")
+    h2h_redirection.set_customer_id("903")
+    h2h_redirection.set_merchant_transaction_id("33312")
+    h2h_redirection.set_ch_name("First name Last name")
+    h2h_redirection.set_cvn_number("123")
+    h2h_redirection.set_exp_date("0625")
+    h2h_redirection.set_payment_solution(PaymentSolutions.creditcards)
+    h2h_redirection.set_status_url("https://test.com/status")
+    h2h_redirection.set_success_url("https://test.com/success")
+    h2h_redirection.set_error_url("https://test.com/fail")
+    h2h_redirection.set_awaiting_url("https://test.com/await")
+    h2h_redirection.set_cancel_url("https://test.com/cancel")
+    return h2h_redirection
+
+
+def test_void_is_retried_with_the_same_payload(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request', side_effect=[
+        (Error.NETWORK_ERROR, "connection reset"),
+        (503, ""),
+        (200, read_xml_content('h2h_response.xml'))
+    ])
+    adapter = H2HPaymentAdapter(setup_credentials, retry_policy=RetryPolicy(base_delay=0, max_delay=0))
+
+    result = adapter.send_h2h_void_request(create_h2h_void())
+
+    assert result.get_is_error() is False
+    assert mock_send_request.call_count == 3
+    first_call = mock_send_request.call_args_list[0][1]
+    for call in mock_send_request.call_args_list[1:]:
+        assert call[1] == first_call
+
+
+def test_debit_is_retried_only_when_it_was_not_sent(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request', side_effect=[
+        (Error.CONNECTION_ERROR, "connection refused"),
+        (Error.NETWORK_ERROR, "read timed out"),
+        (503, "")
+    ])
+    adapter = H2HPaymentAdapter(setup_credentials, retry_policy=RetryPolicy(base_delay=0, max_delay=0))
+
+    result = adapter.send_h2h_payment_request(create_h2h_redirection())
+
+    # The read timeout may have reached the gateway: the debit is not sent a third time.
+    assert result.get_error() == Error.NETWORK_ERROR
+    assert mock_send_request.call_count == 2
+    assert mock_send_request.call_args_list[0][1] == mock_send_request.call_args_list[1][1]
+
+
+def test_debit_is_retried_on_network_error_when_deduplication_is_trusted(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request', side_effect=[
+        (Error.NETWORK_ERROR, "read timed out"),
+        (503, "")
+    ])
+    retry_policy = RetryPolicy(base_delay=0, max_delay=0, trust_gateway_deduplication=True)
+
+    result = H2HPaymentAdapter(setup_credentials, retry_policy=retry_policy).send_h2h_payment_request(
+        create_h2h_redirection())
+
+    assert result.get_error() == Error.SERVER_ERROR
+    assert mock_send_request.call_count == 2
+    assert retry_policy.get_trust_gateway_deduplication() is True
+
+
+def test_non_idempotent_request_is_not_retried(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request',
+                                            return_value=(Error.NETWORK_ERROR, "connection reset"))
+    retry_policy = RetryPolicy(base_delay=0, max_delay=0)
+    retry_policy.set_idempotency(H2HVoid, Idempotency.NON_IDEMPOTENT)
+
+    result = H2HPaymentAdapter(setup_credentials, retry_policy=retry_policy).send_h2h_void_request(create_h2h_void())
+
+    assert result.get_error() == Error.NETWORK_ERROR
+    assert mock_send_request.call_count == 1
+
+
+def test_retries_stop_at_max_attempts(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request', return_value=(502, ""))
+    adapter = H2HPaymentAdapter(setup_credentials, retry_policy=RetryPolicy(max_attempts=4, base_delay=0, max_delay=0))
+
+    result = adapter.send_h2h_void_request(create_h2h_void())
+
+    assert result.get_error() == Error.SERVER_ERROR
+    assert mock_send_request.call_count == 4
+
+
+def test_retries_stop_when_budget_is_exhausted(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request', return_value=(503, ""))
+    retry_policy = RetryPolicy(max_attempts=10, base_delay=0, max_delay=0, budget_ratio=0, max_budget=2)
+
+    H2HPaymentAdapter(setup_credentials, retry_policy=retry_policy).send_h2h_void_request(create_h2h_void())
+
+    assert mock_send_request.call_count == 3
+    assert retry_policy.get_budget() == 0
+
+
+def test_retries_stop_before_the_deadline(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request', return_value=(503, ""))
+    retry_policy = RetryPolicy(base_delay=10, max_delay=10)
+    mocker.patch('sdk.models.retry_policy.random.uniform', return_value=10)
+
+    H2HPaymentAdapter(setup_credentials, retry_policy=retry_policy).send_h2h_void_request(create_h2h_void(),
+                                                                                          Deadline(1))
+
+    assert mock_send_request.call_count == 1
+
+
+def test_client_errors_are_not_retried(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(NetworkAdapter, 'send_request', return_value=(400, ""))
+    adapter = H2HPaymentAdapter(setup_credentials, retry_policy=RetryPolicy(base_delay=0, max_delay=0))
+
+    result = adapter.send_h2h_void_request(create_h2h_void())
+
+    assert result.get_error() == Error.CLIENT_ERROR
+    assert mock_send_request.call_count == 1
+
+
+def test_default_idempotency_classification():
+    retry_policy = RetryPolicy()
+
+    assert retry_policy.get_idempotency(H2HVoid()) == Idempotency.IDEMPOTENT
+    assert retry_policy.get_idempotency(H2HRefund()) == Idempotency.IDEMPOTENT
+    assert retry_policy.get_idempotency(H2HRedirection()) == Idempotency.DEDUPLICATED
+    assert retry_policy.get_idempotency(H2HPaymentRecurrentSuccessive()) == Idempotency.DEDUPLICATED
+
+
+def test_backoff_is_capped_by_max_delay():
+    retry_policy = RetryPolicy(base_delay=1, max_delay=3)
+
+    for attempt in range(1, 10):
+        assert 0 <= retry_policy.get_backoff(attempt) <= 3
+
+
+def test_invalid_max_attempts_raises_exception():
+    with pytest.raises(InvalidFieldException):
+        RetryPolicy(max_attempts=0)
+
+
+def test_async_void_is_retried(setup_credentials, mocker):
+    mock_send_request = mocker.patch.object(AsyncNetworkAdapter, 'send_request', side_effect=[
+        (Error.NETWORK_ERROR, "connection reset"),
+        (200, read_xml_content('h2h_response.xml'))
+    ])
+    adapter = AsyncH2HPaymentAdapter(setup_credentials, retry_policy=RetryPolicy(base_delay=0, max_delay=0))
+
+    result = asyncio.run(adapter.send_h2h_void_request(create_h2h_void()))
+
+    assert result.get_is_error() is False
+    assert mock_send_request.call_count == 2
@@ -0,0 +1,140 @@
+import os
+import re
+
+import pytest
+
+from sdk.adapters.notification_adapter import parse_notification
+from sdk.enums.operation_types import OperationTypes
+from sdk.enums.transaction import TransactionResult
+from sdk.exceptions.field_exception import InvalidFieldException
+from sdk.models.transaction_tracker import TransactionTracker
+
+
+def create_notification(status, merchant_transaction_id="1001", transaction_id="7001", operation_type="DEBIT"):
+    merchant_transaction_id_element = (f"<merchantTransactionId>{merchant_transaction_id}</merchantTransactionId>"
+                                       if merchant_transaction_id is not None else "")
+    return parse_notification(
+        f"<response><status>SUCCESS</status><operations><operation>{merchant_transaction_id_element}"
+        f"<operationType>{operation_type}</operationType><status>{status}</status>"
+        f"<transactionId>{transaction_id}</transactionId></operation></operations></response>"
+    )
+
+
+def read_notification(file_name, operations=None, replacements=()):
+    # A sample notification of the gateway, cut to its first operations to rebuild the earlier notifications.
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'notifications', file_name), 'r',
+              encoding="utf-8") as file:
+        content = file.read()
+    if operations is not None:
+        content = re.sub(r'<operation sorted-order="(\d+)">.*?</operation>',
+                         lambda match: match.group(0) if int(match.group(1)) <= operations else "", content,
+                         flags=re.S)
+    for old, new in replacements:
+        content = content.replace(old, new)
+    return parse_notification(content)
+
+
+def test_out_of_order_notifications_do_not_regress():
+    tracker = TransactionTracker()
+
+    assert tracker.update(create_notification("REDIRECTED")).get_result() == TransactionResult.REDIRECTED
+    assert tracker.update(create_notification("SUCCESS")).get_result() == TransactionResult.SUCCESS
+    assert tracker.update(create_notification("PENDING")) is None
+    assert tracker.update(create_notification("SUCCESS")) is None
+
+    state = tracker.get_by_merchant_transaction_id("1001")
+    assert state.get_result() == TransactionResult.SUCCESS
+    assert state.is_final()
+    assert state.get_notifications() == 2
+    assert tracker.get_accepted() == 2
+    assert tracker.get_rejected() == 2
+
+
+def test_follow_up_operation_starts_new_phase():
+    tracker = TransactionTracker()
+    tracker.update(create_notification("SUCCESS"))
+
+    state = tracker.update(create_notification("SUCCESS", transaction_id="7002", operation_type="REFUND"))
+
+    assert state.get_operation_type() == OperationTypes.REFUND
+    assert state.get_result_for(OperationTypes.DEBIT) == TransactionResult.SUCCESS
+    assert state.get_transaction_ids() == ["7001", "7002"]
+    assert tracker.update(create_notification("PENDING")) is None
+    assert tracker.get_by_transaction_id("7001") is state
+    assert tracker.get_by_transaction_id("7002") is state
+
+
+def test_lookup_by_gateway_transaction_id():
+    tracker = TransactionTracker()
+    tracker.update(create_notification("PENDING"))
+
+    state = tracker.update(create_notification("ERROR", merchant_transaction_id=None))
+
+    assert state.get_merchant_transaction_id() == "1001"
+    assert state.get_result() == TransactionResult.ERROR
+    assert tracker.update(create_notification("ERROR", merchant_transaction_id=None, transaction_id="9")) is None
+    assert tracker.get_untracked() == 1
+
+
+def test_finalized_transactions_are_evicted(mocker):
+    clock = mocker.patch("sdk.models.transaction_tracker.time.monotonic", return_value=100.0)
+    tracker = TransactionTracker(final_ttl=10)
+    tracker.update(create_notification("SUCCESS"))
+    tracker.update(create_notification("REDIRECTED", merchant_transaction_id="1002", transaction_id="7002"))
+
+    clock.return_value = 111.0
+    tracker.evict_finalized()
+
+    assert tracker.get_by_merchant_transaction_id("1001") is None
+    assert tracker.get_by_transaction_id("7001") is None
+    assert tracker.get_by_merchant_transaction_id("1002") is not None
+    assert len(tracker) == 1
+
+
+def test_tracker_is_bounded():
+    tracker = TransactionTracker(max_transactions=2)
+    for merchant_transaction_id in ("1", "2", "3"):
+        tracker.update(create_notification("PENDING", merchant_transaction_id, "7" + merchant_transaction_id))
+
+    assert len(tracker) == 2
+    assert tracker.get_by_merchant_transaction_id("1") is None
+    assert tracker.get_by_transaction_id("71") is None
+
+
+def test_tracker_validation():
+    with pytest.raises(InvalidFieldException):
+        TransactionTracker(max_transactions=0)
+    with pytest.raises(InvalidFieldException):
+        TransactionTracker(final_ttl=-1)
+
+
+def test_authentication_operations_do_not_finalize_the_payment():
+    tracker = TransactionTracker()
+
+    tra = tracker.update(read_notification("4907271141151707.xml", operations=1))
+    assert tra.get_result() is None
+    assert not tra.is_final()
+    redirected = tracker.update(read_notification("4907271141151707.xml", operations=2,
+                                                  replacements=(("SUCCESS3DS", "REDIRECTED"),)))
+    assert redirected.get_result() == TransactionResult.REDIRECTED
+    declined = tracker.update(read_notification("4907271141151707.xml"))
+
+    assert declined.get_result() == TransactionResult.ERROR
+    assert declined.is_final()
+    assert tracker.get_rejected() == 0
+    # The cumulative notifications of the earlier steps are late now.
+    assert tracker.update(read_notification("4907271141151707.xml", operations=1)) is None
+    assert tracker.update(read_notification("4907271141151707.xml", operations=2)) is None
+    assert tracker.get_by_merchant_transaction_id("756974").get_result() == TransactionResult.ERROR
+
+
+def test_corpus_notifications_end_on_the_payment_operation():
+    tracker = TransactionTracker()
+
+    redirected = tracker.update(read_notification("h2h_response.xml"))
+    assert redirected.get_result() == TransactionResult.REDIRECTED
+    assert not redirected.is_final()
+    assert tracker.update(read_notification("4907270002222227.xml", operations=2)).get_result() is None
+    paid = tracker.update(read_notification("4907270002222227.xml"))
+    assert paid.get_result() == TransactionResult.SUCCESS
+    assert paid.is_final()
@@ -0,0 +1,59 @@
+import binascii
+import hashlib
+import threading
+from typing import Tuple
+
+from Crypto.Cipher import AES
+
+from sdk.exceptions.field_exception import InvalidFieldException
+
+
+class CryptoContext:
+    # Payloads up to this size are padded and encrypted in a per-thread buffer that is reused between calls.
+    MAX_REUSABLE_BUFFER_SIZE: int = 1024 * 1024
+
+    __buffers = threading.local()
+
+    def __init__(self, key):
+        key_bytes = key.encode('utf-8') if isinstance(key, str) else bytes(key)
+        if len(key_bytes) not in AES.key_size:
+            raise InvalidFieldException("merchantPass: Invalid Size, size must be 16, 24 or 32 bytes")
+        self.__key = key_bytes
+
+    def get_key(self) -> bytes:
+        return self.__key
+
+    def encrypt_and_sign(self, iv: bytes, payload: memoryview) -> Tuple[bytearray, bytes]:
+        buffer = bytearray(CryptoContext.__padded_size(len(payload)))
+        digest = hashlib.sha256(payload).digest()
+        self.__encrypt_into(iv, payload, memoryview(buffer))
+        return buffer, digest
+
+    def encrypt_and_encode(self, iv: bytes, payload: bytes) -> Tuple[str, str]:
+        # Returns the base64 ciphertext and the lowercase hex SHA-256 of the payload.
+        padded_size = CryptoContext.__padded_size(len(payload))
+        signature = hashlib.sha256(payload).hexdigest()
+        if padded_size > CryptoContext.MAX_REUSABLE_BUFFER_SIZE:
+            buffer = bytearray(padded_size)
+        else:
+            buffer = getattr(CryptoContext.__buffers, "buffer", None)
+            if buffer is None or len(buffer) < padded_size:
+                buffer = bytearray(max(padded_size, 4096))
+                CryptoContext.__buffers.buffer = buffer
+
+        with memoryview(buffer)[:padded_size] as view:
+            self.__encrypt_into(iv, payload, view)
+            encrypted = binascii.b2a_base64(view, newline=False).decode('ascii')
+        return encrypted, signature
+
+    def __encrypt_into(self, iv: bytes, payload, view: memoryview):
+        # PKCS#7 padding is written straight after the payload and the block is encrypted in place.
+        payload_size = len(payload)
+        padding_size = len(view) - payload_size
+        view[:payload_size] = payload
+        view[payload_size:] = bytes((padding_size,)) * padding_size
+        AES.new(self.__key, AES.MODE_CBC, iv).encrypt(view, output=view)
+
+    @staticmethod
+    def __padded_size(payload_size: int) -> int:
+        return payload_size + AES.block_size - payload_size % AES.block_size
@@ -177,3 +177,8 @@ class GeneralUtils:
     def encode_url(http_query, use_safe=True):
         encoded_query = urllib.parse.quote(http_query, safe='=&;:' if use_safe else '')
         return encoded_query
+
+    @staticmethod
+    def encode_url_bytes(http_query: str) -> bytes:
+        # Percent-encoded output is plain ASCII, so it can be handed to the cipher without a utf-8 pass.
+        return urllib.parse.quote_from_bytes(http_query.encode('utf-8'), safe='=&;:').encode('ascii')
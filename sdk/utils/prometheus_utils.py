@@ -0,0 +1,29 @@
+import math
+from typing import Tuple
+
+
+class PrometheusUtils:
+
+    @staticmethod
+    def format_labels(label_names: Tuple[str, ...], label_values: Tuple, extra: str = None) -> str:
+        labels = [f'{name}="{PrometheusUtils.escape_label_value(str(value))}"'
+                  for name, value in zip(label_names, label_values)]
+        if extra is not None:
+            labels.append(extra)
+        return "{" + ",".join(labels) + "}" if labels else ""
+
+    @staticmethod
+    def format_value(value: float) -> str:
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if math.isnan(value):
+            return "NaN"
+        return repr(float(value))
+
+    @staticmethod
+    def escape_label_value(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    @staticmethod
+    def escape_help(help_text: str) -> str:
+        return help_text.replace("\\", "\\\\").replace("\n", "\\n")
@@ -0,0 +1,121 @@
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+from sdk.utils.general_utils import GeneralUtils
+
+
+class QuerySerializer:
+    __PLAIN: int = 0
+    __SKIPPED: int = 1
+    __MERCHANT_PARAMS: int = 2
+
+    __serializers: Dict[type, 'QuerySerializer'] = {}
+
+    def __init__(self, request_class: type):
+        # Same prefixes as GeneralUtils.get_clean_class_attributes: the class itself, then its direct bases.
+        self.__prefixes: List[Tuple[str, str]] = [
+            (f"_{clazz.__name__}__", f"{clazz.__name__}__")
+            for clazz in (request_class,) + request_class.__bases__ if clazz is not object
+        ]
+        # Attribute name -> (prefix rank, "key=", kind), or None when the attribute is not serialized.
+        self.__fields: Dict[str, Optional[Tuple[int, str, int]]] = {}
+        self.__keys: Dict[str, str] = {}
+        self.__has_duplicate_keys = False
+        for clazz in reversed(request_class.__mro__):
+            for name in vars(clazz):
+                self.__compile_field(name)
+
+    @staticmethod
+    def for_class(request_class: type) -> 'QuerySerializer':
+        serializer = QuerySerializer.__serializers.get(request_class)
+        if serializer is None:
+            serializer = QuerySerializer(request_class)
+            QuerySerializer.__serializers[request_class] = serializer
+        return serializer
+
+    @staticmethod
+    def generate_query(request) -> str:
+        return QuerySerializer.for_class(type(request)).serialize(request)
+
+    def serialize(self, request) -> str:
+        attributes = vars(request)
+        if self.__has_duplicate_keys:
+            return self.__serialize_with_duplicate_keys(attributes)
+
+        fields = self.__fields
+        plain = QuerySerializer.__PLAIN
+        single_rank = len(self.__prefixes) == 1
+        queries: List[List[str]] = [[] for _ in self.__prefixes]
+        query = queries[0]
+        for name, value in attributes.items():
+            field = fields.get(name, False)
+            if field is False:
+                field = self.__compile_field(name)
+            if field is None or value is None:
+                continue
+            if not single_rank:
+                query = queries[field[0]]
+            if field[2] == plain and value.__class__ is str:
+                query.append(field[1] + value)
+            else:
+                part = QuerySerializer.__to_query_part(field[1], field[2], value)
+                if part is not None:
+                    query.append(part)
+
+        if self.__has_duplicate_keys:
+            return self.__serialize_with_duplicate_keys(attributes)
+        return "&".join(query) if single_rank else "&".join(part for rank_query in queries for part in rank_query)
+
+    def __serialize_with_duplicate_keys(self, attributes) -> str:
+        # A key declared by both the class and a base keeps the position of the first and the value of the last.
+        cleaned_attributes = {}
+        for rank in range(len(self.__prefixes)):
+            for name, value in attributes.items():
+                field = self.__fields[name] if name in self.__fields else self.__compile_field(name)
+                if field is not None and field[0] == rank:
+                    cleaned_attributes[field[1]] = (field[2], value)
+
+        query = []
+        for key, (kind, value) in cleaned_attributes.items():
+            if value is not None:
+                part = QuerySerializer.__to_query_part(key, kind, value)
+                if part is not None:
+                    query.append(part)
+        return "&".join(query)
+
+    @staticmethod
+    def __to_query_part(key: str, kind: int, value) -> Optional[str]:
+        if isinstance(value, Enum) and value.value is not None and len(value.value) > 0:
+            return key + str(value.value)
+        if kind == QuerySerializer.__SKIPPED:
+            return None
+        if kind == QuerySerializer.__MERCHANT_PARAMS:
+            return key + GeneralUtils.merchant_params_query(value)
+        return key + str(value)
+
+    def __compile_field(self, name: str) -> Optional[Tuple[int, str, int]]:
+        field = None
+        for rank, (prefix, unmangled_prefix) in enumerate(self.__prefixes):
+            if name.startswith(prefix):
+                clean_key = name[len(prefix):]
+            elif name.startswith(unmangled_prefix):
+                clean_key = name[len(unmangled_prefix):]
+            else:
+                continue
+            if clean_key:
+                field = (rank, f"{clean_key}=", QuerySerializer.__get_kind(clean_key))
+                break
+
+        self.__fields[name] = field
+        if field is not None:
+            if self.__keys.setdefault(field[1], name) != name:
+                self.__has_duplicate_keys = True
+        return field
+
+    @staticmethod
+    def __get_kind(clean_key: str) -> int:
+        if clean_key == 'paySolExtendedData':
+            return QuerySerializer.__SKIPPED
+        if clean_key == 'merchantParams':
+            return QuerySerializer.__MERCHANT_PARAMS
+        return QuerySerializer.__PLAIN
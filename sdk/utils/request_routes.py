@@ -0,0 +1,46 @@
+from sdk.enums.endpoints import Endpoints
+from sdk.models.request_route import RequestRoute
+from sdk.utils.request_utils import RequestUtils
+
+
+class RequestRoutes:
+    H2H_PAYMENT = RequestRoute(
+        Endpoints.H2H_ENDPOINT_PROD, Endpoints.H2H_ENDPOINT_STG,
+        RequestUtils.serialize_query, RequestUtils.to_payment_response
+    )
+    CAPTURE = RequestRoute(
+        Endpoints.CAPTURE_ENDPOINT_PROD, Endpoints.CAPTURE_ENDPOINT_STG,
+        RequestUtils.serialize_query, RequestUtils.to_payment_response
+    )
+    VOID = RequestRoute(
+        Endpoints.VOID_ENDPOINT_PROD, Endpoints.VOID_ENDPOINT_STG,
+        RequestUtils.serialize_query, RequestUtils.to_payment_response
+    )
+    REFUND = RequestRoute(
+        Endpoints.REFUND_ENDPOINT_PROD, Endpoints.REFUND_ENDPOINT_STG,
+        RequestUtils.serialize_query, RequestUtils.to_payment_response
+    )
+    HOSTED = RequestRoute(
+        Endpoints.HOSTED_ENDPOINT_PROD, Endpoints.HOSTED_ENDPOINT_STG,
+        RequestUtils.serialize_query, RequestUtils.to_redirection_response
+    )
+    HOSTED_QUIX = RequestRoute(
+        Endpoints.HOSTED_ENDPOINT_PROD, Endpoints.HOSTED_ENDPOINT_STG,
+        RequestUtils.serialize_hosted_quix, RequestUtils.to_redirection_response
+    )
+    JS_AUTHORIZATION = RequestRoute(
+        Endpoints.AUTH_ENDPOINT_PROD, Endpoints.AUTH_ENDPOINT_STG,
+        RequestUtils.serialize_js_authorization, RequestUtils.to_js_authorization_response, encrypted=False
+    )
+    JS_CHARGE = RequestRoute(
+        Endpoints.CHARGE_ENDPOINT_PROD, Endpoints.CHARGE_ENDPOINT_STG,
+        RequestUtils.serialize_js_charge, RequestUtils.to_payment_response, encrypted=False
+    )
+    JS_QUIX = RequestRoute(
+        Endpoints.CHARGE_ENDPOINT_PROD, Endpoints.CHARGE_ENDPOINT_STG,
+        RequestUtils.serialize_js_quix, RequestUtils.to_payment_response, encrypted=False
+    )
+    JS_QUIX_ACCOMMODATION = RequestRoute(
+        Endpoints.CHARGE_ENDPOINT_PROD, Endpoints.CHARGE_ENDPOINT_STG,
+        RequestUtils.serialize_js_quix_accommodation, RequestUtils.to_payment_response, encrypted=False
+    )
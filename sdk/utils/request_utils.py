@@ -0,0 +1,194 @@
+import json
+from typing import Tuple, Optional
+
+from sdk.adapters.notification_adapter import parse_notification
+from sdk.enums.endpoints import Endpoints
+from sdk.enums.environment import Environment
+from sdk.enums.error import Error
+from sdk.enums.response_codes import ResponseCodes
+from sdk.exceptions.field_exception import MissingFieldException
+from sdk.models.credentials import Credentials
+from sdk.models.deadline import Deadline
+from sdk.models.responses.js_authorization_response import JSAuthorizationResponse
+from sdk.models.responses.payment_response import PaymentResponse
+from sdk.models.retry_policy import RetryPolicy
+from sdk.utils.custom_encoder import CustomEncoder
+from sdk.utils.general_utils import GeneralUtils
+from sdk.utils.query_serializer import QuerySerializer
+from sdk.utils.security_utils import SecurityUtils
+
+
+class RequestUtils:
+    JSON_CONTENT_TYPE: str = "application/json"
+
+    __json_encoder = CustomEncoder(allow_nan=False)
+
+    @staticmethod
+    def get_endpoint(credentials: Credentials, production_endpoint: Endpoints, staging_endpoint: Endpoints) -> str:
+        return production_endpoint.value if credentials.get_environment() == Environment.PRODUCTION \
+            else staging_endpoint.value
+
+    @staticmethod
+    def validate_request(request, credentials: Credentials):
+        is_missing_cred = request.check_credentials(credentials)
+        if is_missing_cred[0]:
+            raise MissingFieldException(is_missing_cred[1], True)
+
+        request.set_credentials(credentials)
+
+        is_missing_field = request.is_missing_field()
+        if is_missing_field[0]:
+            raise MissingFieldException(is_missing_field[1], False)
+
+    @staticmethod
+    def encrypt_query(http_query: str, merchant_id: str, credentials: Credentials) -> Tuple[dict, dict]:
+        formatted_request = GeneralUtils.encode_url_bytes(http_query)
+        clear_iv = SecurityUtils.generate_iv()
+        encrypted_request, signature = credentials.get_crypto_context().encrypt_and_encode(clear_iv, formatted_request)
+        headers = {
+            "apiVersion": str(credentials.get_api_version()),
+            "encryptionMode": "CBC",
+            "iv": SecurityUtils.base64_encode(clear_iv)
+        }
+        query_parameters = {
+            "merchantId": str(merchant_id),
+            "encrypted": encrypted_request,
+            "integrityCheck": signature
+        }
+        return headers, query_parameters
+
+    @staticmethod
+    def send_request(network_adapter, retry_policy: RetryPolicy, request, deadline: Deadline = None,
+                     **kwargs) -> Tuple[any, Optional[str]]:
+        if retry_policy is None:
+            return network_adapter.send_request(deadline=deadline, **kwargs)
+        # The payload is built once, so every attempt carries the same merchantTransactionId.
+        return retry_policy.execute(
+            lambda: network_adapter.send_request(deadline=deadline, **kwargs), request, deadline
+        )
+
+    @staticmethod
+    async def async_send_request(network_adapter, retry_policy: RetryPolicy, request, deadline: Deadline = None,
+                                 **kwargs) -> Tuple[any, Optional[str]]:
+        if retry_policy is None:
+            return await network_adapter.send_request(deadline=deadline, **kwargs)
+        return await retry_policy.execute_async(
+            lambda: network_adapter.send_request(deadline=deadline, **kwargs), request, deadline
+        )
+
+    @staticmethod
+    def hosted_quix_query(hosted_quix_request) -> str:
+        http_query = QuerySerializer.generate_query(hosted_quix_request)
+        json_object = json.dumps(hosted_quix_request.get_pay_sol_extended_data(), cls=CustomEncoder)
+        return http_query + f"&paysolExtendedData={json_object}"
+
+    @staticmethod
+    def js_body(js_request) -> bytes:
+        body = js_request.to_dict()
+        if "merchantParams" in body:
+            body["merchantParams"] = GeneralUtils.merchant_params_query(js_request.get_merchant_params())
+        return RequestUtils.__json_encoder.encode(body).encode('utf-8')
+
+    @staticmethod
+    def js_quix_body(js_quix_request) -> bytes:
+        body = js_quix_request.to_dict()
+        body.pop("prepayToken", None)
+        body["paysolExtendedData"] = RequestUtils.__json_encoder.encode(js_quix_request.get_pay_sol_extended_data())
+        return RequestUtils.__json_encoder.encode(body).encode('utf-8')
+
+    @staticmethod
+    def encode_accommodation_dates(quix_accommodation_request):
+        for item in quix_accommodation_request.get_pay_sol_extended_data().get_cart().get_items():
+            article = item.get_article()
+            if ':' in article.get_checkin_date():
+                article.set_checkin_date(GeneralUtils.encode_url(article.get_checkin_date(), False))
+            if ':' in article.get_checkout_date():
+                article.set_checkout_date(GeneralUtils.encode_url(article.get_checkout_date(), False))
+
+    @staticmethod
+    def serialize_query(request, credentials: Credentials) -> Tuple[Optional[dict], str]:
+        return None, QuerySerializer.generate_query(request)
+
+    @staticmethod
+    def serialize_hosted_quix(hosted_quix_request, credentials: Credentials) -> Tuple[Optional[dict], str]:
+        return None, RequestUtils.hosted_quix_query(hosted_quix_request)
+
+    @staticmethod
+    def serialize_js_authorization(js_authorization_request, credentials: Credentials) -> Tuple[dict, bytes]:
+        return {"Content-Type": RequestUtils.JSON_CONTENT_TYPE}, RequestUtils.js_body(js_authorization_request)
+
+    @staticmethod
+    def serialize_js_charge(js_request, credentials: Credentials) -> Tuple[dict, bytes]:
+        headers = {
+            "prepayToken": js_request.get_prepay_token(),
+            "apiVersion": str(js_request.get_api_version()),
+            "Content-Type": RequestUtils.JSON_CONTENT_TYPE
+        }
+        return headers, RequestUtils.js_body(js_request)
+
+    @staticmethod
+    def serialize_js_quix(js_quix_request, credentials: Credentials) -> Tuple[dict, bytes]:
+        headers = {
+            "prepayToken": js_quix_request.get_prepay_token(),
+            "apiVersion": str(credentials.get_api_version()),
+            "Content-Type": RequestUtils.JSON_CONTENT_TYPE
+        }
+        return headers, RequestUtils.js_quix_body(js_quix_request)
+
+    @staticmethod
+    def serialize_js_quix_accommodation(js_quix_accommodation, credentials: Credentials) -> Tuple[dict, bytes]:
+        RequestUtils.encode_accommodation_dates(js_quix_accommodation)
+        return RequestUtils.serialize_js_quix(js_quix_accommodation, credentials)
+
+    @staticmethod
+    def get_error_message(response: Tuple[any, Optional[str]]) -> str:
+        return f"status code is {response[0]}" if response[1] is None or len(response[1]) else response[1]
+
+    @staticmethod
+    def get_http_error(status_code) -> Error:
+        return Error.CLIENT_ERROR if ResponseCodes.is_client_error(status_code) else Error.SERVER_ERROR
+
+    @staticmethod
+    def to_payment_response(response: Tuple[any, Optional[str]], is_redirection: bool = False) -> PaymentResponse:
+        result = PaymentResponse()
+        if isinstance(response[0], Error):
+            result.set_is_error(True)
+            result.set_error(response[0])
+            result.set_error_message(response[1])
+        elif ResponseCodes.is_success(response[0]):
+            result.set_is_error(False)
+            result.set_raw_response(response[1])
+            if is_redirection:
+                result.set_redirect_url(response[1])
+            else:
+                result.set_notification(parse_notification(response[1]))
+        else:
+            result.set_is_error(True)
+            if response[1] is not None:
+                result.set_raw_response(response[1])
+            result.set_error(RequestUtils.get_http_error(response[0]))
+            result.set_error_message(RequestUtils.get_error_message(response))
+
+        return result
+
+    @staticmethod
+    def to_redirection_response(response: Tuple[any, Optional[str]]) -> PaymentResponse:
+        return RequestUtils.to_payment_response(response, is_redirection=True)
+
+    @staticmethod
+    def to_js_authorization_response(response: Tuple[any, Optional[str]]) -> JSAuthorizationResponse:
+        result = JSAuthorizationResponse()
+        if isinstance(response[0], Error):
+            result.set_is_error(True)
+            result.set_error(response[0])
+            result.set_error_message(response[1])
+        elif ResponseCodes.is_success(response[0]):
+            result.set_is_error(False)
+            json_response = json.loads(response[1])
+            result.set_auth_token(json_response['authToken'])
+        else:
+            result.set_is_error(True)
+            result.set_error(RequestUtils.get_http_error(response[0]))
+            result.set_error_message(RequestUtils.get_error_message(response))
+
+        return result
@@ -1,4 +1,4 @@
-import base64
+import binascii
 import hashlib
 import os
 
@@ -14,8 +14,7 @@ class SecurityUtils:
 
     @staticmethod
     def base64_encode(byte_array):
-        encoded_bytes = base64.b64encode(byte_array)
-        return encoded_bytes.decode('utf-8')
+        return binascii.b2a_base64(byte_array, newline=False).decode('ascii')
 
     @staticmethod
     def cbc_encryption(data, key, iv, encrypt=True):
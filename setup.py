@@ -18,7 +18,9 @@ setup(
     description=DESCRIPTION,
     long_description=readme_description,
     long_description_content_type='text/markdown',
-    packages=find_packages(exclude=["sdk.tests", "sdk.tests.*", "sdk/tests", "sdk/tests/*"]),
+    packages=find_packages(exclude=["sdk.tests", "sdk.tests.*", "sdk/tests", "sdk/tests/*",
+                                    "sdk.benchmarks", "sdk.benchmarks.*", "sdk.emulator", "sdk.emulator.*",
+                                    "sdk.loadtest", "sdk.loadtest.*"]),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -42,4 +44,7 @@ setup(
         "typing-inspect==0.9.0",
         "typing_extensions==4.12.2"
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9.5"],
+    },
 )